@@ -0,0 +1,216 @@
+from __future__ import print_function
+import argparse
+import gc
+import json
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:  # Python < 3.4
+    tracemalloc = None
+
+import runtests  # noqa: configures Django settings
+
+from django import forms
+from django.template.loader import get_template
+from django.test import RequestFactory
+from thecut.forms import forms as mixins
+
+
+SIZES = [5, 50, 500]
+
+clock = getattr(time, 'perf_counter', time.time)  # Python < 3.3
+
+MIXINS = ['EmailTypeMixin', 'RequiredMixin', 'MaxLengthMixin',
+          'PlaceholderMixin', 'TimeClassMixin', 'DateClassMixin',
+          'DateTimeClassMixin', 'DateTimeTimezoneMixin', 'FormMixin',
+          'FusedFormMixin']
+
+
+def make_field(index):
+    choices = (('A', 'A'), ('B', 'B'))
+    field_factories = [
+        lambda: forms.CharField(),
+        lambda: forms.EmailField(),
+        lambda: forms.DateField(required=False),
+        lambda: forms.TimeField(),
+        lambda: forms.DateTimeField(),
+        lambda: forms.CharField(max_length=50, widget=forms.Textarea),
+        lambda: forms.ChoiceField(choices=choices, widget=forms.RadioSelect),
+        lambda: forms.CharField(widget=forms.HiddenInput, required=False),
+    ]
+    return field_factories[index % len(field_factories)]()
+
+
+def make_form_class(mixin_name, size):
+    """Create a form class with ``size`` fields of assorted types."""
+    attrs = dict(('field_{0}'.format(index), make_field(index))
+                 for index in range(size))
+    attrs['Meta'] = type(str('Meta'), (object,), {'placeholders': dict(
+        ('field_{0}'.format(index), 'Placeholder')
+        for index in range(0, size, 3))})
+    bases = (forms.Form,)
+    if mixin_name is not None:
+        bases = (getattr(mixins, mixin_name),) + bases
+    name = '{0}{1}Form'.format(mixin_name or 'Plain', size)
+    return type(str(name), bases, attrs)
+
+
+def render_template(form_class):
+    template = get_template('forms/_form.html')
+    request = RequestFactory().get('/')
+
+    def render():
+        return template.render({'form': form_class(), 'request': request,
+                                'csrf_token': 'token'})
+    return render
+
+
+def get_benchmarks():
+    """Return an ordered list of ``(name, callable)`` benchmarks."""
+    benchmarks = []
+    for size in SIZES:
+        for mixin_name in [None] + MIXINS:
+            form_class = make_form_class(mixin_name, size)
+            benchmarks.append((
+                'instantiate.{0}.{1}'.format(mixin_name or 'Form', size),
+                form_class))
+    for size in SIZES:
+        form_class = make_form_class('FormMixin', size)
+        benchmarks.append(('render.template.FormMixin.{0}'.format(size),
+                           render_template(form_class)))
+    return benchmarks
+
+
+def time_per_op(func, min_time, repeat):
+    """Return the best per-call time (in ns) over ``repeat`` runs of enough
+    calls to take at least ``min_time`` seconds."""
+    func()  # Warm up (e.g. per-class decoration, template loading)
+    number = 1
+    while True:
+        start = clock()
+        for _ in range(number):
+            func()
+        elapsed = clock() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = clock()
+        for _ in range(number):
+            func()
+        timings.append((clock() - start) / number)
+    return min(timings) * 1e9, number
+
+
+def allocations_per_op(func):
+    """Return the number of memory blocks and bytes allocated (and still
+    referenced by the call's result), and the peak traced memory (in bytes)
+    for a single call. The peak is ``None`` if it can't be measured (before
+    Python 3.9)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+            tracemalloc.reset_peak()
+            result = func()
+            peak = tracemalloc.get_traced_memory()[1]
+        else:
+            result = func()
+            peak = None
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    size = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    return blocks, size, peak
+
+
+def run(benchmarks, min_time, repeat, allocations):
+    results = {}
+    for name, func in benchmarks:
+        ns, number = time_per_op(func, min_time, repeat)
+        result = {'ns_per_op': ns, 'number': number}
+        if allocations and tracemalloc is not None:
+            blocks, size, peak = allocations_per_op(func)
+            result.update({'alloc_blocks': blocks, 'alloc_bytes': size})
+            if peak is not None:
+                result['peak_bytes'] = peak
+        results[name] = result
+        report(name, result)
+    return results
+
+
+def report(name, result):
+    line = '{0:<45} {1:>14.1f} us/op'.format(name, result['ns_per_op'] / 1e3)
+    if 'alloc_blocks' in result:
+        line += '  {0:>8} blocks'.format(result['alloc_blocks'])
+    if 'peak_bytes' in result:
+        line += '  {0:>10.1f} KiB peak'.format(result['peak_bytes'] / 1024.0)
+    print(line)
+
+
+def compare(results, baseline, tolerance):
+    """Print a comparison against a baseline, and return the names of any
+    benchmarks which are slower than the baseline by more than
+    ``tolerance`` (a fraction)."""
+    regressions = []
+    print('\nComparison against baseline (tolerance {0:.0%}):'.format(
+        tolerance))
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result['ns_per_op'] / baseline[name]['ns_per_op']
+        flag = ''
+        if ratio > 1 + tolerance:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print('{0:<45} {1:>7.2f}x{2}'.format(name, ratio, flag))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmark thecut-forms form construction and rendering.')
+    parser.add_argument('filter', nargs='*',
+                        help='Only run benchmarks whose names contain one of '
+                             'these strings.')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='Minimum time (in seconds) per timing run.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of timing runs per benchmark.')
+    parser.add_argument('--no-allocations', dest='allocations',
+                        action='store_false',
+                        help='Do not measure allocations (they are never '
+                             'measured before Python 3.4).')
+    parser.add_argument('--save', metavar='FILE',
+                        help='Save the results as a JSON baseline.')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='Compare the results against a JSON baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed slowdown against the baseline (as a '
+                             'fraction) before reporting a regression.')
+    args = parser.parse_args(argv)
+
+    benchmarks = [(name, func) for name, func in get_benchmarks()
+                  if not args.filter or any(f in name for f in args.filter)]
+    results = run(benchmarks, args.min_time, args.repeat, args.allocations)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,12 @@
 from __future__ import absolute_import, unicode_literals
 from django import forms
 from thecut.forms.forms import (DateClassMixin, DateTimeClassMixin,
-                                EmailTypeMixin, MaxLengthMixin,
+                                DateTimeTimezoneMixin, DecoratedFieldsMixin,
+                                EmailTypeMixin,
+                                FormMixin, FusedFormMixin, MaxLengthMixin,
                                 PlaceholderMixin, RequiredMixin,
                                 TimeClassMixin)
+from thecut.forms.utils import add_css_class
 
 
 class EmailTypeMixinForm(EmailTypeMixin, forms.Form):
@@ -75,3 +78,198 @@ class DateTimeClassMixinForm(DateTimeClassMixin, forms.Form):
     datetime_split = forms.DateTimeField(widget=forms.SplitDateTimeWidget)
 
     other = forms.CharField()
+
+
+class UndecoratedForm(forms.Form):
+
+    email = forms.EmailField()
+
+    date = forms.DateField()
+
+
+class DecoratedSubclassForm(FormMixin, UndecoratedForm):
+
+    class Meta(object):
+
+        placeholders = {
+            'email': 'you@example.com'
+        }
+
+
+class DynamicFieldBaseForm(forms.Form):
+
+    email = forms.EmailField()
+
+    def __init__(self, *args, **kwargs):
+        super(DynamicFieldBaseForm, self).__init__(*args, **kwargs)
+        self.fields['time'] = forms.TimeField()
+
+
+class DynamicFieldForm(FormMixin, DynamicFieldBaseForm):
+
+    pass
+
+
+class ModifyingBaseForm(forms.Form):
+
+    name = forms.CharField()
+
+    bio = forms.CharField(max_length=100)
+
+    def __init__(self, *args, **kwargs):
+        super(ModifyingBaseForm, self).__init__(*args, **kwargs)
+        self.fields['name'].required = False
+        self.fields['bio'].widget = forms.Textarea()
+
+
+class ModifyingForm(FormMixin, ModifyingBaseForm):
+
+    pass
+
+
+class MissingPlaceholderForm(PlaceholderMixin, forms.Form):
+
+    a = forms.CharField()
+
+    class Meta(object):
+
+        placeholders = {
+            'b': 'foobar'
+        }
+
+
+class FusedForm(FusedFormMixin, forms.Form):
+
+    email = forms.EmailField()
+
+    text = forms.CharField(max_length=50, required=False,
+                           widget=forms.Textarea)
+
+    time = forms.TimeField()
+
+    date = forms.DateField()
+
+    datetime = forms.DateTimeField(required=False)
+
+    radio = forms.ChoiceField(choices=(('A', 'A'), ('B', 'B')),
+                              widget=forms.RadioSelect)
+
+    class Meta(object):
+
+        placeholders = {
+            'email': 'you@example.com'
+        }
+
+
+class RenderingForm(FormMixin, forms.Form):
+
+    name = forms.CharField(help_text='Your <b>full</b> name.')
+
+    email = forms.EmailField(label='Email & address')
+
+    date = forms.DateField(required=False)
+
+    text = forms.CharField(max_length=50, widget=forms.Textarea)
+
+    choice = forms.ChoiceField(choices=(('A', 'A'), ('B', 'B')),
+                               widget=forms.RadioSelect)
+
+    hidden = forms.CharField(widget=forms.HiddenInput, required=False)
+
+    class Meta(object):
+
+        placeholders = {
+            'name': 'Jane "JD" Doe'
+        }
+
+    def clean(self):
+        raise forms.ValidationError('Something <went> wrong.')
+
+
+class MultipartRenderingForm(FormMixin, forms.Form):
+
+    upload = forms.FileField()
+
+
+class LazyDynamicFieldForm(DynamicFieldForm):
+
+    lazy_decoration = True
+
+
+class LazyFusedForm(FusedForm):
+
+    lazy_decoration = True
+
+
+class CopyOnWriteForm(FormMixin, forms.Form):
+
+    copy_on_write = True
+
+    name = forms.CharField()
+
+    choice = forms.ChoiceField(choices=[(str(i), str(i)) for i in range(100)])
+
+    split = forms.SplitDateTimeField()
+
+
+class FormSetRowForm(FormMixin, forms.Form):
+
+    name = forms.CharField()
+
+    date = forms.DateField(required=False)
+
+    hidden = forms.CharField(widget=forms.HiddenInput, required=False)
+
+
+class DecoratedClassMixin(DecoratedFieldsMixin):
+
+    @classmethod
+    def decorate_field(cls, name, field):
+        super(DecoratedClassMixin, cls).decorate_field(name, field)
+        add_css_class(field.widget, 'decorated')
+
+
+class DecoratedFormSetRowForm(DecoratedClassMixin, FormSetRowForm):
+
+    pass
+
+
+class DateTimeTimezoneForm(DateTimeTimezoneMixin, forms.Form):
+
+    start = forms.DateTimeField()
+
+    end = forms.DateTimeField(required=False)
+
+    name = forms.CharField(required=False)
+
+
+class ImportRowForm(FormMixin, forms.Form):
+
+    name = forms.CharField()
+
+    email = forms.EmailField()
+
+    date = forms.DateField(required=False)
+
+    text = forms.CharField(max_length=50, widget=forms.Textarea)
+
+    choice = forms.ChoiceField(choices=(('A', 'A'), ('B', 'B')),
+                               widget=forms.RadioSelect)
+
+
+class InheritedPlaceholderForm(PlaceholderMixinForm):
+
+    class Meta(object):
+
+        placeholders = {
+            'b': 'barfoo'
+        }
+
+
+class DynamicPlaceholderForm(DynamicFieldForm):
+
+    class Meta(object):
+
+        placeholders = {
+            'time': 'hh:mm'
+        }
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals
-
-try:
-    from .forms import FormMixin
-except ImportError:
-    pass
+from importlib import import_module
+import sys
 
 __title__ = 'thecut-forms'
 
@@ -19,3 +16,66 @@ __copyright__ = 'Copyright 2013-2018 Busara Perth Pty Ltd'
 __license__ = 'Apache 2.0'
 
 default_app_config = 'thecut.forms.apps.AppConfig'
+
+
+# Public names, and the submodule each is imported from when first accessed.
+# Importing the package itself imports nothing else (not even Django), so
+# reading __version__ (e.g. in setup.py) or loading the app config is cheap.
+_exports = {
+    'DateClassMixin': 'forms',
+    'DateTimeClassMixin': 'forms',
+    'DateTimeTimezoneMixin': 'forms',
+    'DecoratedFieldsMixin': 'forms',
+    'EmailTypeMixin': 'forms',
+    'FormMixin': 'forms',
+    'FusedFormMixin': 'forms',
+    'MaxLengthMixin': 'forms',
+    'PlaceholderMixin': 'forms',
+    'RequiredMixin': 'forms',
+    'TimeClassMixin': 'forms',
+    'FormSetMixin': 'formsets',
+    'formset_factory': 'formsets',
+    'iter_form': 'rendering',
+    'render_form': 'rendering',
+    'render_formset': 'rendering',
+    'add_css_class': 'utils',
+    'add_css_classes': 'utils',
+    'css_class_list': 'utils',
+    'has_css_class': 'utils',
+    'remove_css_class': 'utils',
+    'serialise_css_classes': 'utils',
+    'validate_many': 'validation',
+}
+
+_submodules = frozenset([
+    'apps', 'asynchronous', 'cache', 'fields', 'forms', 'formsets',
+    'fragments', 'i18n', 'instrumentation', 'jinja', 'models', 'renderers',
+    'rendering', 'rules', 'settings', 'utils', 'validation', 'warmup',
+    'widgets'])
+
+
+def __getattr__(name):
+    module_name = _exports.get(name)
+    if module_name is None:
+        if name in _submodules:
+            return import_module('{0}.{1}'.format(__name__, name))
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(
+            __name__, name))
+    value = getattr(import_module('{0}.{1}'.format(__name__, module_name)),
+                    name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
+
+
+if sys.version_info < (3, 7):  # No module __getattr__ (PEP 562)
+    try:
+        from django.core.exceptions import ImproperlyConfigured
+        from .forms import FormMixin  # noqa: F401
+    except ImportError:  # e.g. Django is not installed
+        pass
+    except ImproperlyConfigured:  # Django's settings are not configured
+        pass
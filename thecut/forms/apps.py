@@ -8,3 +8,12 @@ class AppConfig(apps.AppConfig):
     label = 'forms'
 
     name = 'thecut.forms'
+
+    def ready(self):
+        from thecut.forms.settings import settings
+        if settings.INSTRUMENTATION:
+            from thecut.forms import instrumentation
+            instrumentation.enable()
+        if settings.WARM_UP:
+            from thecut.forms import warmup
+            warmup.warm_up()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from concurrent.futures import ThreadPoolExecutor
+from django import forms
+from django.db import close_old_connections
+from django.utils import timezone, translation
+from thecut.forms import rendering
+from thecut.forms.settings import settings
+import asyncio
+import functools
+import inspect
+import threading
+
+try:
+    from asgiref.sync import SyncToAsync, sync_to_async
+except ImportError:  # Django < 3.0
+    sync_to_async = None
+else:
+    if 'executor' not in inspect.signature(SyncToAsync).parameters:
+        sync_to_async = None  # An executor can't be given
+
+
+# Asynchronous rendering for ASGI views (Python 3.6+). Rendering a large form
+# is CPU-bound, so it is done in a bounded thread pool rather than blocking
+# the event loop.
+
+
+_executor = None
+
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the thread pool used to render forms asynchronously.
+
+    :rtype: :py:class:`concurrent.futures.ThreadPoolExecutor`
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.ASYNC_RENDER_WORKERS)
+    return _executor
+
+
+def _should_offload(form, threshold):
+    if threshold is None:
+        threshold = settings.ASYNC_RENDER_THRESHOLD
+    if len(form.fields) >= threshold:
+        return True
+    # Rendering choices from a queryset queries the database, which Django
+    # does not allow from an event loop.
+    return any(isinstance(field, forms.ModelChoiceField)
+               for field in form.fields.values())
+
+
+def _in_context(func):
+    # The active language and timezone are thread-local, so are re-activated
+    # in the thread pool.
+    language = translation.get_language()
+    tz = timezone.get_current_timezone()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with translation.override(language), timezone.override(tz):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _closing_connections(func):
+    # Database connections are per thread, and a thread in the pool isn't
+    # handling a request, so connections which are unusable or have exceeded
+    # CONN_MAX_AGE are closed (as at the start and end of a request).
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return wrapper
+
+
+async def _run_in_thread(executor, func):
+    func = _closing_connections(_in_context(func))
+    if sync_to_async is not None:
+        return await sync_to_async(func, thread_sensitive=False,
+                                   executor=executor)()
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, func)
+
+
+async def arender_form(form, threshold=None, executor=None, **options):
+    """Render a form, as per :py:func:`thecut.forms.rendering.render_form`,
+    without blocking the event loop. For example::
+
+        async def contact(request):
+            form = ContactForm()
+            html = await arender_form(form, request=request)
+            ...
+
+    Forms with at least ``threshold`` fields (or any fields with querysets
+    for choices) are rendered in a thread pool; smaller forms are rendered
+    inline, as handing them to a thread would cost more than rendering them.
+
+    :param form: The form to render.
+    :type form: :py:class:`~django.forms.Form`
+    :param threshold: The number of fields above which the form is rendered
+        in a thread (defaults to ``THECUT_FORMS_ASYNC_RENDER_THRESHOLD``).
+    :type threshold: :py:class:`int`
+    :param executor: The executor to render the form in (defaults to
+        :py:func:`get_executor`).
+    :type executor: :py:class:`concurrent.futures.Executor`
+    :param options: Keyword arguments for
+        :py:func:`~thecut.forms.rendering.render_form`.
+    :rtype: :py:class:`~django.utils.safestring.SafeText`
+    """
+    if not _should_offload(form, threshold):
+        return rendering.render_form(form, **options)
+    return await _run_in_thread(
+        executor or get_executor(),
+        functools.partial(rendering.render_form, form, **options))
+
+
+def aiter_form(form, threshold=None, executor=None, batch_size=10,
+               **options):
+    """Render a form in chunks, as per
+    :py:func:`thecut.forms.rendering.iter_form`, without blocking the event
+    loop. For example::
+
+        async def bulk_edit(request):
+            form = BulkEditForm()
+            return StreamingHttpResponse(aiter_form(form, request=request))
+
+    As per :py:func:`arender_form`, large forms are rendered in a thread
+    pool, ``batch_size`` chunks at a time.
+
+    :param batch_size: The number of chunks rendered in the thread pool at a
+        time.
+    :type batch_size: :py:class:`int`
+    :returns: An asynchronous iterator of
+        :py:class:`~django.utils.safestring.SafeText` chunks.
+    """
+    # Options are validated before iteration begins.
+    chunks = rendering.iter_form(form, **options)
+    if not _should_offload(form, threshold):
+        return _aiter_inline(chunks)
+    return _aiter_offloaded(chunks, executor or get_executor(), batch_size)
+
+
+async def _aiter_inline(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _aiter_offloaded(chunks, executor, batch_size):
+    def next_batch():
+        return [chunk for _, chunk in zip(range(batch_size), chunks)]
+
+    while True:
+        batch = await _run_in_thread(executor, next_batch)
+        for chunk in batch:
+            yield chunk
+        if len(batch) < batch_size:
+            break
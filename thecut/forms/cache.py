@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from collections import OrderedDict
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from thecut.forms.settings import settings
+import hashlib
+import threading
+
+
+def make_key(*parts):
+    """Return a fixed length cache key for the given parts.
+
+    :rtype: :py:class:`str`
+    """
+    return hashlib.md5(repr(parts).encode('utf-8')).hexdigest()
+
+
+class LRUCache(object):
+    """A thread-safe, in-process, least recently used cache.
+
+    :param max_size: The maximum number of items, or a callable which returns
+        it (e.g. to read a setting once Django's settings are configured).
+    """
+
+    def __init__(self, max_size=1000):
+        self._max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self):
+        max_size = self._max_size
+        return max_size() if callable(max_size) else max_size
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+            self._data[key] = value
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            max_size = self.max_size
+            while self._data and len(self._data) >= max_size:
+                self._data.popitem(last=False)
+            self._data[key] = value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class TieredCache(object):
+    """An in-process :py:class:`LRUCache` in front of a Django cache.
+
+    :param key_prefix: Prefix for keys stored in the Django cache.
+    :param alias: The Django cache to use (``None`` to only use the
+        in-process cache).
+    :param timeout: Timeout for values stored in the Django cache.
+    :param max_size: The maximum size of the in-process cache.
+    """
+
+    def __init__(self, key_prefix, alias=None, timeout=DEFAULT_TIMEOUT,
+                 max_size=1000):
+        self.key_prefix = key_prefix
+        self.alias = alias
+        self.timeout = timeout
+        self.local = LRUCache(max_size=max_size)
+
+    def _get_cache_key(self, key):
+        return '{0}:{1}'.format(self.key_prefix, key)
+
+    def get(self, key):
+        value = self.local.get(key)
+        if value is None and self.alias is not None:
+            value = caches[self.alias].get(self._get_cache_key(key))
+            if value is not None:
+                self.local.set(key, value)
+        return value
+
+    def set(self, key, value):
+        self.local.set(key, value)
+        if self.alias is not None:
+            caches[self.alias].set(self._get_cache_key(key), value,
+                                   timeout=self.timeout)
+
+    def clear(self):
+        """Clear the in-process cache (the Django cache is not cleared)."""
+        self.local.clear()
+
+
+_fragment_cache = None
+
+
+def get_fragment_cache():
+    """Return the default cache for rendered form fragments, as configured
+    by the ``THECUT_FORMS_FRAGMENT_CACHE_*`` settings.
+
+    :rtype: :py:class:`TieredCache`
+    """
+    global _fragment_cache
+    if _fragment_cache is None:
+        timeout = settings.FRAGMENT_CACHE_TIMEOUT
+        _fragment_cache = TieredCache(
+            'thecut.forms.fragment', alias=settings.FRAGMENT_CACHE_ALIAS,
+            timeout=DEFAULT_TIMEOUT if timeout is None else timeout,
+            max_size=settings.FRAGMENT_CACHE_SIZE)
+    return _fragment_cache
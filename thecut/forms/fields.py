@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+from django.core.cache import caches
+from django.utils.translation import get_language
+from thecut.forms.settings import settings
+from thecut.forms.cache import LRUCache
+import random
+
+try:
+    from django.core.exceptions import EmptyResultSet
+except ImportError:  # Django < 1.11
+    from django.db.models.sql.datastructures import EmptyResultSet
+
+try:
+    from thecut.forms.widgets import CachedSelect, CachedSelectMultiple
+except ImportError:  # Django < 1.11 (no form renderers)
+    CachedSelect, CachedSelectMultiple = forms.Select, forms.SelectMultiple
+
+
+#: Querysets' choices, keyed on the field's class, the queryset's SQL, the
+#: field's ``to_field_name`` and empty label, the active language and the
+#: model's choices version.
+choices_cache = LRUCache(max_size=lambda: settings.MODEL_CHOICES_CACHE_SIZE)
+
+_VERSION_KEY_PREFIX = 'thecut.forms.model_choices.version'
+
+
+def _get_model_label(model):
+    # As per Options.label_lower (Django 1.9+).
+    return '{0}.{1}'.format(model._meta.app_label, model._meta.model_name)
+
+
+def _get_version_key(label=None):
+    # The key of the version of a model's choices (or of all models' choices,
+    # if no label is given) in the Django cache.
+    if label is None:
+        return _VERSION_KEY_PREFIX
+    return '{0}:{1}'.format(_VERSION_KEY_PREFIX, label)
+
+
+def _new_version():
+    # Versions which are missing from the Django cache (e.g. evicted) start
+    # from a random number, so that they don't repeat earlier versions.
+    return random.randint(0, 2 ** 48)
+
+
+def _get_versions(label):
+    # The versions of all models' choices and of a model's choices.
+    cache = caches[settings.MODEL_CHOICES_VERSION_CACHE_ALIAS]
+    keys = [_get_version_key(), _get_version_key(label)]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _new_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return tuple(versions[key] for key in keys)
+
+
+def invalidate_model_choices(sender=None, **kwargs):
+    """Forget the cached choices for a model's querysets (or for all models,
+    if no model is given). The cached choices are not otherwise invalidated
+    when the model's instances change.
+
+    This can be connected directly to model signals, for example::
+
+        from django.db.models.signals import post_delete, post_save
+        from thecut.forms.fields import invalidate_model_choices
+
+        post_save.connect(invalidate_model_choices, sender=Country)
+        post_delete.connect(invalidate_model_choices, sender=Country)
+
+    Choices are cached in each process, but are versioned in the Django
+    cache set by ``THECUT_FORMS_MODEL_CHOICES_VERSION_CACHE_ALIAS`` (default:
+    ``'default'``), so this invalidates the choices cached by every process
+    which shares that cache.
+
+    :param sender: The model.
+    :type sender: :py:class:`~django.db.models.Model`
+    """
+    cache = caches[settings.MODEL_CHOICES_VERSION_CACHE_ALIAS]
+    if sender is None:
+        key = _get_version_key()
+        choices_cache.clear()
+    else:
+        key = _get_version_key(_get_model_label(sender))
+    try:
+        cache.incr(key)
+    except ValueError:  # Not in the cache
+        cache.set(key, _new_version(), timeout=None)
+
+
+class CachedModelChoiceIterator(forms.models.ModelChoiceIterator):
+    """A :py:class:`~django.forms.models.ModelChoiceIterator` which caches
+    the choices for each queryset, so that the database is only queried once
+    per queryset (until :py:func:`invalidate_model_choices` is called)."""
+
+    @property
+    def cache_key(self):
+        """A key for the queryset's choices.
+
+        :rtype: :py:class:`tuple`
+        """
+        queryset = self.queryset
+        label = _get_model_label(queryset.model)
+        try:
+            sql = '{0}'.format(queryset.query)
+        except EmptyResultSet:
+            sql = None
+        return (type(self.field), label, sql, self.field.to_field_name,
+                self.field.empty_label, get_language()) + _get_versions(label)
+
+    def _get_choices(self):
+        key = self.cache_key
+        choices = choices_cache.get(key)
+        if choices is None:
+            choices = tuple(super(CachedModelChoiceIterator, self).__iter__())
+            choices_cache.set(key, choices)
+        return choices
+
+    def __iter__(self):
+        return iter(self._get_choices())
+
+    def __len__(self):
+        return len(self._get_choices())
+
+    def __bool__(self):
+        return bool(self._get_choices())
+
+    __nonzero__ = __bool__  # Python 2
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """A :py:class:`~django.forms.ModelChoiceField` which caches its choices
+    (see :py:class:`CachedModelChoiceIterator`), and renders them with a
+    :py:class:`~thecut.forms.widgets.CachedSelect` widget (on Django 1.11 or
+    later)."""
+
+    iterator = CachedModelChoiceIterator
+
+    widget = CachedSelect
+
+
+class CachedModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+    """A :py:class:`~django.forms.ModelMultipleChoiceField` which caches its
+    choices (see :py:class:`CachedModelChoiceIterator`), and renders them
+    with a :py:class:`~thecut.forms.widgets.CachedSelectMultiple` widget (on
+    Django 1.11 or later)."""
+
+    iterator = CachedModelChoiceIterator
+
+    widget = CachedSelectMultiple
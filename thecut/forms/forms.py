@@ -1,24 +1,175 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals
 from django import forms
-from thecut.forms.utils import add_css_class
+from django.core.exceptions import ImproperlyConfigured
+from thecut.forms import instrumentation, rules
+from thecut.forms.utils import (get_placeholders, serialise_css_classes,
+                                share_field_state)
+import copy
+
+
+class DecoratedFieldsMixin(object):
+    """Base class for the field decorating mixins.
+
+    Rather than looping over :py:attr:`~django.forms.Form.fields` on every
+    instantiation, decorations are applied once per form class: the first
+    time a form class is instantiated, a copy of its ``base_fields`` is
+    passed through :py:meth:`decorate_field`. Each form instance then only
+    pays for Django's deep copy of the already decorated fields.
+
+    Fields which are not present in ``base_fields`` are decorated per
+    instance. If a parent form class (after the mixin in the MRO) defines
+    ``__init__``, which may add or modify fields (e.g. make a field optional,
+    or replace its widget), all fields are decorated per instance, after it
+    has run. If
+    :py:attr:`lazy_decoration` is ``True``, this is deferred until a field is
+    first accessed for rendering (e.g. ``form[name]``, iterating over the
+    form, or :py:meth:`~django.forms.Form.visible_fields`), so that forms
+    which are only validated skip it entirely. Note that accessing
+    :py:attr:`~django.forms.Form.fields` directly does not trigger this
+    decoration.
+
+    If :py:attr:`copy_on_write` is ``True``, the decorated widgets'
+    ``attrs`` (and any lists of choices) are shared between form instances
+    until they are modified (see
+    :py:class:`~thecut.forms.utils.CopyOnWriteDict` and
+    :py:class:`~thecut.forms.utils.SharedChoices`), rather than copied for
+    each instance. Lists of choices can then no longer be modified in place,
+    but can still be replaced.
+    """
+
+    #: Defer per-instance decoration until fields are accessed for
+    #: rendering.
+    lazy_decoration = False
+
+    #: Share widget attributes and choices between form instances.
+    copy_on_write = False
 
+    # Set on instances which are only used for validation (see
+    # thecut.forms.validation), which are never decorated.
+    _validation_only = False
 
-class EmailTypeMixin(object):
+    def __init__(self, *args, **kwargs):
+        started = instrumentation.enabled and instrumentation.clock()
+        self._prepare_base_fields()
+        elapsed = started and instrumentation.clock() - started
+        # Don't decorate fields accessed whilst the form is initialised.
+        self._fields_decorated = True
+        super(DecoratedFieldsMixin, self).__init__(*args, **kwargs)
+        self._fields_decorated = self._validation_only
+        started = started and instrumentation.clock()
+        if not self.lazy_decoration:
+            self._ensure_fields_decorated()
+        if started:
+            instrumentation.send_initialised(
+                self, DecoratedFieldsMixin,
+                elapsed + instrumentation.clock() - started)
+
+    def __getitem__(self, name):
+        # Iteration and visible_fields() / hidden_fields() also use this.
+        self._ensure_fields_decorated()
+        return super(DecoratedFieldsMixin, self).__getitem__(name)
+
+    def _ensure_fields_decorated(self):
+        if not self._fields_decorated:
+            self._fields_decorated = True
+            self._decorate_fields()
+            # e.g. the forms of a formset (Django 1.10+).
+            if not getattr(self, 'use_required_attribute', True):
+                self._remove_required_attributes()
+
+    def _remove_required_attributes(self):
+        # The fields are decorated once per class, so the required attribute
+        # is removed from this form's copies of the fields.
+        for field in self.fields.values():
+            if 'required' in field.widget.attrs:
+                del field.widget.attrs['required']
+
+    @classmethod
+    def _prepare_base_fields(cls):
+        base_fields = getattr(cls, 'base_fields', None)
+        if base_fields is None or cls._fields_modified_in_init():
+            return
+        version = cls._get_decoration_version()
+        state = cls.__dict__.get('_decoration_state')
+        if state is not None and state[0] is base_fields:
+            if state[2] == version:
+                return
+            # Decorations have changed, start again from the undecorated
+            # fields.
+            base_fields = state[1]
+        # Copy the fields first, as they may be shared with parent classes
+        # that do not use the same (or any) decorating mixins.
+        decorated_fields = copy.deepcopy(base_fields)
+        for name, field in decorated_fields.items():
+            cls._decorate_field(name, field)
+            if cls.copy_on_write:
+                share_field_state(field)
+            field._decorated_for = cls
+        cls.base_fields = decorated_fields
+        cls._decoration_state = (decorated_fields, base_fields, version)
+
+    @classmethod
+    def _fields_modified_in_init(cls):
+        # Whether a class which is initialised before the fields are
+        # decorated (e.g. a parent form) defines __init__, and so may modify
+        # the fields (e.g. make a field optional, or replace its widget). If
+        # so, fields are only decorated per instance, after it has run.
+        modified = cls.__dict__.get('_fields_modified_in_init_state')
+        if modified is None:
+            mro = cls.__mro__
+            modified = any(
+                '__init__' in vars(klass) for klass
+                in mro[mro.index(DecoratedFieldsMixin) + 1:]
+                if klass is not object and
+                not klass.__module__.startswith('django.') and
+                klass.__module__ != __name__)
+            cls._fields_modified_in_init_state = modified
+        return modified
+
+    @classmethod
+    def _get_decoration_version(cls):
+        # Form classes are re-decorated if this value changes.
+        return None
+
+    def _decorate_fields(self):
+        form_class = type(self)
+        for name, field in self.fields.items():
+            if getattr(field, '_decorated_for', None) is not form_class:
+                self._decorate_field(name, field)
+
+    @classmethod
+    def _decorate_field(cls, name, field):
+        cls.decorate_field(name, field)
+        # Rules may have modified the widget's CSS classes as a list.
+        serialise_css_classes(field.widget)
+
+    @classmethod
+    def decorate_field(cls, name, field):
+        """Decorate a field (and its widget) in place.
+
+        Mixins which override this method should call ``super()``.
+
+        :param name: The field's name on the form.
+        :type name: :py:class:`str`
+        :param field: The field to decorate.
+        :type field: :py:class:`~django.forms.Field`
+        """
+        pass
+
+
+class EmailTypeMixin(DecoratedFieldsMixin):
     """A mixin for a :py:class:`~django.forms.Form` that sets the HTML5
     ``email`` input type on any child :py:class:`~django.forms.EmailField`
     instances."""
 
-    def __init__(self, *args, **kwargs):
-        super(EmailTypeMixin, self).__init__(*args, **kwargs)
-
-        # Set HTML5 input type for email fields
-        for field in self.fields.values():
-            if isinstance(field, forms.EmailField):
-                field.widget.input_type = 'email'
+    @classmethod
+    def decorate_field(cls, name, field):
+        super(EmailTypeMixin, cls).decorate_field(name, field)
+        rules.email_type.decorate(cls, name, field)
 
 
-class RequiredMixin(object):
+class RequiredMixin(DecoratedFieldsMixin):
     """A mixin for a :py:class:`~django.forms.Form` that sets the HTML5
     ``required`` attribute on any child :py:class:`~django.forms.Field`
     instances that is required.
@@ -32,40 +183,27 @@ class RequiredMixin(object):
 
     required_css_class = 'required'
 
-    def __init__(self, *args, **kwargs):
-        super(RequiredMixin, self).__init__(*args, **kwargs)
-
-        # Set HTML5 required attributes. Note that if we set the required
-        # attribute on fields with certain widgets, it will cause the form to
-        # break by requiring EVERY option to be selected. This is not possible
-        # with the RadioSelect widget, and in most cases won't be the desired
-        # behaviour with the CheckboxSelectMultiple widget. If it is, the
-        # required attribute of the widget can still be set manually in the
-        # form.
-        for field in self.fields.values():
-            if field.required and not (
-                    isinstance(field.widget, forms.CheckboxSelectMultiple) or
-                    isinstance(field.widget, forms.RadioSelect)):
-                field.widget.attrs.update({'required': 'required'})
+    @classmethod
+    def decorate_field(cls, name, field):
+        super(RequiredMixin, cls).decorate_field(name, field)
+        rules.required.decorate(cls, name, field)
 
 
-class MaxLengthMixin(object):
+class MaxLengthMixin(DecoratedFieldsMixin):
     """A mixin for a :py:class:`~django.forms.Form` that sets the HTML5
     ``maxlength`` attribute on any child :py:class:`~django.forms.Field`
     instances using the :py:class:`~django.forms.Textarea` widget.
 
     A ``max_length`` must be specified on the :py:class:`~django.forms.Field`.
     """
-    def __init__(self, *args, **kwargs):
-        super(MaxLengthMixin, self).__init__(*args, **kwargs)
 
-        # HTML5 maxlength attribute for textarea
-        for field in self.fields.values():
-            if isinstance(field.widget, forms.Textarea) and field.max_length:
-                field.widget.attrs.update({'maxlength': field.max_length})
+    @classmethod
+    def decorate_field(cls, name, field):
+        super(MaxLengthMixin, cls).decorate_field(name, field)
+        rules.max_length.decorate(cls, name, field)
 
 
-class PlaceholderMixin(object):
+class PlaceholderMixin(DecoratedFieldsMixin):
     """A mixin for a :py:class:`~django.forms.Form` that allows you to easily set
     the HTML5 ``placeholder`` widget on a child
     :py:class:`~django.forms.Field`.
@@ -82,6 +220,13 @@ class PlaceholderMixin(object):
                 placeholders = {
                     'foo': 'Enter some text here.'
                 }
+
+    Placeholders defined by parent form classes are inherited. They are
+    resolved once per form class (see
+    :py:func:`~thecut.forms.utils.get_placeholders`), the first time it is
+    instantiated, and :py:exc:`~django.core.exceptions.ImproperlyConfigured`
+    is raised if a placeholder is defined for a field the form does not
+    have.
     """
 
     class Meta(object):
@@ -89,51 +234,65 @@ class PlaceholderMixin(object):
 
     def __init__(self, *args, **kwargs):
         super(PlaceholderMixin, self).__init__(*args, **kwargs)
-        for key, value in dict(getattr(self.Meta, 'placeholders', {})).items():
-            self.fields[key].widget.attrs.update({'placeholder': value})
-
-
-class TimeClassMixin(object):
+        started = instrumentation.enabled and instrumentation.clock()
+        # Only placeholders for fields which are not in base_fields (e.g.
+        # fields added in __init__) need to be checked per instance.
+        for key in self._placeholder_state[1]:
+            if key not in self.fields:
+                raise ImproperlyConfigured(
+                    '{0} defines a placeholder for a field which does not '
+                    'exist: {1}'.format(type(self).__name__, key))
+        if started:
+            instrumentation.send_initialised(
+                self, PlaceholderMixin, instrumentation.clock() - started)
+
+    @classmethod
+    def _prepare_base_fields(cls):
+        super(PlaceholderMixin, cls)._prepare_base_fields()
+        base_fields = getattr(cls, 'base_fields', None)
+        state = cls.__dict__.get('_placeholder_state')
+        if state is None or state[0] is not base_fields:
+            cls._placeholder_state = (base_fields, tuple(
+                key for key in get_placeholders(cls)
+                if base_fields is None or key not in base_fields))
+
+    @classmethod
+    def decorate_field(cls, name, field):
+        super(PlaceholderMixin, cls).decorate_field(name, field)
+        rules.placeholder.decorate(cls, name, field)
+
+
+class TimeClassMixin(DecoratedFieldsMixin):
     """A mixin for a :py:class:`~django.forms.Form` that adds a ``time`` CSS
     class on any child :py:class:`~django.forms.Field` instances using the
     :py:class:`~django.forms.TimeInput` widget.."""
 
-    def __init__(self, *args, **kwargs):
-        super(TimeClassMixin, self).__init__(*args, **kwargs)
+    @classmethod
+    def decorate_field(cls, name, field):
+        super(TimeClassMixin, cls).decorate_field(name, field)
+        rules.time_class.decorate(cls, name, field)
 
-        # HTML5 input types and attributes
-        for field in self.fields.values():
-            if isinstance(field.widget, forms.TimeInput):
-                add_css_class(field.widget, 'time')
 
-
-class DateClassMixin(object):
+class DateClassMixin(DecoratedFieldsMixin):
     """A mixin for a :py:class:`~django.forms.Form` that adds a ``date`` CSS
     class on any child :py:class:`~django.forms.Field` instances using the
     :py:class:`~django.forms.DateInput` widget.."""
 
-    def __init__(self, *args, **kwargs):
-        super(DateClassMixin, self).__init__(*args, **kwargs)
+    @classmethod
+    def decorate_field(cls, name, field):
+        super(DateClassMixin, cls).decorate_field(name, field)
+        rules.date_class.decorate(cls, name, field)
 
-        # HTML5 input types and attributes
-        for field in self.fields.values():
-            if isinstance(field.widget, forms.DateInput):
-                add_css_class(field.widget, 'date')
 
-
-class DateTimeClassMixin(object):
+class DateTimeClassMixin(DecoratedFieldsMixin):
     """A mixin for a :py:class:`~django.forms.Form` that adds a ``datetime`` CSS
     class on any child :py:class:`~django.forms.Field` instances using the
     :py:class:`~django.forms.DateTimeInput` widget.."""
 
-    def __init__(self, *args, **kwargs):
-        super(DateTimeClassMixin, self).__init__(*args, **kwargs)
-
-        # HTML5 input types and attributes
-        for field in self.fields.values():
-            if isinstance(field.widget, (forms.DateTimeInput,
-                                         forms.SplitDateTimeWidget)):
-                add_css_class(field.widget, 'datetime')
+    @classmethod
+    def decorate_field(cls, name, field):
+        super(DateTimeClassMixin, cls).decorate_field(name, field)
+        rules.datetime_class.decorate(cls, name, field)
 
 
 class DateTimeTimezoneMixin(object):
@@ -145,20 +304,74 @@ class DateTimeTimezoneMixin(object):
     any)).
     """
 
+    _validation_only = False
+
     def __init__(self, *args, **kwargs):
         super(DateTimeTimezoneMixin, self).__init__(*args, **kwargs)
-        self._set_timezone_help_texts(data=self.initial)
-
-    def _set_timezone_help_texts(self, data):
-        for field_name, field in self.fields.items():
+        started = instrumentation.enabled and instrumentation.clock()
+        if self._validation_only:
+            self._timezone_field_names = []
+        else:
+            self._timezone_field_names = self._get_timezone_field_names()
+        self._timezone_help_text_data = {}
+        self._set_timezone_help_texts(data=self.initial,
+                                      field_names=self._timezone_field_names)
+        if started:
+            instrumentation.send_initialised(
+                self, DateTimeTimezoneMixin, instrumentation.clock() - started)
+
+    @classmethod
+    def _get_class_timezone_field_names(cls):
+        base_fields = cls.base_fields
+        state = cls.__dict__.get('_timezone_field_names_state')
+        if state is None or state[0] is not base_fields:
+            state = (base_fields, tuple(
+                name for name, field in base_fields.items()
+                if isinstance(field.widget, forms.DateTimeInput)))
+            cls._timezone_field_names_state = state
+        return state[1]
+
+    def _get_timezone_field_names(self):
+        # The names of the class's fields are only determined once per form
+        # class. Only fields which were added to this form instance need to be
+        # checked.
+        base_fields = getattr(type(self), 'base_fields', None)
+        field_names = []
+        if base_fields is None:
+            other_names = list(self.fields)
+        else:
+            field_names = [
+                name for name in self._get_class_timezone_field_names()
+                if name in self.fields and
+                isinstance(self.fields[name].widget, forms.DateTimeInput)]
+            other_names = [name for name in self.fields
+                           if name not in base_fields]
+        field_names.extend(
+            name for name in other_names
+            if isinstance(self.fields[name].widget, forms.DateTimeInput))
+        return field_names
+
+    def _set_timezone_help_texts(self, data, field_names=None):
+        if field_names is None:
+            field_names = self._get_timezone_field_names()
+        previous_data = getattr(self, '_timezone_help_text_data', {})
+        for field_name in field_names:
             field_data = data.get(field_name)
-            if field_data and isinstance(field.widget, forms.DateTimeInput):
-                field.help_text = field_data.tzname()
+            if not field_data:
+                continue
+            # Only update the help text if the value's timezone has changed.
+            previous = previous_data.get(field_name)
+            if previous is not None and previous == field_data and \
+                    previous.tzinfo is field_data.tzinfo:
+                continue
+            self.fields[field_name].help_text = field_data.tzname()
+            previous_data[field_name] = field_data
 
     def clean(self, *args, **kwargs):
         cleaned_data = super(DateTimeTimezoneMixin, self).clean(*args,
                                                                 **kwargs)
-        self._set_timezone_help_texts(data=cleaned_data)
+        self._set_timezone_help_texts(data=cleaned_data,
+                                      field_names=self._timezone_field_names)
         return cleaned_data
 
 
@@ -174,3 +387,99 @@ class FormMixin(DateTimeClassMixin, DateClassMixin, EmailTypeMixin,
 
     error_css_class = 'error'
     label_suffix = ''
+
+
+class FusedFormMixin(DecoratedFieldsMixin):
+    """Form mixin which applies the rules registered in
+    :py:data:`thecut.forms.rules.registry`.
+
+    An alternative to :py:class:`FormMixin` which decorates each field with
+    every registered rule (including
+    :py:class:`~thecut.forms.rules.TimezoneHelpTextRule`) in a single pass,
+    rather than once per mixin. Custom decorations can be added by
+    registering a rule::
+
+        from thecut.forms import rules
+
+        class AutocompleteOffRule(rules.Rule):
+
+            def apply(self, form, name, field, data=None):
+                field.widget.attrs.update({'autocomplete': 'off'})
+
+        rules.register('autocomplete_off', AutocompleteOffRule())
+
+    To only apply some of the registered rules, set :py:attr:`rule_names`.
+    """
+
+    error_css_class = 'error'
+    label_suffix = ''
+    required_css_class = 'required'
+
+    #: Names of the registered rules to apply (defaults to all rules).
+    rule_names = None
+
+    @classmethod
+    def _get_decoration_version(cls):
+        return rules.registry.version
+
+    @classmethod
+    def _get_rules(cls, field, per_instance=False):
+        return cls._get_field_rules(field)[per_instance]
+
+    @classmethod
+    def _get_field_rules(cls, field):
+        # The (per-class, per-instance) rules for a field, cached per form
+        # class and field / widget class until the registry (or the form's
+        # rule names) change.
+        registry = rules.registry
+        state = cls.__dict__.get('_rules_state')
+        if state is None or state[0] != registry.version or \
+                state[1] != cls.rule_names:
+            state = cls._rules_state = (registry.version, cls.rule_names, {})
+        key = (type(field), type(field.widget))
+        try:
+            return state[2][key]
+        except KeyError:
+            pass
+        field_rules = (registry.rules_for(*key),
+                       registry.rules_for(*key, per_instance=True))
+        if cls.rule_names is not None:
+            allowed = [registry[name] for name in cls.rule_names]
+            field_rules = tuple(
+                tuple(rule for rule in matching if rule in allowed)
+                for matching in field_rules)
+        state[2][key] = field_rules
+        return field_rules
+
+    @classmethod
+    def decorate_field(cls, name, field):
+        super(FusedFormMixin, cls).decorate_field(name, field)
+        for rule in cls._get_rules(field):
+            rule.apply(cls, name, field)
+
+    def _decorate_fields(self):
+        form_class = type(self)
+        # With lazy decoration, the form may have been cleaned already.
+        data_sets = [self.initial] + getattr(self, '_deferred_rule_data', [])
+        for name, field in self.fields.items():
+            if getattr(field, '_decorated_for', None) is not form_class:
+                self._decorate_field(name, field)
+            # Most fields have no per-instance rules.
+            if self._get_field_rules(field)[1]:
+                for data in data_sets:
+                    self._apply_instance_rules(name, field, data=data)
+
+    def _apply_instance_rules(self, name, field, data):
+        for rule in self._get_rules(field, per_instance=True):
+            rule.apply(self, name, field, data=data)
+
+    def clean(self, *args, **kwargs):
+        cleaned_data = super(FusedFormMixin, self).clean(*args, **kwargs)
+        if self._validation_only:
+            pass
+        elif self._fields_decorated:
+            for name, field in self.fields.items():
+                self._apply_instance_rules(name, field, data=cleaned_data)
+        else:
+            self._deferred_rule_data = [cleaned_data]
+        return cleaned_data
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+
+
+class FormSetMixin(object):
+    """A mixin for a :py:class:`~django.forms.formsets.BaseFormSet` of forms
+    using :py:class:`~thecut.forms.forms.DecoratedFieldsMixin` (e.g.
+    :py:class:`~thecut.forms.forms.FormMixin`).
+
+    The form class's decorations are computed once, before any of the
+    formset's forms are constructed, and are shared by every form in the
+    formset. Fields which the formset adds to each form (e.g. ``ORDER`` and
+    ``DELETE``) are decorated in the same way as the form's own fields. As
+    Django's formsets construct their forms with
+    ``use_required_attribute=False``, the HTML5 ``required`` attribute is not
+    set on the forms' fields.
+    """
+
+    def __init__(self, *args, **kwargs):
+        prepare_base_fields = getattr(self.form, '_prepare_base_fields', None)
+        if prepare_base_fields is not None:
+            prepare_base_fields()
+        super(FormSetMixin, self).__init__(*args, **kwargs)
+
+    def add_fields(self, form, index):
+        existing = set(form.fields)
+        super(FormSetMixin, self).add_fields(form, index)
+        decorate_field = getattr(form, '_decorate_field', None)
+        if decorate_field is not None:
+            for name, field in form.fields.items():
+                if name not in existing:
+                    decorate_field(name, field)
+            if not getattr(form, 'use_required_attribute', True):
+                form._remove_required_attributes()
+
+
+def formset_factory(form, formset=forms.BaseFormSet, **kwargs):
+    """Return a formset class for the given form class, as per
+    :py:func:`django.forms.formset_factory`, using
+    :py:class:`FormSetMixin`."""
+    if not issubclass(formset, FormSetMixin):
+        formset = type(str(formset.__name__),
+                       (FormSetMixin, formset), {})
+    return forms.formset_factory(form, formset=formset, **kwargs)
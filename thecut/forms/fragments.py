@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+from django.utils.text import slugify
+from django.utils.translation import get_language
+from thecut.forms import i18n
+from thecut.forms.settings import settings
+from thecut.forms.cache import LRUCache
+
+
+# The static parts of the ``forms/_form_field.html`` template's markup for a
+# field, which only depend on the field's definition and the active language.
+
+
+#: Pre-escaped fragments, keyed on everything the fragments depend on.
+fragment_cache = LRUCache(max_size=lambda: settings.FIELD_FRAGMENT_CACHE_SIZE)
+
+
+class FieldFragments(object):
+    """Pre-escaped markup for the static parts of a field's rendering.
+
+    :ivar css_class: The ``<li>``'s ``class`` attribute: the slugified field
+        name, the field's CSS classes, and its ``type-`` class.
+    :ivar label_tag: The field's ``<label>`` tag.
+    :ivar help_text: The field's escaped help text.
+    :ivar raw_help_text: The field's unescaped help text.
+    """
+
+    __slots__ = ['name_class', 'css_classes', 'type_class', 'css_class',
+                 'label_tag', 'help_text', 'raw_help_text']
+
+    def __init__(self, name_class, css_classes, type_class, label_tag,
+                 help_text, raw_help_text):
+        self.name_class = name_class
+        self.css_classes = css_classes
+        self.type_class = type_class
+        self.css_class = mark_safe(''.join([
+            name_class, ' ' if css_classes else '',
+            conditional_escape(css_classes), type_class]))
+        self.label_tag = label_tag
+        self.help_text = help_text
+        self.raw_help_text = raw_help_text
+
+    def with_css_classes(self, css_classes):
+        """Return a copy of these fragments with different CSS classes (e.g.
+        including the error CSS class).
+
+        :rtype: :py:class:`FieldFragments`
+        """
+        return FieldFragments(self.name_class, css_classes, self.type_class,
+                              self.label_tag, self.help_text,
+                              self.raw_help_text)
+
+
+def _get_static_css_classes(field):
+    # As per BoundField.css_classes(), for a field without errors.
+    form = field.form
+    if field.field.required and hasattr(form, 'required_css_class'):
+        return form.required_css_class
+    return ''
+
+
+def get_field_fragments(field):
+    """Return the pre-escaped static markup for a bound field.
+
+    The fragments are computed once per form class, field definition and
+    language, so only the field's value and errors need rendering (and
+    escaping) per request.
+
+    :param field: The bound field.
+    :type field: :py:class:`~django.forms.BoundField`
+    :rtype: :py:class:`FieldFragments`
+    """
+    form = field.form
+    widget = field.field.widget
+    label = i18n.get_label(field)
+    help_text = i18n.get_help_text(field)
+    key = (type(form), field.name, field.auto_id, widget.attrs.get('id'),
+           type(widget), getattr(widget, 'input_type', None),
+           field.field.required, getattr(form, 'required_css_class', None),
+           form.label_suffix, field.field.label_suffix, label, help_text,
+           get_language())
+    fragments = fragment_cache.get(key)
+    if fragments is None:
+        input_type = key[5]
+        fragments = FieldFragments(
+            name_class=conditional_escape(slugify(field.name)),
+            css_classes=_get_static_css_classes(field),
+            type_class=mark_safe(' type-{0}'.format(
+                conditional_escape(input_type))) if input_type else '',
+            label_tag=field.label_tag(label),
+            help_text=conditional_escape(help_text),
+            raw_help_text=help_text)
+        fragment_cache.set(key, fragments)
+    if field.errors:
+        return fragments.with_css_classes(field.css_classes())
+    return fragments
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import Promise
+from django.utils.translation import get_language
+from thecut.forms.settings import settings
+from thecut.forms.cache import LRUCache
+
+
+#: Translated field labels and help texts, by form class, field name,
+#: attribute and language.
+translation_cache = LRUCache(max_size=lambda: settings.TRANSLATION_CACHE_SIZE)
+
+#: Incremented whenever the translations are reloaded, to invalidate other
+#: caches of translated text (e.g.
+#: :py:class:`~thecut.forms.utils.LanguageCachedText`).
+version = 0
+
+
+def clear_translation_cache():
+    """Forget all cached translations, e.g. after the translation catalogs
+    have been reloaded."""
+    global version
+    version += 1
+    translation_cache.clear()
+
+
+@receiver(setting_changed)
+def _setting_changed(setting, **kwargs):
+    if setting in ('LANGUAGES', 'LANGUAGE_CODE', 'LOCALE_PATHS'):
+        clear_translation_cache()
+
+
+try:
+    from django.utils.autoreload import file_changed
+except ImportError:  # Django < 2.2
+    pass
+else:
+    @receiver(file_changed)
+    def _file_changed(file_path, **kwargs):
+        # The development server reloads changed translation catalogs
+        # without restarting.
+        if '{0}'.format(file_path).endswith('.mo'):
+            clear_translation_cache()
+
+
+def translate(form_class, field_name, attribute, value):
+    """Return a field's (lazily translated) text in the active language.
+
+    Lazy translation strings are only translated once per form class, field,
+    attribute and language (until the translations are reloaded, see
+    :py:func:`clear_translation_cache`). Other values are returned as is.
+
+    :param form_class: The form class.
+    :type form_class: :py:class:`type`
+    :param field_name: The field's name.
+    :type field_name: :py:class:`str`
+    :param attribute: The name of the text, e.g. ``label``.
+    :type attribute: :py:class:`str`
+    :param value: The text.
+    """
+    if not isinstance(value, Promise):
+        return value
+    key = (form_class, field_name, attribute, get_language())
+    cached = translation_cache.get(key)
+    # The cached text is only used if it was translated from the same lazy
+    # string, as fields can be changed per form instance.
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    text = '{0}'.format(value)
+    translation_cache.set(key, (value, text))
+    return text
+
+
+def get_label(field):
+    """Return a bound field's label in the active language (see
+    :py:func:`translate`).
+
+    :param field: The bound field.
+    :type field: :py:class:`~django.forms.BoundField`
+    :rtype: :py:class:`str`
+    """
+    return translate(type(field.form), field.name, 'label', field.label)
+
+
+def get_help_text(field):
+    """Return a bound field's help text in the active language (see
+    :py:func:`translate`).
+
+    :param field: The bound field.
+    :type field: :py:class:`~django.forms.BoundField`
+    :rtype: :py:class:`str`
+    """
+    return translate(type(field.form), field.name, 'help_text',
+                     field.help_text)
+
+
+def label_tag(field):
+    """Return a bound field's ``<label>`` tag (as per
+    :py:meth:`~django.forms.BoundField.label_tag`), using its cached
+    translated label.
+
+    :param field: The bound field.
+    :type field: :py:class:`~django.forms.BoundField`
+    :rtype: :py:class:`~django.utils.safestring.SafeText`
+    """
+    return field.label_tag(get_label(field))
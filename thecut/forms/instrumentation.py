@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from collections import OrderedDict
+from django.dispatch import Signal
+import logging
+import threading
+import time
+
+
+# Optional instrumentation of form initialisation and rendering.
+#
+# Instrumentation is disabled by default, in which case the only overhead is
+# a check of the module's ``enabled`` attribute. Receivers (or one of the
+# sinks below) can be connected to the signals, and instrumentation enabled
+# with enable().
+
+
+#: Sent after a mixin has done its work in a form's ``__init__``. Provides
+#: the ``form``, the ``mixin`` class, the form's ``field_count`` and the
+#: ``elapsed_ns`` (excluding time spent in other classes' ``__init__``). The
+#: sender is the form's class. The decorating mixins are reported as a single
+#: :py:class:`~thecut.forms.forms.DecoratedFieldsMixin` event.
+form_initialised = Signal()
+
+#: Sent after a form has been rendered with the ``forms/_form.html``
+#: template (or :py:func:`thecut.forms.rendering.render_form`). Provides the
+#: ``form``, the ``template_name`` (``None`` for
+#: :py:func:`~thecut.forms.rendering.render_form`), the form's
+#: ``field_count`` and the ``elapsed_ns``. The sender is the form's class.
+form_rendered = Signal()
+
+#: Whether instrumentation signals are sent (set from the
+#: ``THECUT_FORMS_INSTRUMENTATION`` setting when the app is loaded).
+enabled = False
+
+
+try:
+    clock = time.perf_counter_ns
+except AttributeError:  # Python < 3.7
+    _clock = getattr(time, 'perf_counter', time.time)
+
+    def clock():
+        return int(_clock() * 1e9)
+
+
+def enable():
+    """Start sending instrumentation signals."""
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Stop sending instrumentation signals."""
+    global enabled
+    enabled = False
+
+
+def send_initialised(form, mixin, elapsed_ns):
+    form_initialised.send(sender=type(form), form=form, mixin=mixin,
+                          field_count=len(form.fields), elapsed_ns=elapsed_ns)
+
+
+def send_rendered(form, template_name, elapsed_ns):
+    form_rendered.send(sender=type(form), form=form,
+                       template_name=template_name,
+                       field_count=len(form.fields), elapsed_ns=elapsed_ns)
+
+
+def _label(cls):
+    return '{0}.{1}'.format(cls.__module__, cls.__name__)
+
+
+class Sink(object):
+    """Base class for receivers of the instrumentation signals.
+
+    Each signal is reported to :py:meth:`timing` with a dotted metric name:
+    ``<prefix>.init.<form class>.<mixin>`` for :py:data:`form_initialised`
+    and ``<prefix>.render.<form class>`` for :py:data:`form_rendered`.
+    """
+
+    #: Prefix for metric names.
+    prefix = 'thecut.forms'
+
+    def __init__(self, prefix=None):
+        if prefix is not None:
+            self.prefix = prefix
+
+    def connect(self):
+        """Connect to the instrumentation signals, and enable
+        instrumentation."""
+        form_initialised.connect(self._initialised, weak=False,
+                                 dispatch_uid=(id(self), 'initialised'))
+        form_rendered.connect(self._rendered, weak=False,
+                              dispatch_uid=(id(self), 'rendered'))
+        enable()
+
+    def disconnect(self):
+        """Disconnect from the instrumentation signals, disabling
+        instrumentation if nothing else is connected."""
+        form_initialised.disconnect(dispatch_uid=(id(self), 'initialised'))
+        form_rendered.disconnect(dispatch_uid=(id(self), 'rendered'))
+        if not (form_initialised.has_listeners() or
+                form_rendered.has_listeners()):
+            disable()
+
+    def _initialised(self, sender, mixin, field_count, elapsed_ns, **kwargs):
+        self.timing('{0}.init.{1}.{2}'.format(
+            self.prefix, _label(sender), mixin.__name__), elapsed_ns,
+            field_count)
+
+    def _rendered(self, sender, field_count, elapsed_ns, **kwargs):
+        self.timing('{0}.render.{1}'.format(self.prefix, _label(sender)),
+                    elapsed_ns, field_count)
+
+    def timing(self, name, elapsed_ns, field_count):
+        """Record a timing.
+
+        :param name: The metric name.
+        :type name: :py:class:`str`
+        :param elapsed_ns: The elapsed time (in nanoseconds).
+        :type elapsed_ns: :py:class:`int`
+        :param field_count: The number of fields on the form.
+        :type field_count: :py:class:`int`
+        """
+        raise NotImplementedError()
+
+
+class Histogram(object):
+    """Aggregates timings (in nanoseconds) into power-of-two buckets."""
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        value = int(value)
+        # Bucket by upper bound (the next power of two).
+        bound = 1 << max(value - 1, 0).bit_length()
+        self.buckets[bound] = self.buckets.get(bound, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.total / float(self.count) if self.count else None
+
+    def percentile(self, percent):
+        """Return the upper bound of the bucket containing the given
+        percentile (e.g. ``95``), or ``None`` if there are no values."""
+        if not self.count:
+            return None
+        threshold = self.count * percent / 100.0
+        seen = 0
+        for bound in sorted(self.buckets):
+            seen += self.buckets[bound]
+            if seen >= threshold:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self):
+        return {'count': self.count, 'total': self.total, 'min': self.min,
+                'max': self.max, 'mean': self.mean,
+                'p50': self.percentile(50), 'p95': self.percentile(95),
+                'p99': self.percentile(99)}
+
+
+class HistogramSink(Sink):
+    """Aggregates timings into a :py:class:`Histogram` per metric name.
+
+    For example::
+
+        from thecut.forms.instrumentation import HistogramSink
+
+        sink = HistogramSink()
+        sink.connect()
+        ...
+        for name, histogram in sink.histograms.items():
+            print(name, histogram.as_dict())
+
+    """
+
+    def __init__(self, prefix=None):
+        super(HistogramSink, self).__init__(prefix=prefix)
+        self.histograms = OrderedDict()
+        self._lock = threading.Lock()
+
+    def timing(self, name, elapsed_ns, field_count):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(elapsed_ns)
+
+    def snapshot(self):
+        """Return a ``dict`` of each metric's aggregated values."""
+        with self._lock:
+            return OrderedDict((name, histogram.as_dict())
+                               for name, histogram in self.histograms.items())
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+
+
+class LoggingSink(Sink):
+    """Logs each timing (in microseconds)."""
+
+    def __init__(self, prefix=None, logger=None, level=logging.DEBUG):
+        super(LoggingSink, self).__init__(prefix=prefix)
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def timing(self, name, elapsed_ns, field_count):
+        self.logger.log(self.level, '%s: %.1fus (%d fields)', name,
+                        elapsed_ns / 1e3, field_count)
+
+
+class StatsdSink(Sink):
+    """Sends each timing (in milliseconds) to a statsd-style client, i.e. an
+    object with a ``timing(name, milliseconds)`` method (such as
+    ``statsd.StatsClient``, or a stub)."""
+
+    def __init__(self, client, prefix=None):
+        super(StatsdSink, self).__init__(prefix=prefix)
+        self.client = client
+
+    def timing(self, name, elapsed_ns, field_count):
+        self.client.timing(name, elapsed_ns / 1e6)
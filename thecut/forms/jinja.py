@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.template.loader import render_to_string
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+from jinja2 import Environment
+from jinja2.ext import Extension
+from thecut.forms import rendering
+from thecut.forms.fragments import get_field_fragments
+from thecut.forms.templatetags.thecut_forms import FORM_OPTIONS
+
+try:
+    from jinja2 import pass_context
+except ImportError:  # Jinja2 < 3.0
+    from jinja2 import contextfunction as pass_context
+
+
+# Support for Django's Jinja2 template backend. The Jinja2 templates (in the
+# ``jinja2`` directory) use the globals added by FormsExtension.
+
+
+def _get_options(context, options):
+    for name in FORM_OPTIONS:
+        if name not in options:
+            options[name] = context.get(name)
+    return options
+
+
+@pass_context
+def render_form(context, form=None, **options):
+    """Render a form, producing the same output as including the
+    ``forms/_form.html`` template (as per the ``{% render_form %}`` Django
+    template tag). For example::
+
+        {{ render_form(my_form, form_method="GET") }}
+
+    """
+    if form is None:
+        form = context['form']
+    return rendering.render_form(
+        form, request=context.get('request'),
+        csrf_token=context.get('csrf_token', ''),
+        **_get_options(context, options))
+
+
+@pass_context
+def render_formset(context, formset=None, **options):
+    """Render a formset, producing the same output as including the
+    ``forms/_formset.html`` Django template."""
+    if formset is None:
+        formset = context['formset']
+    return rendering.render_formset(
+        formset, request=context.get('request'),
+        csrf_token=context.get('csrf_token', ''),
+        **_get_options(context, options))
+
+
+def csrf_token_input(csrf_token):
+    # As per Django's {% csrf_token %} tag.
+    return rendering.render_csrf_token(csrf_token or '')
+
+
+def render_honeypot_field(field_name=None):
+    # As per django-honeypot's {% render_honeypot_field %} tag.
+    from honeypot.templatetags.honeypot import (
+        render_honeypot_field as honeypot_context)
+    return mark_safe(render_to_string('honeypot/honeypot_field.html',
+                                      honeypot_context(field_name)))
+
+
+class FormsExtension(Extension):
+    """A Jinja2 extension which adds the globals and filters used by
+    thecut-forms' Jinja2 templates, and the :py:func:`render_form` and
+    :py:func:`render_formset` globals.
+
+    Add it to the ``extensions`` of Django's Jinja2 template backend::
+
+        TEMPLATES = [
+            {
+                'BACKEND': 'django.template.backends.jinja2.Jinja2',
+                'APP_DIRS': True,
+                'OPTIONS': {
+                    'extensions': ['thecut.forms.jinja.FormsExtension'],
+                },
+            },
+        ]
+
+    """
+
+    def __init__(self, environment):
+        super(FormsExtension, self).__init__(environment)
+        environment.globals.update({
+            'csrf_token_input': csrf_token_input,
+            'field_fragments': get_field_fragments,
+            'render_form': render_form,
+            'render_formset': render_formset,
+            'render_honeypot_field': render_honeypot_field,
+        })
+        environment.filters['conditional_escape'] = conditional_escape
+
+
+def environment(**options):
+    """Return a Jinja2 environment with :py:class:`FormsExtension`, for use
+    as the ``environment`` option of Django's Jinja2 template backend.
+
+    :rtype: :py:class:`jinja2.Environment`
+    """
+    extensions = list(options.pop('extensions', []))
+    if FormsExtension not in extensions and \
+            'thecut.forms.jinja.FormsExtension' not in extensions:
+        extensions.append(FormsExtension)
+    return Environment(extensions=extensions, **options)
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+from django.forms import renderers
+import django
+from django.utils.formats import localize
+from django.utils.html import conditional_escape, escape
+from django.utils.safestring import SafeData
+from django.utils.timezone import template_localtime
+import os
+
+
+# Python implementations of Django's templates for common widgets (in
+# ``django/forms/templates/django/forms/widgets``), for Django's form
+# renderers (Django 1.11+). The output of these
+# functions must be identical to the (stripped) output of the templates. Each
+# returns None if it can't render a widget's context, in which case the
+# template is rendered instead.
+
+
+_text_type = type('')
+
+ATTRS_TEMPLATE_NAME = 'django/forms/widgets/attrs.html'
+
+INPUT_TEMPLATE_NAME = 'django/forms/widgets/input.html'
+
+OPTION_TEMPLATE_NAME = 'django/forms/widgets/select_option.html'
+
+# Django < 2.0's templates close void elements (e.g. ``<input ... />``).
+VOID_TAG_END = '>' if django.VERSION >= (2, 0) else ' />'
+
+# The directory containing Django's own form templates.
+DJANGO_TEMPLATES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(forms.__file__)), 'templates')
+
+
+def render_value(value):
+    """Render a value, as per ``{{ value }}`` in a template.
+
+    :rtype: :py:class:`str`
+    """
+    if not isinstance(value, _text_type):
+        value = localize(template_localtime(value))
+        if not isinstance(value, _text_type):
+            value = '{0}'.format(value)
+    return conditional_escape(value)
+
+
+def _stringformat(value):
+    # As per {{ value|stringformat:'s' }} in an autoescaping template.
+    if isinstance(value, SafeData):
+        return '%s' % (value,)
+    return escape('%s' % (value,))
+
+
+def render_attrs(attrs):
+    """Render a widget's attributes, as per the
+    ``django/forms/widgets/attrs.html`` template.
+
+    :param attrs: The widget's attributes.
+    :type attrs: :py:class:`dict`
+    :returns: The rendered attributes, or ``None`` if they can't be rendered
+        without the template.
+    :rtype: :py:class:`str`
+    """
+    output = []
+    for name, value in attrs.items():
+        if value is False:
+            continue
+        if callable(value):  # Templates call callables.
+            return None
+        if value is True:
+            output.append(' {0}'.format(render_value(name)))
+        else:
+            output.append(' {0}="{1}"'.format(
+                render_value(name), _stringformat(value)))
+    return ''.join(output)
+
+
+def render_input(widget):
+    """Render a widget, as per the ``django/forms/widgets/input.html``
+    template.
+
+    :param widget: The widget's template context.
+    :type widget: :py:class:`dict`
+    :rtype: :py:class:`str`
+    """
+    attrs = render_attrs(widget['attrs'])
+    if attrs is None:
+        return None
+    if widget['value'] is None:
+        value = ''
+    else:
+        value = ' value="{0}"'.format(_stringformat(widget['value']))
+    return '<input type="{0}" name="{1}"{2}{3}{4}'.format(
+        render_value(widget['type']), render_value(widget['name']), value,
+        attrs, VOID_TAG_END)
+
+
+def render_textarea(widget):
+    """Render a widget, as per the ``django/forms/widgets/textarea.html``
+    template.
+
+    :param widget: The widget's template context.
+    :type widget: :py:class:`dict`
+    :rtype: :py:class:`str`
+    """
+    attrs = render_attrs(widget['attrs'])
+    if attrs is None:
+        return None
+    return '<textarea name="{0}"{1}>\n{2}</textarea>'.format(
+        render_value(widget['name']), attrs,
+        render_value(widget['value']) if widget['value'] else '')
+
+
+def render_option(option):
+    """Render an option, as per the ``django/forms/widgets/select_option.html``
+    template.
+
+    :param option: The option's template context.
+    :type option: :py:class:`dict`
+    :rtype: :py:class:`str`
+    """
+    attrs = render_attrs(option['attrs'])
+    if attrs is None:
+        return None
+    return '<option value="{0}"{1}>{2}</option>'.format(
+        _stringformat(option['value']), attrs, render_value(option['label']))
+
+
+def render_select(widget):
+    """Render a widget, as per the ``django/forms/widgets/select.html``
+    template.
+
+    :param widget: The widget's template context.
+    :type widget: :py:class:`dict`
+    :rtype: :py:class:`str`
+    """
+    attrs = render_attrs(widget['attrs'])
+    if attrs is None:
+        return None
+    output = ['<select name="{0}"{1}>'.format(
+        render_value(widget['name']), attrs)]
+    for group_name, group_choices, group_index in widget['optgroups']:
+        if group_name:
+            output.append('\n  <optgroup label="{0}">'.format(
+                render_value(group_name)))
+        for option in group_choices:
+            if option['template_name'] != OPTION_TEMPLATE_NAME:
+                return None
+            rendered = render_option(option)
+            if rendered is None:
+                return None
+            # The included template's trailing newline is kept.
+            output.append('\n  {0}\n'.format(rendered))
+        if group_name:
+            output.append('\n  </optgroup>')
+    output.append('\n</select>')
+    return ''.join(output)
+
+
+def is_django_template(renderer, template_name):
+    """Return whether a renderer resolves a template name to Django's own
+    template (rather than to a template which overrides it).
+
+    :param renderer: The form renderer.
+    :type renderer: :py:class:`~django.forms.renderers.BaseRenderer`
+    :param template_name: The template's name.
+    :type template_name: :py:class:`str`
+    :rtype: :py:class:`bool`
+    """
+    template = renderer.get_template(template_name)
+    # The backend's template wraps the engine's template.
+    origin = getattr(getattr(template, 'template', template), 'origin', None)
+    name = getattr(origin, 'name', None)
+    return name is not None and os.path.abspath(name).startswith(
+        DJANGO_TEMPLATES_DIR + os.sep)
+
+
+def are_django_templates(renderer, template_names):
+    """Return whether a renderer resolves all of the template names to
+    Django's own templates (see :py:func:`is_django_template`). The result
+    is cached on the renderer, so templates are only resolved once.
+
+    :param renderer: The form renderer.
+    :type renderer: :py:class:`~django.forms.renderers.BaseRenderer`
+    :param template_names: The templates' names.
+    :type template_names: :py:class:`tuple`
+    :rtype: :py:class:`bool`
+    """
+    cache = renderer.__dict__.setdefault('_django_templates_cache', {})
+    try:
+        return cache[template_names]
+    except KeyError:
+        pass
+    result = cache[template_names] = all(
+        is_django_template(renderer, name) for name in template_names)
+    return result
+
+
+class WidgetRendererMixin(object):
+    """A mixin for a Django form renderer which renders common widgets
+    (:py:class:`~django.forms.TextInput`,
+    :py:class:`~django.forms.EmailInput`, :py:class:`~django.forms.Textarea`,
+    :py:class:`~django.forms.DateInput`, :py:class:`~django.forms.TimeInput`,
+    :py:class:`~django.forms.DateTimeInput`,
+    :py:class:`~django.forms.Select`,
+    :py:class:`~django.forms.CheckboxInput` and
+    :py:class:`~django.forms.HiddenInput`) in Python, rather than with their
+    templates. Other widgets are rendered with their templates.
+
+    The output is identical to that of Django's templates. If a widget's
+    template (or a template it includes) is overridden, the widget is
+    rendered with the template instead.
+    """
+
+    #: The templates rendered in Python, and the functions which render them
+    #: (from the widget's template context).
+    python_templates = {
+        'django/forms/widgets/checkbox.html': render_input,
+        'django/forms/widgets/date.html': render_input,
+        'django/forms/widgets/datetime.html': render_input,
+        'django/forms/widgets/email.html': render_input,
+        'django/forms/widgets/hidden.html': render_input,
+        INPUT_TEMPLATE_NAME: render_input,
+        'django/forms/widgets/select.html': render_select,
+        'django/forms/widgets/text.html': render_input,
+        'django/forms/widgets/textarea.html': render_textarea,
+        'django/forms/widgets/time.html': render_input,
+        OPTION_TEMPLATE_NAME: render_option,
+    }
+
+    #: The templates included by the templates in :py:attr:`python_templates`
+    #: (the other templates include the input template).
+    included_templates = {
+        'django/forms/widgets/select.html': (OPTION_TEMPLATE_NAME,
+                                             ATTRS_TEMPLATE_NAME),
+        'django/forms/widgets/textarea.html': (ATTRS_TEMPLATE_NAME,),
+        INPUT_TEMPLATE_NAME: (ATTRS_TEMPLATE_NAME,),
+        OPTION_TEMPLATE_NAME: (ATTRS_TEMPLATE_NAME,),
+    }
+
+    def get_python_template(self, template_name):
+        """Return the function which renders a template in Python, or
+        ``None`` if the template (or a template it includes) has been
+        overridden, or isn't rendered in Python.
+
+        :param template_name: The template's name.
+        :type template_name: :py:class:`str`
+        :rtype: :py:class:`callable`
+        """
+        render_widget = self.python_templates.get(template_name)
+        if render_widget is None:
+            return None
+        template_names = (template_name,) + self.included_templates.get(
+            template_name, (INPUT_TEMPLATE_NAME, ATTRS_TEMPLATE_NAME))
+        if not are_django_templates(self, template_names):
+            return None
+        return render_widget
+
+    def render(self, template_name, context, request=None):
+        render_widget = self.get_python_template(template_name)
+        if render_widget is not None and 'widget' in context:
+            output = render_widget(context['widget'])
+            if output is not None:
+                return output
+        return super(WidgetRendererMixin, self).render(
+            template_name, context, request=request)
+
+
+class DjangoTemplates(WidgetRendererMixin, renderers.DjangoTemplates):
+    """A form renderer which renders common widgets in Python (see
+    :py:class:`WidgetRendererMixin`), and other widgets with Django's
+    :py:class:`~django.forms.renderers.DjangoTemplates` renderer. To use it
+    for all forms::
+
+        FORM_RENDERER = 'thecut.forms.renderers.DjangoTemplates'
+
+    """
@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+from django.template import Context
+from django.template.context_processors import csrf
+from django.template.defaulttags import CsrfTokenNode
+from django.template.loader import get_template
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+from thecut.forms import i18n, instrumentation
+from thecut.forms.cache import get_fragment_cache, make_key
+from thecut.forms.fragments import get_field_fragments
+
+
+# Python implementations of the ``forms/_form.html``,
+# ``forms/_form_fields.html`` and ``forms/_form_field.html`` templates. The
+# output of these functions must be identical to the output of the
+# templates - if you change one, change the other.
+
+
+def _text(value):
+    return '{0}'.format(value)
+
+
+def _get_fragment_cache(fragment_cache):
+    if fragment_cache is True:
+        return get_fragment_cache()
+    return fragment_cache or None
+
+
+def get_field_cache_key(field, safe_help_text=False):
+    """Return a cache key for a bound field's rendered markup, or ``None`` if
+    the field's markup should not be cached.
+
+    The markup of fields on bound forms (which depends on the submitted data
+    and errors), and of fields with querysets for choices (which may change
+    at any time), is not cached.
+
+    :param field: The bound field.
+    :type field: :py:class:`~django.forms.BoundField`
+    :rtype: :py:class:`str`
+    """
+    if field.form.is_bound or isinstance(field.field,
+                                         forms.ModelChoiceField):
+        return None
+    form_class = type(field.form)
+    widget = field.field.widget
+    choices = getattr(field.field, 'choices', None)
+    return make_key(
+        form_class.__module__, form_class.__name__, field.html_name,
+        field.auto_id, _text(i18n.get_label(field)),
+        _text(i18n.get_help_text(field)),
+        field.form.label_suffix, field.field.required,
+        getattr(field.field, 'disabled', False), type(widget).__module__,
+        type(widget).__name__, getattr(widget, 'input_type', None),
+        sorted((key, _text(value)) for key, value in widget.attrs.items()),
+        None if choices is None else list(choices), field.value(),
+        get_language(), safe_help_text)
+
+
+def render_field(field, safe_help_text=False, fragment_cache=None):
+    """Render a bound field, as per the ``forms/_form_field.html`` template.
+
+    :param field: The bound field to render.
+    :type field: :py:class:`~django.forms.BoundField`
+    :param safe_help_text: Do not escape the field's help text.
+    :type safe_help_text: :py:class:`bool`
+    :param fragment_cache: Cache the rendered field (if the form is
+        unbound) in this :py:class:`~thecut.forms.cache.TieredCache`, or in
+        the default fragment cache if ``True``.
+    :rtype: :py:class:`~django.utils.safestring.SafeText`
+    """
+    fragment_cache = _get_fragment_cache(fragment_cache)
+    if fragment_cache is not None:
+        key = get_field_cache_key(field, safe_help_text)
+        if key is not None:
+            output = fragment_cache.get(key)
+            if output is None:
+                output = render_field(field, safe_help_text)
+                fragment_cache.set(key, output)
+            return mark_safe(output)
+
+    fragments = get_field_fragments(field)
+    output = ['<li class="', fragments.css_class, '">\n  ',
+              fragments.label_tag, '\n  <div class="field">',
+              conditional_escape(field), '</div>\n  ']
+    if fragments.help_text:
+        output.append('<span class="helptext">')
+        if safe_help_text:
+            output.append(_text(fragments.raw_help_text))
+        else:
+            output.append(fragments.help_text)
+        output.append('</span>')
+    output.extend(['\n  ', conditional_escape(field.errors), '\n</li>\n'])
+    return mark_safe(''.join(output))
+
+
+def iter_fields(form, safe_help_text=False, fragment_cache=None):
+    """Render a form's visible fields, as per the ``forms/_form_fields.html``
+    template, one field at a time.
+
+    :param form: The form to render.
+    :type form: :py:class:`~django.forms.Form`
+    :param safe_help_text: Do not escape the fields' help text.
+    :type safe_help_text: :py:class:`bool`
+    :param fragment_cache: See :py:func:`render_field`.
+    :returns: An iterator of :py:class:`~django.utils.safestring.SafeText`
+        chunks.
+    """
+    fragment_cache = _get_fragment_cache(fragment_cache)
+    for field in form.visible_fields():
+        yield mark_safe(''.join([
+            '\n  ', render_field(field, safe_help_text, fragment_cache),
+            '\n']))
+    yield mark_safe('\n')
+
+
+def render_fields(form, safe_help_text=False, fragment_cache=None):
+    """Render a form's visible fields, as per the ``forms/_form_fields.html``
+    template.
+
+    Takes the same arguments as :py:func:`iter_fields`.
+
+    :rtype: :py:class:`~django.utils.safestring.SafeText`
+    """
+    return mark_safe(''.join(iter_fields(form, safe_help_text,
+                                         fragment_cache)))
+
+
+def render_csrf_token(csrf_token):
+    return CsrfTokenNode().render(Context({'csrf_token': csrf_token}))
+
+
+def render_honeypot(form_honeypot_field, request=None):
+    template = get_template('forms/_honeypot.html')
+    return template.render({'form_honeypot_field': form_honeypot_field},
+                           request)
+
+
+def iter_form(form, request=None, form_action=None, form_method=None,
+              form_honeypot_field=None, form_submit_value=None,
+              input_submit=False, safe_help_text=False, csrf_token=None,
+              fragment_cache=None):
+    """Render a form, as per the ``forms/_form.html`` template, in chunks.
+
+    The form is rendered one field at a time as the returned iterator is
+    consumed, so it can be passed to a
+    :py:class:`~django.http.StreamingHttpResponse` to send very large forms
+    without first building all of their markup in memory.
+
+    Takes the same arguments as :py:func:`render_form`.
+
+    :returns: An iterator of :py:class:`~django.utils.safestring.SafeText`
+        chunks.
+    """
+    if not form_action:
+        if request is None:
+            raise ValueError('A request is required if no form_action is '
+                             'provided.')
+        form_action = request.path
+    if csrf_token is None and request is not None:
+        csrf_token = csrf(request)['csrf_token']
+    return _iter_form(form, request, form_action, form_method,
+                      form_honeypot_field, form_submit_value, input_submit,
+                      safe_help_text, csrf_token, fragment_cache)
+
+
+def _iter_form(form, request, form_action, form_method, form_honeypot_field,
+               form_submit_value, input_submit, safe_help_text, csrf_token,
+               fragment_cache, csrf_markup=None, honeypot_markup=None):
+    # csrf_markup and honeypot_markup replace the rendered CSRF token and
+    # honeypot field (see render_form's form_cache).
+    output = ['<form action="', conditional_escape(form_action),
+              '" method="', conditional_escape(form_method or 'POST'), '"']
+    if form.is_multipart():
+        output.append(' enctype="multipart/form-data"')
+    output.append('>\n  <div>\n    ')
+    if not form_method == 'GET':
+        output.append(render_csrf_token(csrf_token) if csrf_markup is None
+                      else csrf_markup)
+    output.append('\n    ')
+    if form_honeypot_field:
+        output.append(render_honeypot(form_honeypot_field, request)
+                      if honeypot_markup is None else honeypot_markup)
+    output.append('\n    ')
+    output.extend(conditional_escape(field)
+                  for field in form.hidden_fields())
+    output.extend(['\n  </div>\n  ',
+                   conditional_escape(form.non_field_errors()),
+                   '\n  <ul>\n    '])
+    yield mark_safe(''.join(output))
+
+    for chunk in iter_fields(form, safe_help_text, fragment_cache):
+        yield chunk
+
+    output = ['\n    <li class="actions">\n      ']
+    submit_value = conditional_escape(form_submit_value or 'Submit')
+    if input_submit:
+        output.extend(['\n        <input type="submit" value="',
+                       submit_value, '" />\n      '])
+    else:
+        output.extend(['\n        <button type="submit">', submit_value,
+                       '</button>\n      '])
+    output.append('\n    </li>\n  </ul>\n</form>\n')
+    yield mark_safe(''.join(output))
+
+
+def iter_formset(formset, request=None, form_action=None, form_method=None,
+                 form_honeypot_field=None, form_submit_value=None,
+                 input_submit=False, safe_help_text=False, csrf_token=None,
+                 fragment_cache=None):
+    """Render a formset, as per the ``forms/_formset.html`` template, in
+    chunks (one per form in the formset).
+
+    Takes the same arguments as :py:func:`render_formset`.
+
+    :returns: An iterator of :py:class:`~django.utils.safestring.SafeText`
+        chunks.
+    """
+    if not form_action:
+        if request is None:
+            raise ValueError('A request is required if no form_action is '
+                             'provided.')
+        form_action = request.path
+    if csrf_token is None and request is not None:
+        csrf_token = csrf(request)['csrf_token']
+    return _iter_formset(formset, request, form_action, form_method,
+                         form_honeypot_field, form_submit_value,
+                         input_submit, safe_help_text, csrf_token,
+                         fragment_cache)
+
+
+def _iter_formset(formset, request, form_action, form_method,
+                  form_honeypot_field, form_submit_value, input_submit,
+                  safe_help_text, csrf_token, fragment_cache):
+    output = ['<form action="', conditional_escape(form_action),
+              '" method="', conditional_escape(form_method or 'POST'), '"']
+    if formset.is_multipart():
+        output.append(' enctype="multipart/form-data"')
+    output.append('>\n  <div>\n    ')
+    if not form_method == 'GET':
+        output.append(render_csrf_token(csrf_token))
+    output.append('\n    ')
+    if form_honeypot_field:
+        output.append(render_honeypot(form_honeypot_field, request))
+    output.extend(['\n    ', conditional_escape(formset.management_form),
+                   '\n  </div>\n  ',
+                   conditional_escape(formset.non_form_errors()), '\n  '])
+    yield mark_safe(''.join(output))
+
+    for form in formset:
+        output = ['<div class="formset-form">\n    ']
+        output.extend(conditional_escape(field)
+                      for field in form.hidden_fields())
+        output.extend(['\n    ', conditional_escape(form.non_field_errors()),
+                       '\n    <ul>\n      ',
+                       render_fields(form, safe_help_text, fragment_cache),
+                       '\n    </ul>\n  </div>\n  '])
+        yield mark_safe(''.join(output))
+
+    output = ['\n  <ul>\n    <li class="actions">\n      ']
+    submit_value = conditional_escape(form_submit_value or 'Submit')
+    if input_submit:
+        output.extend(['\n        <input type="submit" value="',
+                       submit_value, '" />\n      '])
+    else:
+        output.extend(['\n        <button type="submit">', submit_value,
+                       '</button>\n      '])
+    output.append('\n    </li>\n  </ul>\n</form>\n')
+    yield mark_safe(''.join(output))
+
+
+def render_formset(formset, request=None, form_action=None, form_method=None,
+                   form_honeypot_field=None, form_submit_value=None,
+                   input_submit=False, safe_help_text=False, csrf_token=None,
+                   fragment_cache=None):
+    """Render a formset, as per the ``forms/_formset.html`` template, without
+    the overhead of the template engine.
+
+    Takes the same arguments as :py:func:`render_form`, but for a formset.
+
+    :rtype: :py:class:`~django.utils.safestring.SafeText`
+    """
+    return mark_safe(''.join(iter_formset(
+        formset, request=request, form_action=form_action,
+        form_method=form_method, form_honeypot_field=form_honeypot_field,
+        form_submit_value=form_submit_value, input_submit=input_submit,
+        safe_help_text=safe_help_text, csrf_token=csrf_token,
+        fragment_cache=fragment_cache)))
+
+
+def get_form_cache_key(form, form_action, form_method=None,
+                       form_honeypot_field=None, form_submit_value=None,
+                       input_submit=False, safe_help_text=False):
+    """Return a cache key for a form's rendered markup (excluding its CSRF
+    token and honeypot field), or ``None`` if the form's markup should not be
+    cached.
+
+    The key depends on the form class, each field's cache key (see
+    :py:func:`get_field_cache_key`, which includes its initial value), the
+    rendering options and the active language. Bound forms, and forms with
+    any fields which are not cached, are not cached.
+
+    :param form: The form.
+    :type form: :py:class:`~django.forms.Form`
+    :rtype: :py:class:`str`
+    """
+    if form.is_bound:
+        return None
+    field_keys = []
+    for field in form:
+        field_key = get_field_cache_key(field, safe_help_text)
+        if field_key is None:
+            return None
+        field_keys.append(field_key)
+    form_class = type(form)
+    return make_key(
+        'form', form_class.__module__, form_class.__name__, field_keys,
+        _text(form_action), form_method, bool(form_honeypot_field),
+        _text(form_submit_value), bool(input_submit), form.is_multipart(),
+        get_language())
+
+
+# Stand-ins for the CSRF token and honeypot field in cached forms' markup.
+CSRF_PLACEHOLDER = '<!-- thecut-forms:csrf_token -->'
+
+HONEYPOT_PLACEHOLDER = '<!-- thecut-forms:honeypot -->'
+
+
+def _render_cached_form(form, request, form_action, form_method,
+                        form_honeypot_field, form_submit_value, input_submit,
+                        safe_help_text, csrf_token, fragment_cache,
+                        form_cache):
+    if not form_action:
+        if request is None:
+            raise ValueError('A request is required if no form_action is '
+                             'provided.')
+        form_action = request.path
+    key = get_form_cache_key(form, form_action, form_method,
+                             form_honeypot_field, form_submit_value,
+                             input_submit, safe_help_text)
+    if key is None:
+        return None
+    output = form_cache.get(key)
+    if output is None:
+        output = ''.join(_iter_form(
+            form, request, form_action, form_method, form_honeypot_field,
+            form_submit_value, input_submit, safe_help_text, None,
+            fragment_cache, csrf_markup=CSRF_PLACEHOLDER,
+            honeypot_markup=HONEYPOT_PLACEHOLDER))
+        form_cache.set(key, output)
+    # The CSRF token and honeypot field differ per request.
+    if not form_method == 'GET':
+        if csrf_token is None and request is not None:
+            csrf_token = csrf(request)['csrf_token']
+        output = output.replace(CSRF_PLACEHOLDER,
+                                render_csrf_token(csrf_token), 1)
+    if form_honeypot_field:
+        output = output.replace(
+            HONEYPOT_PLACEHOLDER,
+            render_honeypot(form_honeypot_field, request), 1)
+    return mark_safe(output)
+
+
+def render_form(form, request=None, form_action=None, form_method=None,
+                form_honeypot_field=None, form_submit_value=None,
+                input_submit=False, safe_help_text=False, csrf_token=None,
+                fragment_cache=None, form_cache=None):
+    """Render a form, as per the ``forms/_form.html`` template, without the
+    overhead of the template engine.
+
+    The keyword arguments correspond to the template's context variables
+    (see :ref:`templates`).
+
+    :param form: The form to render.
+    :type form: :py:class:`~django.forms.Form`
+    :param request: The current request (used for the default
+        ``form_action`` and the CSRF token).
+    :type request: :py:class:`~django.http.HttpRequest`
+    :param csrf_token: The CSRF token (defaults to the request's token).
+    :param fragment_cache: Cache the rendered fields of unbound forms (see
+        :py:func:`render_field`).
+    :param form_cache: Cache the whole rendered form (if it is unbound, see
+        :py:func:`get_form_cache_key`) in this
+        :py:class:`~thecut.forms.cache.TieredCache`, or in the default cache
+        if ``True``. The CSRF token and honeypot field are rendered for each
+        request.
+    :rtype: :py:class:`~django.utils.safestring.SafeText`
+    """
+    started = instrumentation.enabled and instrumentation.clock()
+    output = None
+    form_cache = _get_fragment_cache(form_cache)
+    if form_cache is not None:
+        output = _render_cached_form(
+            form, request, form_action, form_method, form_honeypot_field,
+            form_submit_value, input_submit, safe_help_text, csrf_token,
+            fragment_cache, form_cache)
+    if output is None:
+        output = mark_safe(''.join(iter_form(
+            form, request=request, form_action=form_action,
+            form_method=form_method, form_honeypot_field=form_honeypot_field,
+            form_submit_value=form_submit_value, input_submit=input_submit,
+            safe_help_text=safe_help_text, csrf_token=csrf_token,
+            fragment_cache=fragment_cache)))
+    if started:
+        instrumentation.send_rendered(form, None,
+                                      instrumentation.clock() - started)
+    return output
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from collections import OrderedDict
+from django import forms
+from thecut.forms.utils import css_class_list, get_placeholders
+
+
+class Rule(object):
+    """A field decoration rule.
+
+    A rule is matched against the class of a field and the class of its
+    widget, and is then applied to each matching field.
+
+    Rules which depend on a form instance's data (rather than just on the
+    form class) should set :py:attr:`per_instance` to ``True``. These are
+    applied to each form instance (with the form's ``initial`` data), and
+    again once the form has been cleaned (with the ``cleaned_data``).
+    """
+
+    #: The field classes to which the rule applies.
+    field_classes = (forms.Field,)
+
+    #: The widget classes to which the rule applies.
+    widget_classes = (forms.Widget,)
+
+    #: Widget classes to which the rule does not apply, even if they are
+    #: subclasses of :py:attr:`widget_classes`.
+    excluded_widget_classes = ()
+
+    #: Whether the rule depends on form instance data.
+    per_instance = False
+
+    def matches(self, field_class, widget_class):
+        """Return ``True`` if the rule applies to fields of the given class
+        using widgets of the given class.
+
+        :param field_class: The field's class.
+        :type field_class: :py:class:`type`
+        :param widget_class: The field's widget's class.
+        :type widget_class: :py:class:`type`
+        :rtype: :py:class:`bool`
+        """
+        return (issubclass(field_class, self.field_classes) and
+                issubclass(widget_class, self.widget_classes) and
+                not issubclass(widget_class, self.excluded_widget_classes))
+
+    def apply(self, form, name, field, data=None):
+        """Decorate a matching field (and its widget) in place.
+
+        :param form: The form class (or the form instance, for
+            :py:attr:`per_instance` rules).
+        :param name: The field's name on the form.
+        :type name: :py:class:`str`
+        :param field: The field to decorate.
+        :type field: :py:class:`~django.forms.Field`
+        :param data: The form's ``initial`` or ``cleaned_data`` (for
+            :py:attr:`per_instance` rules only).
+        :type data: :py:class:`dict`
+        """
+        raise NotImplementedError
+
+    def decorate(self, form, name, field, data=None):
+        """Apply the rule to a field, if it matches the field."""
+        if self.matches(type(field), type(field.widget)):
+            self.apply(form, name, field, data=data)
+
+
+class EmailTypeRule(Rule):
+    """Set the HTML5 ``email`` input type on
+    :py:class:`~django.forms.EmailField` instances."""
+
+    field_classes = (forms.EmailField,)
+
+    def apply(self, form, name, field, data=None):
+        field.widget.input_type = 'email'
+
+
+class RequiredRule(Rule):
+    """Set the HTML5 ``required`` attribute on required fields.
+
+    Note that if we set the required attribute on fields with certain
+    widgets, it will cause the form to break by requiring EVERY option to be
+    selected. This is not possible with the RadioSelect widget, and in most
+    cases won't be the desired behaviour with the CheckboxSelectMultiple
+    widget. If it is, the required attribute of the widget can still be set
+    manually in the form.
+    """
+
+    excluded_widget_classes = (forms.CheckboxSelectMultiple,
+                               forms.RadioSelect)
+
+    def apply(self, form, name, field, data=None):
+        if field.required:
+            field.widget.attrs.update({'required': 'required'})
+
+
+class MaxLengthRule(Rule):
+    """Set the HTML5 ``maxlength`` attribute on fields using the
+    :py:class:`~django.forms.Textarea` widget."""
+
+    widget_classes = (forms.Textarea,)
+
+    def apply(self, form, name, field, data=None):
+        if field.max_length:
+            field.widget.attrs.update({'maxlength': field.max_length})
+
+
+class PlaceholderRule(Rule):
+    """Set the HTML5 ``placeholder`` attribute on fields which have an entry
+    in the form's ``Meta.placeholders`` ``dict`` (see
+    :py:func:`~thecut.forms.utils.get_placeholders`)."""
+
+    def apply(self, form, name, field, data=None):
+        placeholders = get_placeholders(form)
+        if name in placeholders:
+            field.widget.attrs.update({'placeholder': placeholders[name]})
+
+
+class CSSClassRule(Rule):
+    """Add a CSS class to fields using particular widgets.
+
+    The class is added to the widget's
+    :py:class:`~thecut.forms.utils.CSSClassList`, so that several rules
+    share a single parse of the widget's ``class`` attribute.
+    """
+
+    css_class = None
+
+    def apply(self, form, name, field, data=None):
+        css_class_list(field.widget).add(self.css_class)
+
+
+class TimeClassRule(CSSClassRule):
+    """Add a ``time`` CSS class to fields using the
+    :py:class:`~django.forms.TimeInput` widget."""
+
+    widget_classes = (forms.TimeInput,)
+
+    css_class = 'time'
+
+
+class DateClassRule(CSSClassRule):
+    """Add a ``date`` CSS class to fields using the
+    :py:class:`~django.forms.DateInput` widget."""
+
+    widget_classes = (forms.DateInput,)
+
+    css_class = 'date'
+
+
+class DateTimeClassRule(CSSClassRule):
+    """Add a ``datetime`` CSS class to fields using the
+    :py:class:`~django.forms.DateTimeInput` or
+    :py:class:`~django.forms.SplitDateTimeWidget` widgets."""
+
+    widget_classes = (forms.DateTimeInput, forms.SplitDateTimeWidget)
+
+    css_class = 'datetime'
+
+
+class TimezoneHelpTextRule(Rule):
+    """Set the ``help_text`` of fields using the
+    :py:class:`~django.forms.DateTimeInput` widget to the timezone of the
+    field's data (if any)."""
+
+    widget_classes = (forms.DateTimeInput,)
+
+    per_instance = True
+
+    def apply(self, form, name, field, data=None):
+        field_data = data.get(name) if data else None
+        if field_data:
+            field.help_text = field_data.tzname()
+
+
+class RuleRegistry(object):
+    """An ordered registry of named :py:class:`Rule` instances.
+
+    The rules which apply to a given pair of field and widget classes are
+    cached, so that classifying a field is a single ``dict`` lookup. The
+    cache holds at most :py:attr:`cache_size` pairs, and is invalidated
+    whenever a rule is registered or unregistered.
+    """
+
+    #: The maximum number of (field class, widget class) pairs to cache.
+    cache_size = 1024
+
+    def __init__(self, cache_size=None):
+        self._rules = OrderedDict()
+        self._dispatch_cache = OrderedDict()
+        if cache_size is not None:
+            self.cache_size = cache_size
+        self.version = 0
+
+    def __contains__(self, name):
+        return name in self._rules
+
+    def __iter__(self):
+        return iter(list(self._rules.values()))
+
+    def __getitem__(self, name):
+        return self._rules[name]
+
+    def register(self, name, rule):
+        """Register a rule, replacing any rule already registered with the
+        same name.
+
+        :param name: A unique name for the rule.
+        :type name: :py:class:`str`
+        :param rule: The rule to register.
+        :type rule: :py:class:`Rule`
+        """
+        self._rules[name] = rule
+        self.invalidate()
+
+    def unregister(self, name):
+        """Unregister a rule.
+
+        :param name: The name the rule was registered with.
+        :type name: :py:class:`str`
+        """
+        del self._rules[name]
+        self.invalidate()
+
+    def invalidate(self):
+        """Clear the dispatch cache (and cause forms to be re-decorated).
+
+        This is called automatically when rules are registered or
+        unregistered, but should also be called if a registered rule's
+        classes are changed.
+        """
+        self._dispatch_cache.clear()
+        self.version += 1
+
+    def names(self):
+        return list(self._rules.keys())
+
+    def rules_for(self, field_class, widget_class, per_instance=False):
+        """Return the registered rules which apply to a field class and
+        widget class.
+
+        :param field_class: The field's class.
+        :type field_class: :py:class:`type`
+        :param widget_class: The field's widget's class.
+        :type widget_class: :py:class:`type`
+        :param per_instance: Return the :py:attr:`Rule.per_instance` rules
+            instead of the per-class rules.
+        :type per_instance: :py:class:`bool`
+        :rtype: :py:class:`tuple`
+        """
+        key = (field_class, widget_class)
+        try:
+            dispatch = self._dispatch_cache[key]
+        except KeyError:
+            matching = [rule for rule in self._rules.values()
+                        if rule.matches(field_class, widget_class)]
+            dispatch = (
+                tuple(rule for rule in matching if not rule.per_instance),
+                tuple(rule for rule in matching if rule.per_instance))
+            while len(self._dispatch_cache) >= self.cache_size:
+                self._dispatch_cache.popitem(last=False)
+            self._dispatch_cache[key] = dispatch
+        return dispatch[per_instance]
+
+
+registry = RuleRegistry()
+
+register = registry.register
+
+unregister = registry.unregister
+
+
+email_type = EmailTypeRule()
+
+required = RequiredRule()
+
+max_length = MaxLengthRule()
+
+placeholder = PlaceholderRule()
+
+time_class = TimeClassRule()
+
+date_class = DateClassRule()
+
+datetime_class = DateTimeClassRule()
+
+timezone_help_text = TimezoneHelpTextRule()
+
+
+register('time_class', time_class)
+register('required', required)
+register('placeholder', placeholder)
+register('max_length', max_length)
+register('email_type', email_type)
+register('date_class', date_class)
+register('datetime_class', datetime_class)
+register('timezone_help_text', timezone_help_text)
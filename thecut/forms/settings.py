@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.conf import settings as django_settings
+
+
+# The defaults of thecut-forms' settings, which can be set in Django's
+# settings (prefixed with ``THECUT_FORMS_``).
+DEFAULTS = {
+    # The Django cache used to store rendered form fragments.
+    'FRAGMENT_CACHE_ALIAS': 'default',
+    # How long (in seconds) to store rendered form fragments in the Django
+    # cache (``None`` uses the cache's default timeout).
+    'FRAGMENT_CACHE_TIMEOUT': None,
+    # The maximum number of rendered form fragments to keep in memory (in each
+    # process).
+    'FRAGMENT_CACHE_SIZE': 1000,
+    # Send instrumentation signals (see :py:mod:`thecut.forms.instrumentation`)
+    # from start up.
+    'INSTRUMENTATION': False,
+    # The maximum number of translated labels and help texts to keep in memory
+    # (in each process).
+    'TRANSLATION_CACHE_SIZE': 5000,
+    # The maximum number of fields' pre-escaped static markup (e.g. CSS classes
+    # and label tags) to keep in memory (in each process).
+    'FIELD_FRAGMENT_CACHE_SIZE': 5000,
+    # The number of fields above which forms are rendered in a thread pool by
+    # :py:func:`thecut.forms.asynchronous.arender_form` (smaller forms are
+    # rendered inline).
+    'ASYNC_RENDER_THRESHOLD': 50,
+    # The maximum number of threads used to render forms asynchronously.
+    'ASYNC_RENDER_WORKERS': 4,
+    # Warm up form classes and templates when the app is loaded (see
+    # :py:mod:`thecut.forms.warmup`).
+    'WARM_UP': False,
+    # Dotted paths of form classes to warm up, in addition to those registered
+    # with :py:func:`thecut.forms.warmup.register`.
+    'WARM_UP_FORMS': [],
+    # The maximum number of pre-rendered lists of ``<option>`` elements (see
+    # :py:class:`thecut.forms.widgets.CachedSelect`) to keep in memory (in each
+    # process).
+    'OPTION_CACHE_SIZE': 200,
+    # The maximum number of querysets' choices (see
+    # :py:class:`thecut.forms.fields.CachedModelChoiceField`) to keep in memory
+    # (in each process).
+    'MODEL_CHOICES_CACHE_SIZE': 200,
+    # The Django cache used to store the versions of models' cached choices, so
+    # that :py:func:`thecut.forms.fields.invalidate_model_choices` invalidates
+    # them in every process which shares the cache.
+    'MODEL_CHOICES_VERSION_CACHE_ALIAS': 'default',
+}
+
+
+class Settings(object):
+    """thecut-forms' settings, which are read from Django's settings when
+    they are accessed (so that thecut-forms can be imported before Django's
+    settings are configured)."""
+
+    def __getattr__(self, name):
+        try:
+            default = DEFAULTS[name]
+        except KeyError:
+            raise AttributeError(name)
+        return getattr(django_settings, 'THECUT_FORMS_{0}'.format(name),
+                       default)
+
+
+settings = Settings()
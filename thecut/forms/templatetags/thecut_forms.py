@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import template
+from thecut.forms import i18n, instrumentation, rendering
+from thecut.forms.fragments import get_field_fragments
+
+
+register = template.Library()
+
+
+FORM_OPTIONS = ['form_action', 'form_method', 'form_honeypot_field',
+                'form_submit_value', 'input_submit', 'safe_help_text']
+
+
+@register.simple_tag(takes_context=True)
+def render_form(context, form=None, **options):
+    """Render a form, producing the same output as including the
+    ``forms/_form.html`` template.
+
+    Options not passed to the tag are taken from the template context, as
+    they would be by the included template. For example::
+
+        {% load thecut_forms %}
+        {% render_form my_form form_method="GET" %}
+
+    """
+    if form is None:
+        form = context['form']
+    for name in FORM_OPTIONS:
+        if name not in options:
+            options[name] = context.get(name)
+    return rendering.render_form(
+        form, request=context.get('request'),
+        csrf_token=context.get('csrf_token', ''), **options)
+
+
+@register.simple_tag(takes_context=True)
+def render_fields(context, form=None, safe_help_text=None,
+                  fragment_cache=None):
+    """Render a form's visible fields, producing the same output as including
+    the ``forms/_form_fields.html`` template."""
+    if form is None:
+        form = context['form']
+    if safe_help_text is None:
+        safe_help_text = context.get('safe_help_text')
+    return rendering.render_fields(form, safe_help_text=safe_help_text,
+                                   fragment_cache=fragment_cache)
+
+
+@register.simple_tag(takes_context=True)
+def render_formset(context, formset=None, **options):
+    """Render a formset, producing the same output as including the
+    ``forms/_formset.html`` template.
+
+    Options not passed to the tag are taken from the template context, as
+    per :py:func:`render_form`.
+    """
+    if formset is None:
+        formset = context['formset']
+    for name in FORM_OPTIONS:
+        if name not in options:
+            options[name] = context.get(name)
+    return rendering.render_formset(
+        formset, request=context.get('request'),
+        csrf_token=context.get('csrf_token', ''), **options)
+
+
+@register.filter
+def cached_label_tag(field):
+    """Render a bound field's ``<label>`` tag, as per ``{{ field.label_tag
+    }}``, translating its label once per language (see
+    :py:func:`thecut.forms.i18n.label_tag`)."""
+    return i18n.label_tag(field)
+
+
+@register.filter
+def cached_help_text(field):
+    """Return a bound field's help text, as per ``{{ field.help_text }}``,
+    translating it once per language (see
+    :py:func:`thecut.forms.i18n.get_help_text`)."""
+    return i18n.get_help_text(field)
+
+
+@register.filter
+def field_fragments(field):
+    """Return the pre-escaped static markup for a bound field (see
+    :py:func:`thecut.forms.fragments.get_field_fragments`)."""
+    return get_field_fragments(field)
+
+
+class InstrumentedNode(template.Node):
+
+    def __init__(self, nodelist, form):
+        self.nodelist = nodelist
+        self.form = form
+
+    def render(self, context):
+        if not instrumentation.enabled:
+            return self.nodelist.render(context)
+        started = instrumentation.clock()
+        output = self.nodelist.render(context)
+        instrumentation.send_rendered(
+            self.form.resolve(context),
+            # Django < 1.9 doesn't set the origin on nodes
+            getattr(getattr(self, 'origin', None), 'template_name', None),
+            instrumentation.clock() - started)
+        return output
+
+
+@register.tag
+def instrumented(parser, token):
+    """Send the :py:data:`~thecut.forms.instrumentation.form_rendered`
+    signal after rendering the enclosed template content for a form (if
+    instrumentation is enabled). For example::
+
+        {% load thecut_forms %}
+        {% instrumented form %}<form>...</form>{% endinstrumented %}
+
+    """
+    bits = token.split_contents()
+    if len(bits) != 2:
+        raise template.TemplateSyntaxError(
+            '{0} tag requires a form argument.'.format(bits[0]))
+    nodelist = parser.parse(('endinstrumented',))
+    parser.delete_first_token()
+    return InstrumentedNode(nodelist, parser.compile_filter(bits[1]))
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+from django.test import RequestFactory, TestCase
+from django.utils import translation
+from mock import patch
+from test_app.forms import RenderingForm
+from thecut.forms import rendering
+from thecut.forms.rendering import iter_form, render_form
+from unittest import skipIf
+import threading
+
+try:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from thecut.forms import asynchronous
+except (ImportError, SyntaxError):  # Python < 3.6
+    asynchronous = None
+
+
+def collect(async_iterator, loop):
+    """Return a list of the items of an asynchronous iterator."""
+    items = []
+    while True:
+        try:
+            items.append(loop.run_until_complete(
+                async_iterator.__anext__()))
+        except StopAsyncIteration:
+            return items
+
+
+@skipIf(asynchronous is None, 'Asynchronous rendering is not supported.')
+class AsynchronousTestMixin(object):
+
+    def setUp(self):
+        self.request = RequestFactory().get('/')
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(self.executor.shutdown)
+
+    def render_thread(self, **kwargs):
+        """Render a form, returning the output and the name of the thread
+        the form was rendered in."""
+        threads = []
+
+        def render(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return render_form(*args, **kwargs)
+
+        with patch.object(rendering, 'render_form', side_effect=render):
+            output = self.loop.run_until_complete(asynchronous.arender_form(
+                RenderingForm(), request=self.request, csrf_token='token',
+                executor=self.executor, **kwargs))
+        return output, threads[0]
+
+
+class TestArenderForm(AsynchronousTestMixin, TestCase):
+
+    """Tests for :py:func:`thecut.forms.asynchronous.arender_form`."""
+
+    def test_output(self):
+        for threshold in [1, 1000]:
+            output = self.loop.run_until_complete(asynchronous.arender_form(
+                RenderingForm(), request=self.request, csrf_token='token',
+                threshold=threshold, executor=self.executor))
+            self.assertEqual(output, render_form(
+                RenderingForm(), request=self.request, csrf_token='token'))
+
+    def test_small_forms_rendered_inline(self):
+        output, thread = self.render_thread(threshold=1000)
+        self.assertIs(thread, threading.current_thread())
+
+    def test_large_forms_rendered_in_thread(self):
+        output, thread = self.render_thread(threshold=1)
+        self.assertIsNot(thread, threading.current_thread())
+
+    def test_queryset_choices_rendered_in_thread(self):
+        form = RenderingForm()
+        form.fields['user'] = forms.ModelChoiceField(queryset=None)
+        self.assertTrue(asynchronous._should_offload(form, 1000))
+
+    def test_connections_closed_in_thread(self):
+        """Test old database connections are closed before and after the
+        form is rendered in a thread."""
+        calls = []
+
+        def render(*args, **kwargs):
+            calls.append('render')
+            return render_form(*args, **kwargs)
+
+        with patch.object(asynchronous, 'close_old_connections',
+                          side_effect=lambda: calls.append('close')), \
+                patch.object(rendering, 'render_form', side_effect=render):
+            self.loop.run_until_complete(asynchronous.arender_form(
+                RenderingForm(), request=self.request, csrf_token='token',
+                threshold=1, executor=self.executor))
+        self.assertEqual(calls, ['close', 'render', 'close'])
+
+    @skipIf(getattr(asynchronous, 'sync_to_async', None) is None,
+            'sync_to_async is not available.')
+    def test_uses_sync_to_async(self):
+        sync_to_async = asynchronous.sync_to_async
+        with patch.object(asynchronous, 'sync_to_async',
+                          side_effect=sync_to_async) as mock_sync_to_async:
+            self.render_thread(threshold=1)
+        self.assertFalse(mock_sync_to_async.call_args[1]['thread_sensitive'])
+        self.assertIs(mock_sync_to_async.call_args[1]['executor'],
+                      self.executor)
+
+    def test_active_language_in_thread(self):
+        """Test the caller's active language is activated in the thread the
+        form is rendered in."""
+        with translation.override('fr'):
+            language = self.loop.run_until_complete(
+                self.loop.run_in_executor(
+                    self.executor, asynchronous._in_context(
+                        translation.get_language)))
+        self.assertEqual(language, 'fr')
+        self.assertNotEqual(self.loop.run_until_complete(
+            self.loop.run_in_executor(self.executor,
+                                      translation.get_language)), 'fr')
+
+
+class TestAiterForm(AsynchronousTestMixin, TestCase):
+
+    """Tests for :py:func:`thecut.forms.asynchronous.aiter_form`."""
+
+    def test_chunks(self):
+        expected = list(iter_form(RenderingForm(), request=self.request,
+                                  csrf_token='token'))
+        for threshold, batch_size in [(1000, 10), (1, 1), (1, 3), (1, 100)]:
+            chunks = collect(asynchronous.aiter_form(
+                RenderingForm(), request=self.request, csrf_token='token',
+                threshold=threshold, batch_size=batch_size,
+                executor=self.executor), self.loop)
+            self.assertEqual(chunks, expected)
+
+    def test_options_validated_eagerly(self):
+        with self.assertRaises(ValueError):
+            asynchronous.aiter_form(RenderingForm())
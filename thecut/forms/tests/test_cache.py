@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.core.cache import caches
+from django.test import TestCase
+from thecut.forms.cache import LRUCache, TieredCache, make_key
+
+
+class TestMakeKey(TestCase):
+
+    """Tests for :py:func:`thecut.forms.cache.make_key`."""
+
+    def test_same_parts_same_key(self):
+        self.assertEqual(make_key('a', 1, None), make_key('a', 1, None))
+
+    def test_different_parts_different_key(self):
+        self.assertNotEqual(make_key('a', 1), make_key('a', '1'))
+
+
+class TestLRUCache(TestCase):
+
+    """Tests for the :py:class:`thecut.forms.cache.LRUCache` class."""
+
+    def test_get_and_set(self):
+        cache = LRUCache()
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+
+    def test_least_recently_used_evicted(self):
+        """Test that the least recently used key is evicted when the cache is
+        full."""
+        cache = LRUCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.set('a', 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestTieredCache(TestCase):
+
+    """Tests for the :py:class:`thecut.forms.cache.TieredCache` class."""
+
+    def setUp(self):
+        caches['default'].clear()
+        self.cache = TieredCache('test', alias='default')
+
+    def test_set_stores_in_both_tiers(self):
+        self.cache.set('a', 'value')
+        self.assertEqual(self.cache.local.get('a'), 'value')
+        self.assertEqual(caches['default'].get('test:a'), 'value')
+
+    def test_get_populates_local_tier(self):
+        """Test that values found in the Django cache are stored in the
+        in-process cache."""
+        caches['default'].set('test:a', 'value')
+        self.assertEqual(self.cache.get('a'), 'value')
+        self.assertEqual(self.cache.local.get('a'), 'value')
+
+    def test_local_only(self):
+        cache = TieredCache('test')
+        cache.set('a', 'value')
+        self.assertEqual(cache.get('a'), 'value')
+        self.assertIsNone(caches['default'].get('test:a'))
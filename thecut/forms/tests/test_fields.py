@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+from django.contrib.auth.models import Group, User
+from django.core.cache import caches
+from django.db.models.signals import post_save
+from django.test import TestCase
+from thecut.forms import fields
+from thecut.forms.fields import (CachedModelChoiceField,
+                                 CachedModelMultipleChoiceField,
+                                 invalidate_model_choices)
+
+
+class GroupForm(forms.Form):
+
+    group = CachedModelChoiceField(queryset=Group.objects.order_by('name'))
+
+    groups = CachedModelMultipleChoiceField(queryset=Group.objects.all(),
+                                            required=False)
+
+
+class TestCachedModelChoiceField(TestCase):
+
+    """Tests for :py:class:`thecut.forms.fields.CachedModelChoiceField`."""
+
+    def setUp(self):
+        caches['default'].clear()
+        invalidate_model_choices()
+        self.groups = [Group.objects.create(name=name)
+                       for name in ['b & c', 'a']]
+
+    def test_parity(self):
+        """Test the field is rendered as per a ModelChoiceField."""
+        form = GroupForm(data={'group': self.groups[0].pk})
+        template_form = forms.Form(data={'group': self.groups[0].pk})
+        template_form.fields['group'] = forms.ModelChoiceField(
+            queryset=Group.objects.order_by('name'))
+        self.assertEqual('{0}'.format(form['group']),
+                         '{0}'.format(template_form['group']))
+
+    def test_choices_queried_once(self):
+        GroupForm().as_p()
+        with self.assertNumQueries(0):
+            output = GroupForm(initial={'groups': [self.groups[1].pk]}).as_p()
+        # Django < 1.11 renders selected="selected".
+        self.assertIn('<option value="{0}" selected'.format(
+            self.groups[1].pk), output)
+
+    def test_validation(self):
+        form = GroupForm(data={'group': self.groups[1].pk})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['group'], self.groups[1])
+
+    def test_different_querysets(self):
+        form = GroupForm()
+        form.fields['group'].queryset = Group.objects.filter(name='a')
+        self.assertEqual(len(list(form.fields['group'].choices)), 2)
+        self.assertEqual(len(list(GroupForm().fields['group'].choices)), 3)
+
+    def test_to_field_name(self):
+        """Test fields with different ``to_field_name`` values don't share
+        choices."""
+        form = GroupForm(data={'group': 'a'})
+        form.fields['group'] = CachedModelChoiceField(
+            queryset=Group.objects.order_by('name'), to_field_name='name')
+        self.assertIn('<option value="{0}"'.format(self.groups[1].pk),
+                      GroupForm().as_p())
+        self.assertIn('<option value="a"', form.as_p())
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['group'], self.groups[1])
+
+    def test_invalidate_model(self):
+        GroupForm().as_p()
+        Group.objects.create(name='d')
+        self.assertNotIn('>d</option>', GroupForm().as_p())
+        invalidate_model_choices(User)
+        self.assertNotIn('>d</option>', GroupForm().as_p())
+        invalidate_model_choices(Group)
+        self.assertIn('>d</option>', GroupForm().as_p())
+
+    def test_invalidate_from_signal(self):
+        post_save.connect(invalidate_model_choices, sender=Group)
+        self.addCleanup(post_save.disconnect, invalidate_model_choices,
+                        sender=Group)
+        GroupForm().as_p()
+        Group.objects.create(name='d')
+        self.assertIn('>d</option>', GroupForm().as_p())
+
+    def test_invalidate_in_other_process(self):
+        """Test choices are invalidated by another process which shares the
+        Django cache."""
+        GroupForm().as_p()
+        Group.objects.create(name='d')
+        # As per invalidate_model_choices(Group) in another process.
+        caches['default'].incr(fields._get_version_key('auth.group'))
+        self.assertIn('>d</option>', GroupForm().as_p())
+
+    def test_evicted_version(self):
+        GroupForm().as_p()
+        Group.objects.create(name='d')
+        caches['default'].clear()
+        self.assertIn('>d</option>', GroupForm().as_p())
+
+    def test_invalidate_all(self):
+        GroupForm().as_p()
+        self.assertTrue(len(fields.choices_cache))
+        invalidate_model_choices()
+        self.assertEqual(len(fields.choices_cache), 0)
@@ -2,14 +2,26 @@
 from __future__ import absolute_import, unicode_literals
 from .. import forms
 from django.test import TestCase
-from test_app.forms import (DateClassMixinForm, DateTimeClassMixinForm,
-                            EmailTypeMixinForm, MaxLengthMixinForm,
-                            PlaceholderMixinForm, RequiredMixinForm,
-                            TimeClassMixinForm)
-from thecut.forms.forms import DateTimeTimezoneMixin
+from test_app.forms import (CopyOnWriteForm, DateClassMixinForm,
+                            DateTimeTimezoneForm,
+                            DateTimeClassMixinForm, DecoratedSubclassForm,
+                            DynamicFieldForm, DynamicPlaceholderForm,
+                            EmailTypeMixinForm, FusedForm,
+                            InheritedPlaceholderForm,
+                            LazyDynamicFieldForm, LazyFusedForm,
+                            MaxLengthMixinForm, MissingPlaceholderForm,
+                            ModifyingForm, PlaceholderMixinForm,
+                            RenderingForm, RequiredMixinForm,
+                            TimeClassMixinForm, UndecoratedForm)
+from thecut.forms import rules
+from thecut.forms.forms import DateTimeTimezoneMixin, PlaceholderMixin
+from thecut.forms.utils import get_placeholders
 from mock import patch, MagicMock
 from datetime import datetime, tzinfo, timedelta
 from django import forms as django_forms
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone, translation
+from django.utils.functional import lazy
 import pytz
 
 
@@ -140,6 +152,48 @@ class TestPlaceholderMixin(TestCase):
         self.assertNotIn('placeholder',
                          self.form.fields['b'].widget.attrs.keys())
 
+    def test_inherits_placeholders(self):
+        """Test that placeholders defined on parent form classes are merged
+        with the form's own placeholders."""
+        form = InheritedPlaceholderForm()
+        self.assertEqual(form.fields['a'].widget.attrs['placeholder'],
+                         'foobar')
+        self.assertEqual(form.fields['b'].widget.attrs['placeholder'],
+                         'barfoo')
+
+    def test_placeholders_are_frozen(self):
+        """Test that the resolved placeholders can not be modified."""
+        placeholders = get_placeholders(InheritedPlaceholderForm)
+        self.assertIs(get_placeholders(InheritedPlaceholderForm()),
+                      placeholders)
+        with self.assertRaises(TypeError):
+            placeholders['a'] = 'other'
+
+    def test_placeholder_for_field_added_in_init(self):
+        """Test that placeholders can be defined for fields which are added
+        by the form's ``__init__``."""
+        form = DynamicPlaceholderForm()
+        self.assertEqual(form.fields['time'].widget.attrs['placeholder'],
+                         'hh:mm')
+
+    def test_lazy_placeholder_translated_once_per_language(self):
+        """Test that lazy placeholders are only translated once per
+        language."""
+        translate = MagicMock(side_effect=lambda: translation.get_language())
+
+        class LazyPlaceholderForm(PlaceholderMixin, django_forms.Form):
+
+            a = django_forms.CharField()
+
+            class Meta(object):
+                placeholders = {'a': lazy(translate, type(''))()}
+
+        for language in ['en', 'fr', 'en', 'fr']:
+            with translation.override(language):
+                html = '{0}'.format(LazyPlaceholderForm()['a'])
+                self.assertIn('placeholder="{0}"'.format(language), html)
+        self.assertEqual(translate.call_count, 2)
+
 
 class TestTimeClassMixin(TestCase):
 
@@ -250,6 +304,56 @@ class TestDateTimeTimezoneMixin(TestCase):
         self.assertEqual(self.mock_target_field.help_text, "UTC")
 
 
+class TestDateTimeTimezoneMixinForm(TestCase):
+
+    """Tests for :py:class:`thecut.forms.forms.DateTimeTimezoneMixin` on a
+    form class."""
+
+    def setUp(self):
+        self.initial = {'start': pytz.utc.localize(datetime(2016, 1, 1, 12))}
+
+    def test_sets_help_text_from_initial_data(self):
+        form = DateTimeTimezoneForm(initial=self.initial)
+        self.assertEqual(form.fields['start'].help_text, 'UTC')
+        self.assertEqual(form.fields['end'].help_text, '')
+
+    def test_datetime_field_names_are_determined_once_per_class(self):
+        DateTimeTimezoneForm()
+        with patch.object(DateTimeTimezoneForm,
+                          '_get_class_timezone_field_names',
+                          wraps=DateTimeTimezoneForm.
+                          _get_class_timezone_field_names) as mock_names:
+            form = DateTimeTimezoneForm()
+        self.assertEqual(form._timezone_field_names, ['start', 'end'])
+        self.assertEqual(
+            DateTimeTimezoneForm._timezone_field_names_state[1],
+            ('start', 'end'))
+        self.assertEqual(mock_names.call_count, 1)
+
+    def test_includes_fields_added_to_an_instance(self):
+        form = DateTimeTimezoneForm()
+        form.fields['extra'] = django_forms.DateTimeField()
+        self.assertIn('extra', form._get_timezone_field_names())
+
+    def test_clean_updates_help_text_for_changed_timezone(self):
+        with timezone.override(pytz.utc):
+            form = DateTimeTimezoneForm(
+                data={'start': '2016-01-01 12:00:00'}, initial={
+                    'start': pytz.timezone('Australia/Perth').localize(
+                        datetime(2016, 1, 1, 20))})
+            self.assertEqual(form.fields['start'].help_text, 'AWST')
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.fields['start'].help_text, 'UTC')
+
+    def test_clean_skips_unchanged_values(self):
+        with timezone.override(pytz.utc):
+            form = DateTimeTimezoneForm(data={'start': '2016-01-01 12:00:00'},
+                                        initial=self.initial)
+            form.fields['start'].help_text = 'Unchanged'
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.fields['start'].help_text, 'Unchanged')
+
+
 class TestFormMixin(TestCase):
 
     """Tests for the :py:class:`thecut.forms.forms.EmailTypeMixin` class."""
@@ -276,5 +380,260 @@ class TestFormMixin(TestCase):
         self.assertTrue(issubclass(forms.FormMixin, forms.DateTimeClassMixin))
 
 
+class TestDecoratedFieldsMixin(TestCase):
+
+    """Tests for the :py:class:`thecut.forms.forms.DecoratedFieldsMixin`
+    class."""
+
+    def test_base_fields_decorated_once_per_class(self):
+        """Test that a form class's ``base_fields`` are decorated when the
+        form is first instantiated, and not re-decorated afterwards."""
+        DecoratedSubclassForm()
+        base_fields = DecoratedSubclassForm.base_fields
+        self.assertEqual(base_fields['email'].widget.input_type, 'email')
+        self.assertIn('date', get_css_classes(base_fields['date']))
+        with patch.object(DecoratedSubclassForm, 'decorate_field') as mock:
+            form = DecoratedSubclassForm()
+        self.assertFalse(mock.called)
+        self.assertEqual(form.fields['email'].widget.attrs['placeholder'],
+                         'you@example.com')
+
+    def test_instance_fields_are_copies(self):
+        """Test that each form instance gets its own copy of the decorated
+        fields."""
+        form = DecoratedSubclassForm()
+        self.assertIsNot(form.fields['email'],
+                         DecoratedSubclassForm.base_fields['email'])
+        self.assertIsNot(
+            form.fields['email'].widget.attrs,
+            DecoratedSubclassForm.base_fields['email'].widget.attrs)
+
+    def test_parent_form_fields_not_decorated(self):
+        """Test that decorating a form class does not affect the fields of an
+        undecorated parent form class."""
+        DecoratedSubclassForm()
+        form = UndecoratedForm()
+        self.assertNotIn('required', form.fields['email'].widget.attrs)
+        self.assertNotIn('date', get_css_classes(form.fields['date']))
+
+    def test_dynamic_fields_decorated_per_instance(self):
+        """Test that fields which are not in ``base_fields`` are decorated on
+        the form instance."""
+        form = DynamicFieldForm()
+        self.assertIn('time', get_css_classes(form.fields['time']))
+        self.assertEqual(form.fields['time'].widget.attrs['required'],
+                         'required')
+        self.assertEqual(form.fields['email'].widget.input_type, 'email')
+
+    def test_fields_modified_by_parent_init_are_decorated(self):
+        """Test that fields modified by a parent form's ``__init__`` are
+        decorated as modified, not as declared."""
+        for i in range(2):
+            form = ModifyingForm()
+            self.assertNotIn('required', form.fields['name'].widget.attrs)
+            self.assertEqual(
+                '{0}'.format(form.fields['bio'].widget.attrs['maxlength']),
+                '100')
+        self.assertNotIn('required',
+                         ModifyingForm.base_fields['bio'].widget.attrs)
+
+    def test_parent_forms_without_init_use_decorated_base_fields(self):
+        self.assertFalse(RenderingForm._fields_modified_in_init())
+        self.assertFalse(FusedForm._fields_modified_in_init())
+        self.assertTrue(ModifyingForm._fields_modified_in_init())
+
+    def test_replaced_base_fields_are_decorated(self):
+        """Test that replacing a form class's ``base_fields`` causes the new
+        fields to be decorated."""
+        class ReplacedForm(forms.FormMixin, UndecoratedForm):
+            pass
+        ReplacedForm()
+        ReplacedForm.base_fields = {'other': django_forms.TimeField()}
+        form = ReplacedForm()
+        self.assertIn('time', get_css_classes(form.fields['other']))
+        self.assertIn('time', get_css_classes(
+            ReplacedForm.base_fields['other']))
+
+    def test_missing_placeholder_field_raises_improperly_configured(self):
+        """Test that ``ImproperlyConfigured`` is raised if a placeholder is
+        defined for a field that does not exist."""
+        with self.assertRaises(ImproperlyConfigured):
+            MissingPlaceholderForm()
+
+
+class TestLazyDecoration(TestCase):
+
+    """Tests for lazy decoration of
+    :py:class:`thecut.forms.forms.DecoratedFieldsMixin` forms."""
+
+    data = {'email': 'a@example.com', 'time': '10:00', 'date': '2000-01-01',
+            'radio': 'A', 'datetime': '2000-01-01 10:00'}
+
+    def test_fields_not_decorated_when_validating(self):
+        """Test that per-instance decoration is skipped if a form is only
+        validated."""
+        with patch.object(LazyDynamicFieldForm, '_decorate_fields') as mock:
+            form = LazyDynamicFieldForm(data={'email': 'a@example.com',
+                                              'time': '10:00'})
+            self.assertTrue(form.is_valid())
+        self.assertFalse(mock.called)
+        self.assertNotIn('time', get_css_classes(form.fields['time']))
+
+    def test_fields_decorated_on_access(self):
+        """Test that fields are decorated when a field is accessed."""
+        form = LazyDynamicFieldForm()
+        form['email']
+        self.assertIn('time', get_css_classes(form.fields['time']))
+
+    def test_fields_decorated_on_iteration(self):
+        """Test that fields are decorated when the form is iterated over."""
+        form = LazyDynamicFieldForm()
+        form.visible_fields()
+        self.assertIn('time', get_css_classes(form.fields['time']))
+
+    def test_class_decorations_applied(self):
+        """Test that decorations of the form class's ``base_fields`` are
+        still applied."""
+        form = LazyFusedForm()
+        self.assertEqual(form.fields['email'].widget.attrs['required'],
+                         'required')
+
+    def test_validation_unchanged(self):
+        """Test that validation behaviour is the same as with eager
+        decoration."""
+        for data in [self.data, {}, dict(self.data, email='invalid')]:
+            eager, lazy = FusedForm(data=data), LazyFusedForm(data=data)
+            self.assertEqual(eager.is_valid(), lazy.is_valid())
+            self.assertEqual(eager.errors, lazy.errors)
+
+    def test_deferred_per_instance_rules_use_cleaned_data(self):
+        """Test that per-instance rules are applied with the cleaned data if
+        the form is cleaned before its fields are decorated."""
+        form = LazyFusedForm(data=self.data)
+        with timezone.override(pytz.utc):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.fields['datetime'].help_text, '')
+        self.assertEqual(form['datetime'].help_text, 'UTC')
+
+
+class TestCopyOnWrite(TestCase):
+
+    """Tests for copy-on-write fields of
+    :py:class:`thecut.forms.forms.DecoratedFieldsMixin` forms."""
+
+    def test_widget_attrs_shared_between_instances(self):
+        """Test that widget attributes are shared between form instances
+        until they are modified."""
+        first, second = CopyOnWriteForm(), CopyOnWriteForm()
+        self.assertIs(first.fields['name'].widget.attrs._data,
+                      second.fields['name'].widget.attrs._data)
+        first.fields['name'].widget.attrs['class'] = 'changed'
+        self.assertNotIn('class', second.fields['name'].widget.attrs)
+        self.assertNotIn('class',
+                         CopyOnWriteForm().fields['name'].widget.attrs)
+
+    def test_choices_shared_between_instances(self):
+        """Test that lists of choices are shared between form instances."""
+        first, second = CopyOnWriteForm(), CopyOnWriteForm()
+        self.assertIs(first.fields['choice'].choices,
+                      second.fields['choice'].choices)
+        first.fields['choice'].choices = [('a', 'A')]
+        self.assertEqual(len(second.fields['choice'].choices), 100)
+
+    def test_rendering_unchanged(self):
+        """Test that copy-on-write fields render as normal."""
+        form = CopyOnWriteForm(data={'choice': '1'})
+        self.assertIn('required', '{0}'.format(form['name']))
+        self.assertIn('<option value="1" selected>', '{0}'.format(
+            form['choice']))
+        self.assertIn('class="datetime"', '{0}'.format(form['split']))
+
+
+class TestFusedFormMixin(TestCase):
+
+    """Tests for the :py:class:`thecut.forms.forms.FusedFormMixin` class."""
+
+    def setUp(self):
+        self.form = FusedForm(initial={
+            'datetime': datetime(1990, 1, 1, 0, 0, 0, 0, pytz.utc)})
+
+    def test_applies_registered_rules(self):
+        """Test that the built-in rules are applied to the form's fields."""
+        fields = self.form.fields
+        self.assertEqual(fields['email'].widget.input_type, 'email')
+        self.assertEqual(fields['email'].widget.attrs['required'], 'required')
+        self.assertEqual(fields['email'].widget.attrs['placeholder'],
+                         'you@example.com')
+        self.assertEqual(fields['text'].widget.attrs['maxlength'], 50)
+        self.assertNotIn('required', fields['text'].widget.attrs)
+        self.assertNotIn('required', fields['radio'].widget.attrs)
+        self.assertIn('time', get_css_classes(fields['time']))
+        self.assertIn('date', get_css_classes(fields['date']))
+        self.assertIn('datetime', get_css_classes(fields['datetime']))
+
+    def test_applies_per_instance_rules_to_initial_data(self):
+        """Test that the timezone help text is set from the initial data."""
+        self.assertEqual(self.form.fields['datetime'].help_text, 'UTC')
+        self.assertEqual(FusedForm().fields['datetime'].help_text, '')
+
+    def test_applies_per_instance_rules_to_cleaned_data(self):
+        """Test that the timezone help text is set from the cleaned data."""
+        form = FusedForm(data={'email': 'a@example.com', 'time': '10:00',
+                               'date': '2000-01-01', 'radio': 'A',
+                               'datetime': '2000-01-01 10:00'})
+        with timezone.override(pytz.utc):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.fields['datetime'].help_text, 'UTC')
+
+    def test_applies_newly_registered_rules(self):
+        """Test that rules registered after the form class has been prepared
+        are applied to new form instances."""
+        class AutocompleteOffRule(rules.Rule):
+            def apply(self, form, name, field, data=None):
+                field.widget.attrs.update({'autocomplete': 'off'})
+
+        rules.register('autocomplete_off', AutocompleteOffRule())
+        try:
+            form = FusedForm()
+        finally:
+            rules.unregister('autocomplete_off')
+        self.assertEqual(form.fields['email'].widget.attrs['autocomplete'],
+                         'off')
+        self.assertEqual(form.fields['email'].widget.attrs['required'],
+                         'required')
+        self.assertNotIn('autocomplete',
+                         FusedForm().fields['email'].widget.attrs)
+
+    def test_rule_names_restricts_rules(self):
+        """Test that only the rules named in ``rule_names`` are applied."""
+        class RestrictedForm(FusedForm):
+            rule_names = ['date_class']
+
+        form = RestrictedForm()
+        self.assertIn('date', get_css_classes(form.fields['date']))
+        self.assertNotIn('required', form.fields['date'].widget.attrs)
+
+    def test_rules_are_cached_per_class_and_registry_version(self):
+        """Test that a field's rules are looked up in the registry once per
+        form class, until another rule is registered."""
+        class RestrictedForm(FusedForm):
+            rule_names = ['date_class']
+
+        field = RestrictedForm.base_fields['date']
+        rules_for = rules.registry.rules_for
+        with patch.object(rules.registry, 'rules_for',
+                          side_effect=rules_for) as mock_rules_for:
+            first = RestrictedForm._get_rules(field)
+            self.assertEqual(
+                RestrictedForm._get_rules(field, per_instance=True), ())
+            self.assertEqual(RestrictedForm._get_rules(field), first)
+            calls = mock_rules_for.call_count
+            rules.register('date_class', rules.registry['date_class'])
+            RestrictedForm._get_rules(field)
+        self.assertEqual(first, (rules.registry['date_class'],))
+        self.assertEqual(calls, 2)
+        self.assertEqual(mock_rules_for.call_count, 4)
+
+
 def get_css_classes(field):
     return field.widget.attrs.get('class', '').split()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+from mock import patch
+from test_app.forms import DecoratedFormSetRowForm, FormSetRowForm
+from thecut.forms.formsets import FormSetMixin, formset_factory
+from thecut.forms.rendering import iter_formset, render_formset
+from unittest import skipIf
+import django
+
+
+class TestFormSetMixin(TestCase):
+
+    """Tests for the :py:class:`thecut.forms.formsets.FormSetMixin`
+    class."""
+
+    def setUp(self):
+        self.formset_class = formset_factory(
+            DecoratedFormSetRowForm, extra=3, can_delete=True, can_order=True)
+
+    def test_formset_factory_uses_mixin(self):
+        """Test that :py:func:`thecut.forms.formsets.formset_factory` returns
+        a formset class using the mixin."""
+        self.assertTrue(issubclass(self.formset_class, FormSetMixin))
+        self.assertTrue(issubclass(self.formset_class, forms.BaseFormSet))
+
+    def test_form_class_decorated_once(self):
+        """Test that the form class's fields are decorated once, rather than
+        for each form in the formset."""
+        class RowForm(DecoratedFormSetRowForm):
+            pass
+        formset_class = formset_factory(RowForm, extra=3)
+        with patch.object(RowForm, 'decorate_field',
+                          wraps=RowForm.decorate_field) as mock_decorate:
+            formset = formset_class()
+            formset.forms
+        self.assertEqual(mock_decorate.call_count,
+                         len(RowForm.base_fields))
+        for form in formset:
+            self.assertIn('decorated',
+                          form.fields['name'].widget.attrs['class'])
+
+    def test_formset_fields_decorated(self):
+        """Test that fields added by the formset are decorated."""
+        for form in self.formset_class():
+            self.assertIn('decorated',
+                          form.fields['ORDER'].widget.attrs['class'])
+            self.assertIn('decorated',
+                          form.fields['DELETE'].widget.attrs['class'])
+
+    @skipIf(django.VERSION < (1, 10), 'Requires use_required_attribute.')
+    def test_required_attribute_not_set(self):
+        """Test that the HTML5 ``required`` attribute is not set on the
+        formset's forms, as Django's formsets construct them with
+        ``use_required_attribute=False``."""
+        formset = formset_factory(FormSetRowForm, extra=2)()
+        for form in formset:
+            self.assertTrue(form.fields['name'].required)
+            self.assertNotIn('required', form.fields['name'].widget.attrs)
+            self.assertNotIn('required', '{0}'.format(form['name']))
+        form = FormSetRowForm(use_required_attribute=False)
+        self.assertNotIn('required', form.fields['name'].widget.attrs)
+        self.assertEqual(FormSetRowForm().fields['name'].widget.attrs[
+            'required'], 'required')
+
+
+class FormSetRenderingParityMixin(object):
+
+    def setUp(self):
+        self.request = RequestFactory().get('/path/')
+        self.formset_class = formset_factory(FormSetRowForm, extra=2,
+                                             can_delete=True)
+
+    def get_formsets(self):
+        return [self.formset_class(),
+                self.formset_class(data={'form-TOTAL_FORMS': '1',
+                                         'form-INITIAL_FORMS': '0',
+                                         'form-0-date': 'invalid'})]
+
+    def assertRendersLikeTemplate(self, **options):
+        for formset in self.get_formsets():
+            context = dict(options, formset=formset, request=self.request,
+                           csrf_token='token')
+            expected = render_to_string('forms/_formset.html', context)
+            self.assertEqual(self.render(formset, context, **options),
+                             expected)
+
+    def test_default_options(self):
+        """Test rendering with the default options."""
+        self.assertRendersLikeTemplate()
+
+    def test_form_method_get(self):
+        """Test rendering with the ``GET`` method (and no CSRF token)."""
+        self.assertRendersLikeTemplate(form_method='GET',
+                                       form_action='/action/')
+
+    def test_input_submit(self):
+        """Test rendering with an ``input`` submit button."""
+        self.assertRendersLikeTemplate(input_submit=True,
+                                       form_submit_value='<Save>')
+
+
+class TestRenderFormSet(FormSetRenderingParityMixin, TestCase):
+
+    """Tests for :py:func:`thecut.forms.rendering.render_formset`, asserting
+    that its output is identical to the ``forms/_formset.html``
+    template."""
+
+    def render(self, formset, context, **options):
+        return render_formset(formset, request=self.request,
+                              csrf_token='token', **options)
+
+    def test_renders_in_chunks(self):
+        """Test that each form in the formset is rendered in a separate
+        chunk."""
+        chunks = list(iter_formset(self.formset_class(),
+                                   request=self.request))
+        self.assertEqual(len(chunks), 4)
+        self.assertIn('name="form-1-name"', chunks[2])
+
+
+class TestRenderFormSetTag(FormSetRenderingParityMixin, TestCase):
+
+    """Tests for the ``{% render_formset %}`` template tag, asserting that its
+    output is identical to the ``forms/_formset.html`` template."""
+
+    template = Template('{% load thecut_forms %}{% render_formset %}')
+
+    def render(self, formset, context, **options):
+        return self.template.render(Context(context))
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.test import TestCase
+from django.utils import translation
+from django.utils.safestring import SafeData
+from django.utils.text import slugify
+from mock import patch
+from test_app.forms import RenderingForm
+from thecut.forms import fragments
+from thecut.forms.fragments import get_field_fragments
+
+
+class TestGetFieldFragments(TestCase):
+
+    """Tests for :py:func:`thecut.forms.fragments.get_field_fragments`."""
+
+    def setUp(self):
+        fragments.fragment_cache.clear()
+        self.addCleanup(fragments.fragment_cache.clear)
+
+    def test_fragments(self):
+        field = RenderingForm()['email']
+        result = get_field_fragments(field)
+        self.assertEqual(result.css_class, 'email required type-email')
+        self.assertEqual(result.label_tag, field.label_tag())
+        self.assertEqual(result.help_text, '')
+
+    def test_fragments_are_pre_escaped(self):
+        result = get_field_fragments(RenderingForm()['name'])
+        for fragment in [result.css_class, result.label_tag,
+                         result.help_text]:
+            self.assertIsInstance(fragment, SafeData)
+        self.assertEqual(result.help_text,
+                         'Your &lt;b&gt;full&lt;/b&gt; name.')
+        self.assertEqual(result.raw_help_text, 'Your <b>full</b> name.')
+
+    def test_computed_once_per_form_class(self):
+        """Test the fragments are only computed once for each field of a form
+        class."""
+        with patch('thecut.forms.fragments.slugify',
+                   side_effect=slugify) as mock_slugify:
+            for _ in range(3):
+                for field in RenderingForm().visible_fields():
+                    get_field_fragments(field)
+        self.assertEqual(mock_slugify.call_count,
+                         len(RenderingForm().visible_fields()))
+
+    def test_computed_once_per_language(self):
+        field = RenderingForm()['name']
+        with translation.override('en'):
+            english = get_field_fragments(field)
+        with translation.override('fr'):
+            self.assertIsNot(get_field_fragments(field), english)
+        with translation.override('en'):
+            self.assertIs(get_field_fragments(field), english)
+
+    def test_changed_field(self):
+        """Test fields changed on a form instance get their own
+        fragments."""
+        form = RenderingForm()
+        form.fields['name'].required = False
+        form.fields['name'].label = 'Other'
+        result = get_field_fragments(form['name'])
+        self.assertEqual(result.css_class, 'name type-text')
+        self.assertIn('>Other:</label>', result.label_tag)
+        self.assertIsNot(get_field_fragments(RenderingForm()['name']),
+                         result)
+
+    def test_field_with_errors(self):
+        """Test the error CSS class is included for fields with errors."""
+        form = RenderingForm(data={})
+        result = get_field_fragments(form['name'])
+        self.assertEqual(set(result.css_class.split()),
+                         {'name', 'required', 'error', 'type-text'})
+        self.assertEqual(get_field_fragments(RenderingForm()['name'])
+                         .css_class, 'name required type-text')
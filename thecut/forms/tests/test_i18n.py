@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
+from django.utils import translation
+from django.utils.functional import lazy
+from mock import MagicMock
+from thecut.forms import i18n
+from thecut.forms.forms import FormMixin
+from thecut.forms.rendering import render_field
+from thecut.forms.utils import LanguageCachedText
+
+
+def make_lazy():
+    """Return a lazy string which translates to the active language's code,
+    and the mock counting how many times it has been translated."""
+    translate = MagicMock(side_effect=lambda: translation.get_language())
+    return lazy(translate, type(''))(), translate
+
+
+class TestTranslate(TestCase):
+
+    """Tests for :py:func:`thecut.forms.i18n.translate`."""
+
+    def setUp(self):
+        i18n.clear_translation_cache()
+        self.addCleanup(i18n.clear_translation_cache)
+
+    def test_translates_once_per_language(self):
+        value, translate = make_lazy()
+        for language in ['en', 'fr', 'en', 'fr']:
+            with translation.override(language):
+                self.assertEqual(
+                    i18n.translate(forms.Form, 'name', 'label', value),
+                    language)
+        self.assertEqual(translate.call_count, 2)
+
+    def test_returns_other_values_as_is(self):
+        self.assertEqual(i18n.translate(forms.Form, 'name', 'label', 'Name'),
+                         'Name')
+        self.assertIsNone(i18n.translate(forms.Form, 'name', 'label', None))
+
+    def test_different_lazy_string_for_same_field(self):
+        """Test the cache is not used for a different lazy string, e.g. one
+        set on a form instance's field."""
+        first, first_translate = make_lazy()
+        second, second_translate = make_lazy()
+        i18n.translate(forms.Form, 'name', 'label', first)
+        i18n.translate(forms.Form, 'name', 'label', second)
+        self.assertEqual(second_translate.call_count, 1)
+
+    def test_cache_is_bounded(self):
+        self.assertEqual(i18n.translation_cache.max_size, 5000)
+
+    def test_cleared_when_languages_change(self):
+        value, translate = make_lazy()
+        i18n.translate(forms.Form, 'name', 'label', value)
+        with override_settings(LANGUAGES=[('en', 'English')]):
+            self.assertEqual(len(i18n.translation_cache), 0)
+            i18n.translate(forms.Form, 'name', 'label', value)
+        self.assertEqual(translate.call_count, 2)
+
+    def test_cleared_when_translation_catalog_changes(self):
+        try:
+            from django.utils.autoreload import file_changed
+            from pathlib import Path
+        except ImportError:  # Django < 2.2
+            self.skipTest('file_changed signal is not available.')
+        value, translate = make_lazy()
+        i18n.translate(forms.Form, 'name', 'label', value)
+        file_changed.send(sender=None, file_path=Path('locale/fr/django.py'))
+        self.assertEqual(len(i18n.translation_cache), 1)
+        file_changed.send(sender=None, file_path=Path('locale/fr/django.mo'))
+        self.assertEqual(len(i18n.translation_cache), 0)
+
+
+class TestLanguageCachedText(TestCase):
+
+    """Tests for :py:class:`thecut.forms.utils.LanguageCachedText`."""
+
+    def test_invalidated_when_translations_reloaded(self):
+        value, translate = make_lazy()
+        text = LanguageCachedText(value)
+        '{0}'.format(text)
+        '{0}'.format(text)
+        i18n.clear_translation_cache()
+        self.assertEqual('{0}'.format(text), translation.get_language())
+        self.assertEqual(translate.call_count, 2)
+
+    def test_non_ascii_text(self):
+        text = LanguageCachedText(lazy(lambda: 'Prénom', type(''))())
+        self.assertEqual('{0}'.format(text), 'Prénom')
+        self.assertEqual(text, 'Prénom')
+        self.assertEqual(hash(text), hash('Prénom'))
+
+
+class TestRenderingTranslatedText(TestCase):
+
+    """Tests for rendering fields with lazily translated labels and help
+    texts."""
+
+    def setUp(self):
+        i18n.clear_translation_cache()
+        self.addCleanup(i18n.clear_translation_cache)
+        label, self.translate_label = make_lazy()
+        help_text, self.translate_help_text = make_lazy()
+
+        class TranslatedForm(FormMixin, forms.Form):
+
+            name = forms.CharField(label=label, help_text=help_text)
+
+        self.form_class = TranslatedForm
+
+    def test_template(self):
+        for language in ['en', 'fr', 'en', 'fr']:
+            with translation.override(language):
+                html = render_to_string('forms/_form_field.html', {
+                    'field': self.form_class()['name']})
+                self.assertIn('for="id_name">{0}'.format(language), html)
+                self.assertIn('<span class="helptext">{0}</span>'.format(
+                    language), html)
+        # Django's BoundField evaluates the help text when it is created.
+        self.assertEqual(self.translate_label.call_count, 2)
+
+    def test_python_renderer(self):
+        for language in ['en', 'fr', 'en', 'fr']:
+            with translation.override(language):
+                field = self.form_class()['name']
+                self.assertEqual(
+                    render_field(field),
+                    render_to_string('forms/_form_field.html',
+                                     {'field': field}))
+        # Django's BoundField evaluates the help text when it is created.
+        self.assertEqual(self.translate_label.call_count, 2)
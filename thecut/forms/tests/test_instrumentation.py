@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.apps import apps
+from django.template import Context, NodeList
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+from mock import MagicMock, patch
+from test_app.forms import DateTimeTimezoneForm, FusedForm, RenderingForm
+from thecut.forms import instrumentation
+from thecut.forms.forms import (DateTimeTimezoneMixin, DecoratedFieldsMixin,
+                                PlaceholderMixin)
+from thecut.forms.instrumentation import (Histogram, HistogramSink,
+                                          LoggingSink, StatsdSink)
+from thecut.forms.rendering import render_form
+from thecut.forms.settings import settings
+from thecut.forms.templatetags.thecut_forms import InstrumentedNode
+import os
+import subprocess
+import sys
+
+
+class InstrumentationTestMixin(object):
+
+    def setUp(self):
+        self.calls = []
+        patcher = patch.object(instrumentation, 'enabled', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for signal in [instrumentation.form_initialised,
+                       instrumentation.form_rendered]:
+            signal.connect(self.receiver)
+            self.addCleanup(signal.disconnect, self.receiver)
+
+    def receiver(self, sender, **kwargs):
+        self.calls.append(dict(kwargs, sender=sender))
+
+
+class TestFormInitialisedSignal(InstrumentationTestMixin, TestCase):
+
+    """Tests for :py:data:`thecut.forms.instrumentation.form_initialised`."""
+
+    def test_sent_for_each_mixin(self):
+        form = RenderingForm()
+        self.assertEqual([call['mixin'] for call in self.calls],
+                         [DecoratedFieldsMixin, PlaceholderMixin])
+        for call in self.calls:
+            self.assertIs(call['sender'], RenderingForm)
+            self.assertIs(call['form'], form)
+            self.assertEqual(call['field_count'], len(form.fields))
+            self.assertGreaterEqual(call['elapsed_ns'], 0)
+
+    def test_sent_for_datetime_timezone_mixin(self):
+        DateTimeTimezoneForm()
+        self.assertEqual([call['mixin'] for call in self.calls],
+                         [DateTimeTimezoneMixin])
+
+    def test_not_sent_when_disabled(self):
+        with patch.object(instrumentation, 'enabled', False):
+            FusedForm()
+        self.assertEqual(self.calls, [])
+
+
+class TestFormRenderedSignal(InstrumentationTestMixin, TestCase):
+
+    """Tests for :py:data:`thecut.forms.instrumentation.form_rendered`."""
+
+    def test_sent_when_rendering_template(self):
+        form = RenderingForm()
+        del self.calls[:]
+        render_to_string('forms/_form.html', {
+            'form': form, 'request': RequestFactory().get('/'),
+            'csrf_token': 'token'})
+        self.assertEqual(len(self.calls), 1)
+        self.assertIs(self.calls[0]['form'], form)
+        self.assertEqual(self.calls[0]['template_name'], 'forms/_form.html')
+        self.assertEqual(self.calls[0]['field_count'], len(form.fields))
+
+    def test_sent_when_rendering_in_python(self):
+        form = RenderingForm()
+        del self.calls[:]
+        render_form(form, form_action='/', csrf_token='token')
+        self.assertEqual(len(self.calls), 1)
+        self.assertIs(self.calls[0]['sender'], RenderingForm)
+        self.assertIsNone(self.calls[0]['template_name'])
+
+    def test_sent_without_template_origin(self):
+        """Test the signal is sent for nodes without an origin (as on Django
+        < 1.9)."""
+        form = RenderingForm()
+        del self.calls[:]
+        node = InstrumentedNode(NodeList(), MagicMock())
+        node.form.resolve.return_value = form
+        node.render(Context())
+        self.assertEqual(len(self.calls), 1)
+        self.assertIsNone(self.calls[0]['template_name'])
+
+    def test_template_output_is_unchanged(self):
+        form = RenderingForm()
+        context = {'form': form, 'request': RequestFactory().get('/'),
+                   'csrf_token': 'token'}
+        output = render_to_string('forms/_form.html', context)
+        with patch.object(instrumentation, 'enabled', False):
+            self.assertEqual(render_to_string('forms/_form.html', context),
+                             output)
+
+
+class TestHistogram(TestCase):
+
+    """Tests for :py:class:`thecut.forms.instrumentation.Histogram`."""
+
+    def test_aggregates_values(self):
+        histogram = Histogram()
+        for value in [100, 200, 300, 5000]:
+            histogram.add(value)
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.min, 100)
+        self.assertEqual(histogram.max, 5000)
+        self.assertEqual(histogram.mean, 1400)
+        self.assertEqual(histogram.buckets, {128: 1, 256: 1, 512: 1,
+                                             8192: 1})
+
+    def test_percentile(self):
+        histogram = Histogram()
+        for value in range(1, 101):
+            histogram.add(value)
+        self.assertEqual(histogram.percentile(50), 64)
+        self.assertEqual(histogram.percentile(100), 100)
+
+    def test_empty(self):
+        histogram = Histogram()
+        self.assertIsNone(histogram.mean)
+        self.assertIsNone(histogram.percentile(50))
+
+
+class TestSinks(TestCase):
+
+    """Tests for the instrumentation sinks."""
+
+    def setUp(self):
+        patcher = patch.object(instrumentation, 'enabled', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_histogram_sink(self):
+        sink = HistogramSink()
+        sink.connect()
+        self.addCleanup(sink.disconnect)
+        self.assertTrue(instrumentation.enabled)
+        RenderingForm()
+        RenderingForm()
+        name = ('thecut.forms.init.test_app.forms.RenderingForm.'
+                'PlaceholderMixin')
+        self.assertEqual(sink.snapshot()[name]['count'], 2)
+        sink.reset()
+        self.assertEqual(sink.snapshot(), {})
+
+    def test_disconnect_disables_instrumentation(self):
+        sink = HistogramSink()
+        sink.connect()
+        sink.disconnect()
+        self.assertFalse(instrumentation.enabled)
+        RenderingForm()
+        self.assertEqual(sink.snapshot(), {})
+
+    def test_statsd_sink(self):
+        client = MagicMock()
+        sink = StatsdSink(client, prefix='forms')
+        sink.connect()
+        self.addCleanup(sink.disconnect)
+        render_form(RenderingForm(), form_action='/', csrf_token='token')
+        self.assertEqual(client.timing.call_count, 3)
+        name, milliseconds = client.timing.call_args[0]
+        self.assertEqual(name, 'forms.render.test_app.forms.RenderingForm')
+        self.assertGreaterEqual(milliseconds, 0)
+
+    def test_logging_sink(self):
+        logger = MagicMock()
+        sink = LoggingSink(logger=logger)
+        sink.connect()
+        self.addCleanup(sink.disconnect)
+        RenderingForm()
+        self.assertEqual(logger.log.call_count, 2)
+
+
+class TestSettings(TestCase):
+
+    """Tests for the ``THECUT_FORMS_INSTRUMENTATION`` setting."""
+
+    def test_enabled_when_app_is_ready(self):
+        app_config = apps.get_app_config('forms')
+        with patch.object(instrumentation, 'enabled', False):
+            app_config.ready()
+            self.assertFalse(instrumentation.enabled)
+            with patch.object(settings, 'INSTRUMENTATION', True):
+                app_config.ready()
+            self.assertTrue(instrumentation.enabled)
+
+    def test_importable_without_settings(self):
+        """Test the forms can be imported before Django's settings are
+        configured."""
+        env = dict(os.environ)
+        env.pop('DJANGO_SETTINGS_MODULE', None)
+        process = subprocess.Popen(
+            [sys.executable, '-c', 'import thecut.forms.forms'], env=env,
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(
+                os.path.dirname(os.path.abspath(__file__))))),
+            stderr=subprocess.PIPE)
+        stderr = process.communicate()[1]
+        self.assertEqual(process.returncode, 0, stderr)
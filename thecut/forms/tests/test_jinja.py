@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.template.loader import render_to_string
+from django.test import TestCase
+from test_app.forms import RenderingForm
+from thecut.forms.tests.test_rendering import RenderingParityMixin
+from unittest import skipIf
+
+try:
+    import jinja2
+except ImportError:
+    jinja2 = None
+
+
+def get_engine():
+    from django.template.backends.jinja2 import Jinja2
+    return Jinja2({
+        'NAME': 'jinja2', 'DIRS': [], 'APP_DIRS': True,
+        'OPTIONS': {'extensions': ['thecut.forms.jinja.FormsExtension']}})
+
+
+@skipIf(jinja2 is None, 'Jinja2 is not installed.')
+class TestJinja2FormTemplate(RenderingParityMixin, TestCase):
+
+    """Tests for the ``forms/_form.html`` Jinja2 template, asserting that its
+    output is identical to the Django template."""
+
+    def render(self, form, context, **options):
+        return get_engine().get_template('forms/_form.html').render(context)
+
+
+@skipIf(jinja2 is None, 'Jinja2 is not installed.')
+class TestJinja2RenderForm(RenderingParityMixin, TestCase):
+
+    """Tests for the ``render_form`` Jinja2 global, asserting that its output
+    is identical to the ``forms/_form.html`` Django template."""
+
+    def render(self, form, context, **options):
+        return get_engine().from_string('{{ render_form(form) }}').render(
+            context)
+
+    def test_options_as_arguments(self):
+        form = RenderingForm()
+        context = {'form': form, 'request': self.request,
+                   'csrf_token': 'token'}
+        self.assertEqual(
+            get_engine().from_string(
+                '{{ render_form(form, form_method="GET") }}').render(context),
+            render_to_string('forms/_form.html',
+                             dict(context, form_method='GET')))
+
+
+@skipIf(jinja2 is None, 'Jinja2 is not installed.')
+class TestJinja2FieldTemplates(TestCase):
+
+    """Tests for the ``forms/_form_fields.html`` and
+    ``forms/_form_field.html`` Jinja2 templates."""
+
+    def get_forms(self):
+        return [RenderingForm(),
+                RenderingForm(data={'name': '<b>Jane</b>',
+                                    'email': 'not-an-email'})]
+
+    def test_form_fields(self):
+        for form in self.get_forms():
+            for safe_help_text in [False, True]:
+                context = {'form': form, 'safe_help_text': safe_help_text}
+                self.assertEqual(
+                    get_engine().get_template(
+                        'forms/_form_fields.html').render(context),
+                    render_to_string('forms/_form_fields.html', context))
+
+    def test_form_field(self):
+        for form in self.get_forms():
+            for field in form.visible_fields():
+                context = {'field': field}
+                self.assertEqual(
+                    get_engine().get_template(
+                        'forms/_form_field.html').render(context),
+                    render_to_string('forms/_form_field.html', context))
+
+
+@skipIf(jinja2 is None, 'Jinja2 is not installed.')
+class TestEnvironment(TestCase):
+
+    """Tests for :py:func:`thecut.forms.jinja.environment`."""
+
+    def test_adds_extension(self):
+        from thecut.forms.jinja import environment
+        env = environment(extensions=['jinja2.ext.do'])
+        self.assertIn('render_form', env.globals)
+        self.assertIn('jinja2.ext.ExprStmtExtension', env.extensions)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.test import TestCase
+from unittest import skipIf
+import os
+import subprocess
+import sys
+import thecut.forms
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))))
+
+# The maximum time (in microseconds) to import the package itself.
+IMPORT_TIME_BUDGET = 20000
+
+
+def run_python(*args):
+    """Run Python (without Django configured) in the repository root,
+    returning its stdout and stderr."""
+    env = dict(os.environ)
+    env.pop('DJANGO_SETTINGS_MODULE', None)
+    env['PYTHONPATH'] = ROOT
+    process = subprocess.Popen(
+        [sys.executable] + list(args), cwd=ROOT, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    stdout, stderr = process.communicate()
+    if process.returncode:
+        raise AssertionError(stderr)
+    return stdout, stderr
+
+
+@skipIf(sys.version_info < (3, 7), 'Module __getattr__ requires Python 3.7.')
+class TestLazyImport(TestCase):
+
+    """Tests for lazy imports from the :py:mod:`thecut.forms` package."""
+
+    def test_exports(self):
+        for name, module_name in thecut.forms._exports.items():
+            module = __import__('thecut.forms.{0}'.format(module_name),
+                                fromlist=[name])
+            self.assertIs(getattr(thecut.forms, name),
+                          getattr(module, name))
+
+    def test_from_import(self):
+        from thecut.forms import FormMixin, forms
+        self.assertIs(FormMixin, forms.FormMixin)
+
+    def test_submodule_attribute(self):
+        from thecut.forms import rules
+        self.assertIs(thecut.forms.rules, rules)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            thecut.forms.NotAMixin
+        with self.assertRaises(ImportError):
+            from thecut.forms import NotAMixin  # NOQA
+
+    def test_dir(self):
+        self.assertIn('FormMixin', dir(thecut.forms))
+        self.assertIn('__version__', dir(thecut.forms))
+
+    def test_does_not_import_django(self):
+        stdout, stderr = run_python('-c', (
+            'import sys, thecut.forms; print(thecut.forms.__version__); '
+            'print(sorted(name for name in sys.modules '
+            'if name.startswith(("django", "thecut.forms."))))'))
+        self.assertEqual(stdout.split('\n')[:2],
+                         [thecut.forms.__version__, '[]'])
+
+    def test_import_time_budget(self):
+        """Test the time to import the package (excluding its ``thecut``
+        namespace package, which is imported first) is within budget."""
+        stdout, stderr = run_python('-X', 'importtime', '-c',
+                                    'import thecut.forms')
+        cumulative = {}
+        for line in stderr.splitlines():
+            # e.g. "import time:  self [us] | cumulative | thecut.forms"
+            self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+            if cumulative_us.strip().isdigit():
+                cumulative[name.strip()] = int(cumulative_us)
+        self.assertLess(cumulative['thecut.forms'] - cumulative['thecut'],
+                        IMPORT_TIME_BUDGET)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from datetime import date, datetime, time
+from django import forms
+from django.test import RequestFactory, TestCase
+from django.utils.functional import cached_property
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy
+from mock import patch
+from test_app.forms import FusedForm, RenderingForm
+from thecut.forms.rendering import render_form
+from unittest import skipIf
+
+try:
+    from django.forms import renderers
+    from thecut.forms.renderers import DJANGO_TEMPLATES_DIR, DjangoTemplates
+except ImportError:  # Django < 1.11
+    renderers = None
+
+
+CHOICES = [('', '---'), ('a', 'A & B'), (1, 2), ('Group "1"', [
+    ('b', gettext_lazy('Bee')), ('<c>', mark_safe('<em>C</em>'))])]
+
+WIDGETS = [
+    (forms.TextInput(), ['', None, 'a "quoted" <value> & more',
+                         mark_safe('<b>safe</b>'), 1]),
+    (forms.TextInput(attrs={'class': 'a b', 'required': True,
+                            'disabled': False, 'maxlength': 10,
+                            'data-x': '"y"'}), ['value']),
+    (forms.EmailInput(attrs={'placeholder': 'Email & co.'}),
+     ['jane@example.com', None]),
+    (forms.Textarea(), ['', None, 'Line 1\nLine <2>',
+                        mark_safe('<b>safe</b>')]),
+    (forms.DateInput(), [None, date(2016, 1, 1), '2016-01-01']),
+    (forms.TimeInput(attrs={'class': 'time'}), [None, time(10, 30)]),
+    (forms.DateTimeInput(), [None, datetime(2016, 1, 1, 12)]),
+    (forms.Select(choices=CHOICES), [None, '', 'a', '1', '<c>', 'b']),
+    (forms.Select(choices=CHOICES, attrs={'class': 'select'}), ['b']),
+    (forms.SelectMultiple(choices=CHOICES), [['a', 'b'], []]),
+    (forms.CheckboxInput(), [None, True, False, '', 'on']),
+    (forms.HiddenInput(), [None, 'hidden & "value"']),
+    (forms.NumberInput(), [None, 10]),
+]
+
+
+def get_overriding_renderer(templates):
+    """Return a renderer whose templates override Django's templates."""
+    class OverridingRenderer(DjangoTemplates):
+
+        @cached_property
+        def engine(self):
+            return self.backend({
+                'APP_DIRS': False, 'DIRS': [DJANGO_TEMPLATES_DIR],
+                'NAME': 'overrides', 'OPTIONS': {'loaders': [
+                    ('django.template.loaders.locmem.Loader', templates),
+                    'django.template.loaders.filesystem.Loader']}})
+
+    return OverridingRenderer()
+
+
+@skipIf(renderers is None, 'Form renderers require Django 1.11 or later.')
+class TestDjangoTemplates(TestCase):
+
+    """Tests for :py:class:`thecut.forms.renderers.DjangoTemplates`."""
+
+    def setUp(self):
+        self.renderer = DjangoTemplates()
+        self.template_renderer = renderers.DjangoTemplates()
+
+    def test_widget_parity(self):
+        """Test widgets are rendered identically to Django's templates."""
+        for widget, values in WIDGETS:
+            for value in values:
+                with self.subTest(widget=widget, value=value):
+                    self.assertEqual(
+                        widget.render('name', value, attrs={'id': 'id_name'},
+                                      renderer=self.renderer),
+                        widget.render('name', value, attrs={'id': 'id_name'},
+                                      renderer=self.template_renderer))
+
+    def test_common_widgets_do_not_use_templates(self):
+        # Templates are resolved once (to check they aren't overridden).
+        for widget, values in WIDGETS:
+            widget.render('name', None, renderer=self.renderer)
+        with patch.object(renderers.DjangoTemplates, 'get_template') as mock:
+            for widget, values in WIDGETS:
+                for value in values:
+                    widget.render('name', value, renderer=self.renderer)
+        self.assertEqual(
+            [call[0][0] for call in mock.call_args_list],
+            ['django/forms/widgets/number.html'] * 2)
+
+    def test_other_widgets_use_templates(self):
+        widget = forms.RadioSelect(choices=CHOICES)
+        self.assertEqual(
+            widget.render('name', 'a', renderer=self.renderer),
+            widget.render('name', 'a', renderer=self.template_renderer))
+
+    def test_overridden_templates_are_used(self):
+        renderer = get_overriding_renderer({
+            'django/forms/widgets/text.html': '<text>'})
+        self.assertEqual(forms.TextInput().render('name', 'a',
+                                                  renderer=renderer),
+                         '<text>')
+        with patch.object(renderers.DjangoTemplates, 'render') as mock:
+            forms.EmailInput().render('name', 'a', renderer=renderer)
+        self.assertFalse(mock.called)
+
+    def test_overridden_included_templates_are_used(self):
+        renderer = get_overriding_renderer({
+            'django/forms/widgets/attrs.html': ' data-overridden'})
+        for widget, values in WIDGETS:
+            with self.subTest(widget=widget):
+                self.assertIn('data-overridden', widget.render(
+                    'name', values[0], renderer=renderer))
+
+    def test_custom_option_template_uses_template(self):
+        widget = forms.Select(choices=CHOICES)
+        widget.option_template_name = 'django/forms/widgets/input_option.html'
+        self.assertEqual(
+            widget.render('name', 'a', renderer=self.renderer),
+            widget.render('name', 'a', renderer=self.template_renderer))
+
+    def test_callable_attrs_use_template(self):
+        widget = forms.TextInput(attrs={'data-x': lambda: 'called'})
+        output = widget.render('name', 'a', renderer=self.renderer)
+        self.assertIn('data-x="called"', output)
+        self.assertEqual(output, widget.render(
+            'name', 'a', renderer=self.template_renderer))
+
+    def test_form_parity(self):
+        """Test forms decorated by the mixins are rendered identically."""
+        request = RequestFactory().get('/')
+        for form_class in [RenderingForm, FusedForm]:
+            for data in [None, {'email': 'not an email', 'name': '<b>'}]:
+                form = form_class(data=data, renderer=self.renderer)
+                template_form = form_class(data=data,
+                                           renderer=self.template_renderer)
+                self.assertEqual(
+                    render_form(form, request=request, csrf_token='token'),
+                    render_form(template_form, request=request,
+                                csrf_token='token'))
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.http import StreamingHttpResponse
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+from django.utils import translation
+from mock import patch
+from test_app.forms import MultipartRenderingForm, RenderingForm
+from thecut.forms import rendering
+from thecut.forms.cache import TieredCache
+from thecut.forms.rendering import (get_field_cache_key, get_form_cache_key,
+                                    iter_form, render_form)
+
+
+class RenderingParityMixin(object):
+
+    def setUp(self):
+        self.request = RequestFactory().get('/path/"<with>"/')
+
+    def get_forms(self):
+        return [RenderingForm(),
+                RenderingForm(data={'name': '<b>Jane</b>',
+                                    'email': 'not-an-email'}),
+                MultipartRenderingForm()]
+
+    def assertRendersLikeTemplate(self, **options):
+        for form in self.get_forms():
+            context = dict(options, form=form, request=self.request,
+                           csrf_token='token')
+            expected = render_to_string('forms/_form.html', context)
+            self.assertEqual(self.render(form, context, **options), expected)
+
+    def test_default_options(self):
+        """Test rendering with the default options."""
+        self.assertRendersLikeTemplate()
+
+    def test_form_action(self):
+        """Test rendering with a custom ``form_action``."""
+        self.assertRendersLikeTemplate(form_action='/action/?a=1&b="2"')
+
+    def test_form_method_get(self):
+        """Test rendering with the ``GET`` method (and no CSRF token)."""
+        self.assertRendersLikeTemplate(form_method='GET')
+
+    def test_form_submit_value(self):
+        """Test rendering with a custom ``form_submit_value``."""
+        self.assertRendersLikeTemplate(form_submit_value='<Send>')
+
+    def test_input_submit(self):
+        """Test rendering with an ``input`` submit button."""
+        self.assertRendersLikeTemplate(input_submit=True,
+                                       form_submit_value='Go')
+
+    def test_safe_help_text(self):
+        """Test rendering without escaping help text."""
+        self.assertRendersLikeTemplate(safe_help_text=True)
+
+
+class TestRenderForm(RenderingParityMixin, TestCase):
+
+    """Tests for :py:func:`thecut.forms.rendering.render_form`, asserting
+    that its output is identical to the ``forms/_form.html`` template."""
+
+    def render(self, form, context, **options):
+        return render_form(form, request=self.request, csrf_token='token',
+                           **options)
+
+    def test_form_action_or_request_required(self):
+        """Test that a ``ValueError`` is raised if neither a request nor a
+        ``form_action`` are provided."""
+        with self.assertRaises(ValueError):
+            render_form(RenderingForm())
+        self.assertTrue(render_form(RenderingForm(), form_action='/',
+                                    csrf_token='token'))
+
+    def test_csrf_token_from_request(self):
+        """Test that the CSRF token is taken from the request if it is not
+        provided."""
+        output = render_form(RenderingForm(), request=self.request)
+        # Django < 2.0 renders the CSRF token input with single quotes
+        self.assertIn('name="csrfmiddlewaretoken"', output.replace("'", '"'))
+
+
+class TestIterForm(RenderingParityMixin, TestCase):
+
+    """Tests for :py:func:`thecut.forms.rendering.iter_form`, asserting that
+    its output is identical to the ``forms/_form.html`` template."""
+
+    def render(self, form, context, **options):
+        return ''.join(iter_form(form, request=self.request,
+                                 csrf_token='token', **options))
+
+    def test_renders_in_chunks(self):
+        """Test that each visible field is rendered in a separate chunk."""
+        chunks = list(iter_form(RenderingForm(), request=self.request))
+        # Start of form, 5 visible fields, closing newline, end of form.
+        self.assertEqual(len(chunks), 8)
+        self.assertIn('name="name"', chunks[1])
+
+    def test_renders_lazily(self):
+        """Test that fields are only rendered as the iterator is
+        consumed."""
+        form = RenderingForm()
+        with patch.object(rendering, 'render_field',
+                          wraps=rendering.render_field) as mock_render_field:
+            chunks = iter_form(form, request=self.request)
+            next(chunks)
+            self.assertFalse(mock_render_field.called)
+            next(chunks)
+            self.assertEqual(mock_render_field.call_count, 1)
+
+    def test_form_action_or_request_required(self):
+        """Test that a ``ValueError`` is raised immediately if neither a
+        request nor a ``form_action`` are provided."""
+        with self.assertRaises(ValueError):
+            iter_form(RenderingForm())
+
+    def test_streaming_http_response(self):
+        """Test that the iterator can be used as the content of a
+        :py:class:`~django.http.StreamingHttpResponse`."""
+        form = RenderingForm()
+        response = StreamingHttpResponse(
+            iter_form(form, request=self.request, csrf_token='token'))
+        self.assertEqual(
+            b''.join(response.streaming_content).decode('utf-8'),
+            render_form(form, request=self.request, csrf_token='token'))
+
+
+class TestRenderFormTag(RenderingParityMixin, TestCase):
+
+    """Tests for the ``{% render_form %}`` template tag, asserting that its
+    output is identical to the ``forms/_form.html`` template."""
+
+    template = Template('{% load thecut_forms %}{% render_form %}')
+
+    def render(self, form, context, **options):
+        return self.template.render(Context(context))
+
+    def test_form_argument(self):
+        """Test that the form can be passed to the tag."""
+        form = RenderingForm()
+        template = Template('{% load thecut_forms %}'
+                            '{% render_form my_form form_method="GET" %}')
+        context = {'form': form, 'request': self.request}
+        expected = render_to_string(
+            'forms/_form.html', dict(context, form_method='GET'))
+        self.assertEqual(
+            template.render(Context({'my_form': form,
+                                     'request': self.request})),
+            expected)
+
+
+class TestRenderFormFragmentCache(RenderingParityMixin, TestCase):
+
+    """Tests for :py:func:`thecut.forms.rendering.render_form` with a
+    fragment cache, asserting that its output is identical to the
+    ``forms/_form.html`` template."""
+
+    def render(self, form, context, **options):
+        cache = TieredCache('test')
+        # Render twice, so that the second render is from the cache.
+        render_form(form, request=self.request, csrf_token='token',
+                    fragment_cache=cache, **options)
+        return render_form(form, request=self.request, csrf_token='token',
+                           fragment_cache=cache, **options)
+
+    def test_unbound_form_fields_rendered_from_cache(self):
+        """Test that the fields of an unbound form are only rendered once."""
+        cache = TieredCache('test')
+        render_form(RenderingForm(), request=self.request,
+                    fragment_cache=cache)
+        form = RenderingForm()
+        with patch.object(type(form['name']), 'label_tag') as mock_label_tag:
+            render_form(form, request=self.request, fragment_cache=cache)
+        self.assertFalse(mock_label_tag.called)
+
+    def test_bound_form_fields_not_cached(self):
+        """Test that the fields of a bound form are not cached."""
+        cache = TieredCache('test')
+        render_form(RenderingForm(data={}), request=self.request,
+                    fragment_cache=cache)
+        self.assertEqual(len(cache.local), 0)
+
+    def test_default_fragment_cache(self):
+        """Test that the default fragment cache is used if
+        ``fragment_cache`` is ``True``."""
+        cache = TieredCache('test')
+        with patch.object(rendering, 'get_fragment_cache',
+                          return_value=cache):
+            render_form(RenderingForm(), request=self.request,
+                        fragment_cache=True)
+        self.assertEqual(len(cache.local), 5)
+
+
+class TestRenderFormFormCache(RenderingParityMixin, TestCase):
+
+    """Tests for :py:func:`thecut.forms.rendering.render_form` with a form
+    cache, asserting that its output is identical to the
+    ``forms/_form.html`` template."""
+
+    def render(self, form, context, **options):
+        cache = TieredCache('test')
+        # Render twice, so that the second render is from the cache.
+        render_form(form, request=self.request, csrf_token='other',
+                    form_cache=cache, **options)
+        return render_form(form, request=self.request, csrf_token='token',
+                           form_cache=cache, **options)
+
+    def test_unbound_form_rendered_from_cache(self):
+        cache = TieredCache('test')
+        render_form(RenderingForm(), request=self.request, form_cache=cache)
+        with patch.object(rendering, '_iter_form') as mock_iter_form:
+            output = render_form(RenderingForm(), request=self.request,
+                                 csrf_token='token', form_cache=cache)
+        self.assertFalse(mock_iter_form.called)
+        self.assertEqual(len(cache.local), 1)
+        # Django < 2.0 renders the CSRF token input with single quotes
+        self.assertIn('name="csrfmiddlewaretoken" value="token"',
+                      output.replace("'", '"'))
+        self.assertNotIn(rendering.CSRF_PLACEHOLDER, output)
+
+    def test_csrf_token_from_request(self):
+        cache = TieredCache('test')
+        for token in ['first', 'second']:
+            with patch.object(rendering, 'csrf',
+                              return_value={'csrf_token': token}):
+                output = render_form(RenderingForm(), request=self.request,
+                                     form_cache=cache)
+        self.assertEqual(len(cache.local), 1)
+        self.assertIn('value="second"', output.replace("'", '"'))
+
+    def test_honeypot_rendered_per_request(self):
+        cache = TieredCache('test')
+        with patch.object(rendering, 'render_honeypot',
+                          side_effect=['<one>', '<two>']):
+            for expected in ['<one>', '<two>']:
+                output = render_form(
+                    RenderingForm(), request=self.request, csrf_token='token',
+                    form_honeypot_field='honey', form_cache=cache)
+                self.assertIn(expected, output)
+        self.assertNotIn(rendering.HONEYPOT_PLACEHOLDER, output)
+
+    def test_bound_form_not_cached(self):
+        cache = TieredCache('test')
+        render_form(RenderingForm(data={}), request=self.request,
+                    form_cache=cache)
+        self.assertEqual(len(cache.local), 0)
+
+    def test_default_form_cache(self):
+        """Test that the default cache is used if ``form_cache`` is
+        ``True``."""
+        cache = TieredCache('test')
+        with patch.object(rendering, 'get_fragment_cache',
+                          return_value=cache):
+            render_form(RenderingForm(), request=self.request,
+                        form_cache=True)
+        self.assertEqual(len(cache.local), 1)
+
+    def test_template_tag(self):
+        cache = TieredCache('test')
+        template = Template('{% load thecut_forms %}'
+                            '{% render_form form_cache=cache %}')
+        context = {'form': RenderingForm(), 'request': self.request,
+                   'csrf_token': 'token', 'cache': cache}
+        output = template.render(Context(context))
+        self.assertEqual(template.render(Context(context)), output)
+        self.assertEqual(output, render_to_string('forms/_form.html',
+                                                  context))
+        self.assertEqual(len(cache.local), 1)
+
+
+class TestGetFormCacheKey(TestCase):
+
+    """Tests for :py:func:`thecut.forms.rendering.get_form_cache_key`."""
+
+    def test_key_depends_on_initial_data(self):
+        self.assertNotEqual(
+            get_form_cache_key(RenderingForm(), '/'),
+            get_form_cache_key(RenderingForm(initial={'name': 'a'}), '/'))
+
+    def test_key_depends_on_options(self):
+        form = RenderingForm()
+        keys = set([get_form_cache_key(form, '/'),
+                    get_form_cache_key(form, '/other/'),
+                    get_form_cache_key(form, '/', form_method='GET'),
+                    get_form_cache_key(form, '/', form_submit_value='Go')])
+        self.assertEqual(len(keys), 4)
+
+    def test_key_depends_on_form_class(self):
+        self.assertNotEqual(get_form_cache_key(RenderingForm(), '/'),
+                            get_form_cache_key(MultipartRenderingForm(), '/'))
+
+    def test_key_depends_on_language(self):
+        with translation.override('en'):
+            key = get_form_cache_key(RenderingForm(), '/')
+        with translation.override('fr'):
+            self.assertNotEqual(get_form_cache_key(RenderingForm(), '/'),
+                                key)
+
+    def test_no_key_for_bound_form(self):
+        self.assertIsNone(get_form_cache_key(RenderingForm(data={}), '/'))
+
+
+class TestGetFieldCacheKey(TestCase):
+
+    """Tests for :py:func:`thecut.forms.rendering.get_field_cache_key`."""
+
+    def test_key_depends_on_initial_value(self):
+        self.assertNotEqual(
+            get_field_cache_key(RenderingForm()['name']),
+            get_field_cache_key(RenderingForm(initial={'name': 'a'})['name']))
+
+    def test_key_depends_on_widget_attrs(self):
+        form = RenderingForm()
+        key = get_field_cache_key(form['name'])
+        form.fields['name'].widget.attrs['class'] = 'other'
+        self.assertNotEqual(get_field_cache_key(form['name']), key)
+
+    def test_key_depends_on_language(self):
+        with translation.override('en'):
+            key = get_field_cache_key(RenderingForm()['name'])
+        with translation.override('fr'):
+            self.assertNotEqual(get_field_cache_key(RenderingForm()['name']),
+                                key)
+
+    def test_key_depends_on_prefix(self):
+        self.assertNotEqual(
+            get_field_cache_key(RenderingForm()['name']),
+            get_field_cache_key(RenderingForm(prefix='other')['name']))
+
+    def test_no_key_for_bound_form(self):
+        self.assertIsNone(get_field_cache_key(RenderingForm(data={})['name']))
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from datetime import datetime
+from django import forms
+from django.test import TestCase
+from mock import patch
+from thecut.forms import rules
+import pytz
+
+
+class TestRule(TestCase):
+
+    """Tests for the :py:class:`thecut.forms.rules.Rule` class."""
+
+    def test_matches_field_and_widget_classes(self):
+        """Test that a rule matches subclasses of its field and widget
+        classes."""
+        rule = rules.Rule()
+        rule.field_classes = (forms.CharField,)
+        rule.widget_classes = (forms.TextInput,)
+        self.assertTrue(rule.matches(forms.SlugField, forms.TextInput))
+        self.assertFalse(rule.matches(forms.DateField, forms.DateInput))
+        self.assertFalse(rule.matches(forms.CharField, forms.Textarea))
+
+    def test_does_not_match_excluded_widget_classes(self):
+        """Test that a rule does not match its excluded widget classes."""
+        self.assertTrue(rules.required.matches(forms.ChoiceField,
+                                               forms.Select))
+        self.assertFalse(rules.required.matches(forms.ChoiceField,
+                                                forms.RadioSelect))
+
+    def test_decorate_only_applies_to_matching_fields(self):
+        """Test that :py:meth:`thecut.forms.rules.Rule.decorate` only
+        applies the rule to matching fields."""
+        date_field = forms.DateField()
+        other_field = forms.CharField()
+        rules.date_class.decorate(None, 'date', date_field)
+        rules.date_class.decorate(None, 'other', other_field)
+        self.assertEqual(date_field.widget.attrs['class'], 'date')
+        self.assertNotIn('class', other_field.widget.attrs)
+
+
+class TestTimezoneHelpTextRule(TestCase):
+
+    """Tests for the :py:class:`thecut.forms.rules.TimezoneHelpTextRule`
+    class."""
+
+    def test_sets_help_text_to_timezone_name(self):
+        """Test that the field's ``help_text`` is set to the name of the
+        timezone of the field's data."""
+        field = forms.DateTimeField()
+        rules.timezone_help_text.decorate(
+            None, 'when', field,
+            data={'when': datetime(1990, 1, 1, 0, 0, 0, 0, pytz.utc)})
+        self.assertEqual(field.help_text, 'UTC')
+
+    def test_no_help_text_without_data(self):
+        """Test that the field's ``help_text`` is unchanged if there is no
+        data for the field."""
+        field = forms.DateTimeField(help_text='foo')
+        rules.timezone_help_text.decorate(None, 'when', field, data={})
+        self.assertEqual(field.help_text, 'foo')
+
+
+class TestRuleRegistry(TestCase):
+
+    """Tests for the :py:class:`thecut.forms.rules.RuleRegistry` class."""
+
+    def setUp(self):
+        self.registry = rules.RuleRegistry()
+
+    def test_register(self):
+        """Test that registered rules are returned in registration order."""
+        self.registry.register('a', rules.email_type)
+        self.registry.register('b', rules.required)
+        self.assertEqual(list(self.registry),
+                         [rules.email_type, rules.required])
+        self.assertEqual(self.registry.names(), ['a', 'b'])
+
+    def test_register_replaces_existing_rule(self):
+        """Test that registering a rule with an existing name replaces the
+        existing rule."""
+        self.registry.register('a', rules.email_type)
+        self.registry.register('a', rules.required)
+        self.assertEqual(list(self.registry), [rules.required])
+
+    def test_unregister(self):
+        """Test that unregistered rules are removed from the registry."""
+        self.registry.register('a', rules.email_type)
+        self.registry.unregister('a')
+        self.assertNotIn('a', self.registry)
+
+    def test_version_changes(self):
+        """Test that the registry's version changes whenever a rule is
+        registered or unregistered."""
+        versions = [self.registry.version]
+        self.registry.register('a', rules.email_type)
+        versions.append(self.registry.version)
+        self.registry.unregister('a')
+        versions.append(self.registry.version)
+        self.assertEqual(len(set(versions)), 3)
+
+    def test_default_rules_registered(self):
+        """Test that the built-in rules are registered by default."""
+        self.assertEqual(
+            set(rules.registry.names()),
+            {'time_class', 'required', 'placeholder', 'max_length',
+             'email_type', 'date_class', 'datetime_class',
+             'timezone_help_text'})
+
+    def test_rules_for_returns_matching_rules(self):
+        """Test that only the rules matching the field and widget classes are
+        returned, split into per-class and per-instance rules."""
+        self.registry.register('date_class', rules.date_class)
+        self.registry.register('required', rules.required)
+        self.registry.register('timezone', rules.timezone_help_text)
+        self.assertEqual(
+            self.registry.rules_for(forms.DateField, forms.DateInput),
+            (rules.date_class, rules.required))
+        self.assertEqual(
+            self.registry.rules_for(forms.ChoiceField, forms.RadioSelect),
+            ())
+        self.assertEqual(
+            self.registry.rules_for(forms.DateTimeField, forms.DateTimeInput,
+                                    per_instance=True),
+            (rules.timezone_help_text,))
+
+    def test_rules_for_is_cached(self):
+        """Test that rules are only matched once per pair of field and widget
+        classes."""
+        self.registry.register('date_class', rules.date_class)
+        with patch.object(rules.date_class, 'matches',
+                          return_value=True) as mock_matches:
+            self.registry.rules_for(forms.DateField, forms.DateInput)
+            self.registry.rules_for(forms.DateField, forms.DateInput)
+            self.registry.rules_for(forms.DateField, forms.DateInput,
+                                    per_instance=True)
+        self.assertEqual(mock_matches.call_count, 1)
+
+    def test_rules_for_cache_is_bounded(self):
+        """Test that the dispatch cache does not exceed its maximum size."""
+        registry = rules.RuleRegistry(cache_size=2)
+        registry.register('date_class', rules.date_class)
+        registry.rules_for(forms.DateField, forms.DateInput)
+        registry.rules_for(forms.CharField, forms.TextInput)
+        registry.rules_for(forms.CharField, forms.Textarea)
+        self.assertEqual(len(registry._dispatch_cache), 2)
+        self.assertNotIn((forms.DateField, forms.DateInput),
+                         registry._dispatch_cache)
+
+    def test_register_invalidates_cache(self):
+        """Test that registering a rule invalidates the dispatch cache."""
+        self.assertEqual(
+            self.registry.rules_for(forms.DateField, forms.DateInput), ())
+        self.registry.register('date_class', rules.date_class)
+        self.assertEqual(
+            self.registry.rules_for(forms.DateField, forms.DateInput),
+            (rules.date_class,))
@@ -2,7 +2,13 @@
 from __future__ import absolute_import, unicode_literals
 from django.test import TestCase
 from mock import MagicMock
-from thecut.forms.utils import add_css_class
+from django import forms
+from thecut.forms.utils import (CopyOnWriteDict, CSSClassList, SharedChoices,
+                                add_css_class, add_css_classes,
+                                css_class_list, has_css_class,
+                                remove_css_class, serialise_css_classes,
+                                share_field_state)
+import copy
 
 
 class TestAddCssClass(TestCase):
@@ -19,3 +25,149 @@ class TestAddCssClass(TestCase):
         widget = add_css_class(widget, 'b')
         self.assertEqual(set(widget.attrs.get('class', '').split()),
                          {'a', 'b'})
+
+
+class TestAddCssClasses(TestCase):
+    def test_add_multiple_css_classes(self):
+        widget = MagicMock()
+        widget.attrs = {'class': 'a b'}
+        widget = add_css_classes(widget, 'c', 'b', 'd')
+        self.assertEqual(widget.attrs['class'], 'a b c d')
+
+    def test_add_css_classes_without_existing_classes(self):
+        widget = MagicMock()
+        widget.attrs = {}
+        widget = add_css_classes(widget, 'a', 'a')
+        self.assertEqual(widget.attrs['class'], 'a')
+
+    def test_add_css_classes_to_class_list(self):
+        widget = MagicMock()
+        widget.attrs = {'class': CSSClassList('a')}
+        class_list = widget.attrs['class']
+        add_css_classes(widget, 'b')
+        self.assertIs(widget.attrs['class'], class_list)
+        self.assertEqual(list(class_list), ['a', 'b'])
+
+
+class TestRemoveCssClass(TestCase):
+    def test_remove_existing_css_class(self):
+        widget = MagicMock()
+        widget.attrs = {'class': 'a b c'}
+        widget = remove_css_class(widget, 'b')
+        self.assertEqual(widget.attrs['class'], 'a c')
+
+    def test_remove_missing_css_class(self):
+        widget = MagicMock()
+        widget.attrs = {}
+        widget = remove_css_class(widget, 'b')
+        self.assertNotIn('class', widget.attrs)
+
+    def test_remove_css_class_from_class_list(self):
+        widget = MagicMock()
+        widget.attrs = {'class': CSSClassList('a b')}
+        remove_css_class(widget, 'a')
+        self.assertEqual(widget.attrs['class'], 'b')
+
+
+class TestHasCssClass(TestCase):
+    def test_has_css_class(self):
+        widget = MagicMock()
+        widget.attrs = {'class': 'ab b'}
+        self.assertTrue(has_css_class(widget, 'b'))
+        self.assertFalse(has_css_class(widget, 'a'))
+
+    def test_has_css_class_with_class_list(self):
+        widget = MagicMock()
+        widget.attrs = {'class': CSSClassList('ab b')}
+        self.assertTrue(has_css_class(widget, 'b'))
+        self.assertFalse(has_css_class(widget, 'a'))
+
+
+class TestCSSClassList(TestCase):
+    def test_preserves_order_and_deduplicates(self):
+        class_list = CSSClassList('b a b')
+        class_list.add('c', 'a')
+        self.assertEqual(list(class_list), ['b', 'a', 'c'])
+        self.assertEqual('{0}'.format(class_list), 'b a c')
+
+    def test_behaves_like_string(self):
+        class_list = CSSClassList('a b')
+        self.assertEqual(class_list, 'a b')
+        self.assertEqual(class_list.split(), ['a', 'b'])
+        self.assertEqual(class_list + ' c', 'a b c')
+        self.assertEqual('c ' + class_list, 'c a b')
+        self.assertFalse(CSSClassList(''))
+
+    def test_deepcopy(self):
+        class_list = CSSClassList('a')
+        copied = copy.deepcopy(class_list)
+        copied.add('b')
+        self.assertEqual(class_list, 'a')
+
+    def test_css_class_list_is_stored_on_widget(self):
+        widget = MagicMock()
+        widget.attrs = {'class': 'a'}
+        class_list = css_class_list(widget)
+        self.assertIs(css_class_list(widget), class_list)
+        class_list.add('b')
+        serialise_css_classes(widget)
+        self.assertEqual(widget.attrs['class'], 'a b')
+        self.assertNotIsInstance(widget.attrs['class'], CSSClassList)
+
+
+class TestCopyOnWriteDict(TestCase):
+    def test_copy_shares_data(self):
+        attrs = CopyOnWriteDict({'a': 1})
+        copied = attrs.copy()
+        self.assertIs(copied._data, attrs._data)
+        self.assertEqual(copied, {'a': 1})
+
+    def test_write_to_copy_does_not_affect_original(self):
+        attrs = CopyOnWriteDict({'a': 1})
+        copied = attrs.copy()
+        copied['b'] = 2
+        copied.update({'a': 3})
+        self.assertEqual(attrs, {'a': 1})
+        self.assertEqual(copied, {'a': 3, 'b': 2})
+
+    def test_write_to_original_does_not_affect_copy(self):
+        attrs = CopyOnWriteDict({'a': 1})
+        copied = copy.copy(attrs)
+        del attrs['a']
+        self.assertEqual(attrs, {})
+        self.assertEqual(copied, {'a': 1})
+
+    def test_deepcopy(self):
+        attrs = CopyOnWriteDict({'a': [1]})
+        copied = copy.deepcopy(attrs)
+        copied['a'].append(2)
+        self.assertEqual(attrs['a'], [1])
+
+
+class TestSharedChoices(TestCase):
+    def test_copies_are_shared(self):
+        choices = SharedChoices([('a', 'A')])
+        self.assertIs(copy.copy(choices), choices)
+        self.assertIs(copy.deepcopy(choices), choices)
+
+    def test_immutable(self):
+        choices = SharedChoices([('a', 'A')])
+        with self.assertRaises(TypeError):
+            choices.append(('b', 'B'))
+        with self.assertRaises(TypeError):
+            choices[0] = ('b', 'B')
+        self.assertEqual(choices + [('b', 'B')], [('a', 'A'), ('b', 'B')])
+
+
+class TestShareFieldState(TestCase):
+    def test_copied_field_shares_state(self):
+        field = share_field_state(forms.ChoiceField(choices=[('a', 'A')]))
+        copied = copy.deepcopy(field)
+        self.assertIs(copied.widget.attrs._data, field.widget.attrs._data)
+        self.assertIs(copied.choices, field.choices)
+        self.assertIs(copied.widget.choices, field.choices)
+
+    def test_multi_widget(self):
+        field = share_field_state(forms.SplitDateTimeField())
+        for widget in field.widget.widgets:
+            self.assertIsInstance(widget.attrs, CopyOnWriteDict)
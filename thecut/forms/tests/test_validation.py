@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from concurrent.futures import Future, ProcessPoolExecutor
+from django.test import TestCase
+from mock import patch
+from test_app.forms import (DateTimeTimezoneForm, DynamicFieldForm, FusedForm,
+                            ImportRowForm)
+from thecut.forms import validation
+from thecut.forms.validation import (FormValidator, ParallelValidator,
+                                     validate_many)
+from unittest import skipUnless
+import multiprocessing
+import os
+import sys
+
+
+ROWS = [
+    {'name': 'Jane', 'email': 'jane@example.com', 'text': 'Hi',
+     'choice': 'A'},
+    {'name': '', 'email': 'not-an-email', 'text': 'x' * 51, 'choice': 'C'},
+    {'name': 'John', 'email': 'john@example.com', 'text': 'Hello',
+     'choice': 'B', 'date': '2016-01-01'},
+]
+
+
+class SynchronousExecutor(object):
+
+    """An executor which runs submitted functions immediately, recording how
+    many have been submitted."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, func, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(func(*args))
+        return future
+
+
+def fork_executor(max_workers):
+    """Return a process pool whose workers are forked (rather than spawned),
+    as the test settings are configured by ``runtests.py`` rather than with
+    ``DJANGO_SETTINGS_MODULE``, so can't be loaded by a spawned worker."""
+    kwargs = {}
+    if sys.version_info >= (3, 7):
+        kwargs['mp_context'] = multiprocessing.get_context('fork')
+    return ProcessPoolExecutor(max_workers=max_workers, **kwargs)
+
+
+class TestFormValidator(TestCase):
+
+    """Tests for :py:class:`thecut.forms.validation.FormValidator`."""
+
+    def test_matches_form_validation(self):
+        """Test each payload is validated as per a new form instance."""
+        validator = FormValidator(ImportRowForm)
+        for row in ROWS:
+            form = ImportRowForm(data=row)
+            cleaned_data, errors = validator.validate(row)
+            self.assertEqual(form.is_valid(), not errors)
+            self.assertEqual(cleaned_data, form.cleaned_data)
+            self.assertEqual(errors, dict(
+                (name, list(messages))
+                for name, messages in form.errors.items()))
+
+    def test_errors_are_plain_text(self):
+        errors = FormValidator(ImportRowForm).validate(ROWS[1])[1]
+        self.assertEqual(sorted(errors), ['choice', 'email', 'name', 'text'])
+        self.assertIs(type(errors['name'][0]), type(''))
+
+    def test_fields_are_not_decorated(self):
+        """Test fields added per instance are not decorated for
+        rendering."""
+        validator = FormValidator(DynamicFieldForm)
+        widget = validator.form.fields['time'].widget
+        validator.validate({'email': 'jane@example.com', 'time': '10:00'})
+        validator.form['time']
+        self.assertNotIn('class', widget.attrs)
+        self.assertNotIn('required', widget.attrs)
+
+    def test_timezone_help_texts_are_not_set(self):
+        validator = FormValidator(DateTimeTimezoneForm)
+        cleaned_data, errors = validator.validate(
+            {'start': '2016-01-01 12:00:00'})
+        self.assertEqual(errors, {})
+        self.assertEqual(validator.form.fields['start'].help_text, '')
+
+    def test_fused_form_instance_rules_are_not_applied(self):
+        validator = FormValidator(FusedForm)
+        with patch.object(FusedForm, '_apply_instance_rules') as mock_apply:
+            validator.validate({'email': 'jane@example.com', 'time': '10:00',
+                                'date': '2016-01-01', 'radio': 'A',
+                                'datetime': '2016-01-01 12:00:00'})
+        self.assertFalse(mock_apply.called)
+
+    def test_form_kwargs(self):
+        validator = FormValidator(ImportRowForm, form_kwargs={'prefix': 'p'})
+        row = dict(('p-{0}'.format(key), value)
+                   for key, value in ROWS[0].items())
+        self.assertEqual(validator.validate(row)[1], {})
+
+
+class TestValidateMany(TestCase):
+
+    """Tests for :py:func:`thecut.forms.validation.validate_many`."""
+
+    def test_yields_results_in_order(self):
+        results = list(validate_many(ImportRowForm, ROWS))
+        self.assertEqual([bool(errors) for cleaned_data, errors in results],
+                         [False, True, False])
+        self.assertEqual(results[2][0]['name'], 'John')
+
+    def test_initialises_form_once(self):
+        with patch.object(ImportRowForm, '__init__', autospec=True,
+                          side_effect=ImportRowForm.__init__) as mock_init:
+            list(validate_many(ImportRowForm, ROWS))
+        self.assertEqual(mock_init.call_count, 1)
+
+    def test_is_lazy(self):
+        rows = iter(ROWS)
+        results = validate_many(ImportRowForm, rows)
+        next(results)
+        self.assertEqual(len(list(rows)), 2)
+
+    @skipUnless(hasattr(os, 'fork'), 'Requires forked worker processes.')
+    @patch('concurrent.futures.ProcessPoolExecutor', fork_executor)
+    def test_processes(self):
+        """Test validating payloads in a pool of worker processes."""
+        rows = ROWS * 5
+        self.assertEqual(
+            list(validate_many(ImportRowForm, rows, processes=2,
+                               chunk_size=4)),
+            list(validate_many(ImportRowForm, rows)))
+
+
+class TestParallelValidator(TestCase):
+
+    """Tests for :py:class:`thecut.forms.validation.ParallelValidator`."""
+
+    @skipUnless(hasattr(os, 'fork'), 'Requires forked worker processes.')
+    def test_matches_serial_validation(self):
+        rows = ROWS * 7
+        executor = fork_executor(max_workers=2)
+        try:
+            validator = ParallelValidator(ImportRowForm, chunk_size=3,
+                                          executor=executor)
+            self.assertEqual(list(validator.validate_many(rows)),
+                             list(validate_many(ImportRowForm, rows)))
+        finally:
+            executor.shutdown(wait=True)
+
+    def test_dotted_path(self):
+        validator = ParallelValidator('test_app.forms.ImportRowForm',
+                                      executor=SynchronousExecutor())
+        self.assertEqual(list(validator.validate_many(ROWS)),
+                         list(validate_many(ImportRowForm, ROWS)))
+
+    def test_unimportable_form_class(self):
+        form_class = type(str('LocalForm'), (ImportRowForm,), {})
+        with self.assertRaises(ValueError):
+            ParallelValidator(form_class)
+
+    def test_backpressure(self):
+        """Test payloads are only submitted as results are consumed."""
+        executor = SynchronousExecutor()
+        validator = ParallelValidator(ImportRowForm, chunk_size=2,
+                                      max_pending=3, executor=executor)
+        results = validator.validate_many(ROWS * 10)
+        next(results)
+        self.assertEqual(executor.submitted, 3)
+        self.assertEqual(len(list(results)), 29)
+        self.assertEqual(executor.submitted, 15)
+
+    def test_form_class_is_imported_once_per_process(self):
+        validation._validators.clear()
+        with patch('thecut.forms.validation.import_string',
+                   return_value=ImportRowForm) as mock_import:
+            validation._validate_chunk('a.Form', None, ROWS)
+            validation._validate_chunk('a.Form', None, ROWS)
+        validation._validators.clear()
+        self.assertEqual(mock_import.call_count, 1)
+
+    def test_compact_errors(self):
+        results = validation._validate_chunk('test_app.forms.ImportRowForm',
+                                             None, ROWS)
+        self.assertIsNone(results[0][1])
+        self.assertIsInstance(results[1][1]['name'], tuple)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.apps import apps
+from django.template import TemplateDoesNotExist
+from django.test import TestCase
+from mock import MagicMock, patch
+from test_app.forms import (DateTimeTimezoneForm, InheritedPlaceholderForm,
+                            RenderingForm)
+from thecut.forms import warmup
+from thecut.forms.settings import settings
+
+
+def subclass(form_class):
+    """Return a new (not yet instantiated) subclass of a form class."""
+    return type(str('Warm{0}'.format(form_class.__name__)), (form_class,),
+                {'__module__': form_class.__module__})
+
+
+class WarmUpTestMixin(object):
+
+    def setUp(self):
+        for name, value in [('registry', []), ('_warmed_up', False)]:
+            patcher = patch.object(warmup, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestRegister(WarmUpTestMixin, TestCase):
+
+    """Tests for :py:func:`thecut.forms.warmup.register`."""
+
+    def test_registers_form_class(self):
+        form_class = subclass(RenderingForm)
+        self.assertIs(warmup.register(form_class), form_class)
+        warmup.register(form_class)
+        self.assertEqual(warmup.registry, [form_class])
+        self.assertNotIn('_decoration_state', form_class.__dict__)
+
+    def test_prepares_form_class_after_warm_up(self):
+        with patch.object(warmup, 'preload_templates'):
+            warmup.warm_up()
+        form_class = warmup.register(subclass(RenderingForm))
+        self.assertIn('_decoration_state', form_class.__dict__)
+
+
+class TestWarmUp(WarmUpTestMixin, TestCase):
+
+    """Tests for :py:func:`thecut.forms.warmup.warm_up`."""
+
+    def test_prepares_form_classes(self):
+        form_classes = [warmup.register(subclass(form_class)) for form_class
+                        in [InheritedPlaceholderForm, DateTimeTimezoneForm]]
+        with patch.object(warmup, 'preload_templates'):
+            warmup.warm_up()
+        state = form_classes[0].__dict__['_decoration_state']
+        self.assertIs(state[0], form_classes[0].base_fields)
+        self.assertIs(form_classes[0].__dict__['_placeholder_state'][0],
+                      form_classes[0].base_fields)
+        self.assertEqual(
+            form_classes[1].__dict__['_timezone_field_names_state'][1],
+            ('start', 'end'))
+        # Instances use the prepared fields.
+        with patch.object(form_classes[0], '_decorate_field') as mock:
+            form_classes[0]()
+        self.assertFalse(mock.called)
+
+    def test_settings_form_classes(self):
+        form_class = subclass(RenderingForm)
+        with patch.object(settings, 'WARM_UP_FORMS', ['a.Form']), \
+                patch.object(warmup, 'import_string',
+                             return_value=form_class):
+            self.assertEqual(warmup.get_form_classes(), [form_class])
+
+    def test_preloads_templates(self):
+        engine = MagicMock()
+        engine.get_template.side_effect = [None, TemplateDoesNotExist(''),
+                                           None, None, None]
+        with patch.object(warmup, 'engines') as mock_engines:
+            mock_engines.all.return_value = [engine]
+            warmup.warm_up()
+        self.assertEqual([call[0][0] for call
+                          in engine.get_template.call_args_list],
+                         warmup.TEMPLATE_NAMES)
+
+    def test_called_when_app_is_ready(self):
+        app_config = apps.get_app_config('forms')
+        with patch.object(warmup, 'warm_up') as mock_warm_up:
+            app_config.ready()
+            self.assertFalse(mock_warm_up.called)
+            with patch.object(settings, 'WARM_UP', True):
+                app_config.ready()
+        self.assertEqual(mock_warm_up.call_count, 1)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+from django.test import TestCase
+from django.utils import translation
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy
+from mock import patch
+from unittest import skipIf
+
+try:
+    from django.forms import renderers
+    from thecut.forms import widgets
+    from thecut.forms.tests.test_renderers import get_overriding_renderer
+    from thecut.forms.widgets import CachedSelect, CachedSelectMultiple
+except ImportError:  # Django < 1.11
+    renderers = None
+
+
+CHOICES = [(None, '---'), ('a', 'A & B'), (1, 2), ('Group "1"', [
+    ('b', gettext_lazy('Yes')), ('<c>', mark_safe('<em>C</em>')),
+    (None, 'None')]), ('a', 'Duplicate')]
+
+
+@skipIf(renderers is None, 'Form renderers require Django 1.11 or later.')
+class TestCachedSelect(TestCase):
+
+    """Tests for :py:class:`thecut.forms.widgets.CachedSelect`."""
+
+    def setUp(self):
+        widgets.option_cache.clear()
+        self.renderer = renderers.DjangoTemplates()
+
+    def assertRendersAs(self, widget, template_widget, value, attrs=None):
+        self.assertEqual(
+            widget.render('name', value, attrs=attrs),
+            template_widget.render('name', value, attrs=attrs,
+                                   renderer=self.renderer))
+
+    def test_parity(self):
+        """Test options are rendered identically to Django's templates."""
+        for widget, template_widget in [
+                (CachedSelect(choices=CHOICES),
+                 forms.Select(choices=CHOICES)),
+                (CachedSelect(choices=CHOICES, attrs={'class': 'a'}),
+                 forms.Select(choices=CHOICES, attrs={'class': 'a'})),
+                (CachedSelectMultiple(choices=CHOICES),
+                 forms.SelectMultiple(choices=CHOICES))]:
+            for value in [None, '', 'a', 1, '<c>', 'None', ['a', '1', 'b']]:
+                with self.subTest(widget=widget, value=value):
+                    self.assertRendersAs(widget, template_widget, value,
+                                         attrs={'id': 'id_name'})
+
+    def test_options_rendered_once(self):
+        widget = CachedSelect(choices=CHOICES)
+        with patch.object(widgets, 'render_option',
+                          side_effect=widgets.render_option) as mock:
+            for value in ['a', 'b', '1']:
+                widget.render('name', value)
+            other = CachedSelect(choices=list(CHOICES))
+            other.render('other', 'a')
+        self.assertEqual(mock.call_count, 14)
+
+    def test_overridden_templates_are_used(self):
+        for template_name in ['select.html', 'select_option.html',
+                              'attrs.html']:
+            renderer = get_overriding_renderer({
+                'django/forms/widgets/{0}'.format(template_name): '<x>'})
+            with self.subTest(template_name=template_name):
+                self.assertEqual(
+                    CachedSelect(choices=CHOICES).render(
+                        'name', 'a', renderer=renderer),
+                    forms.Select(choices=CHOICES).render(
+                        'name', 'a', renderer=renderer))
+
+    def test_cached_per_language(self):
+        widget = CachedSelect(choices=CHOICES)
+        for language, label in [('en', 'Yes'), ('fr', 'Oui'), ('en', 'Yes')]:
+            with translation.override(language):
+                self.assertIn('<option value="b">{0}</option>'.format(label),
+                              widget.render('name', None))
+
+    def test_changed_choices(self):
+        widget = CachedSelect(choices=CHOICES)
+        widget.render('name', None)
+        widget.choices = [('x', 'X')]
+        self.assertIn('<option value="x">X</option>',
+                      widget.render('name', None))
+
+    def test_unhashable_choices(self):
+        choices = [({'a': 1}, 'A')]
+        self.assertRendersAs(CachedSelect(choices=choices),
+                             forms.Select(choices=choices), None)
+        self.assertEqual(len(widgets.option_cache), 0)
+
+    def test_custom_option_template(self):
+        widget = CachedSelect(choices=CHOICES)
+        widget.option_template_name = 'django/forms/widgets/input_option.html'
+        template_widget = forms.Select(choices=CHOICES)
+        template_widget.option_template_name = widget.option_template_name
+        self.assertRendersAs(widget, template_widget, 'a')
+        self.assertEqual(len(widgets.option_cache), 0)
+
+    def test_field(self):
+        field = forms.ChoiceField(choices=CHOICES[1:], widget=CachedSelect)
+        form = type(str('Form'), (forms.Form,), {'choice': field})(
+            data={'choice': 'b'})
+        self.assertIn('<option value="b" selected>Yes</option>',
+                      '{0}'.format(form['choice']))
@@ -1,10 +1,380 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, unicode_literals
+from collections import OrderedDict
+from django.utils.functional import Promise
+from django.utils.translation import get_language
+from thecut.forms import i18n
+import copy
+
+try:
+    from collections.abc import Mapping, MutableMapping
+except ImportError:  # Python 2
+    from collections import Mapping, MutableMapping
+
+try:
+    from django.utils.encoding import python_2_unicode_compatible
+    from django.utils.six import text_type
+except ImportError:  # Django >= 3.0 (Python 3 only)
+    text_type = str
+
+    def python_2_unicode_compatible(klass):
+        return klass
+
+
+class CSSClassList(object):
+    """An ordered set of CSS classes.
+
+    The classes are only joined into a string when the list is serialised
+    (e.g. when the widget is rendered), so a widget's classes can be
+    modified many times for the cost of a single split and join. Use
+    :py:func:`css_class_list` to get (or create) a widget's class list.
+    """
+
+    def __init__(self, css_classes=''):
+        if isinstance(css_classes, CSSClassList):
+            css_classes = list(css_classes)
+        elif not isinstance(css_classes, (list, tuple)):
+            css_classes = '{0}'.format(css_classes).split()
+        self._css_classes = OrderedDict.fromkeys(css_classes)
+
+    def __add__(self, other):
+        return '{0}{1}'.format(self, other)
+
+    def __radd__(self, other):
+        return '{0}{1}'.format(other, self)
+
+    def __bool__(self):
+        return bool(self._css_classes)
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, css_class):
+        return css_class in self._css_classes
+
+    def __eq__(self, other):
+        if isinstance(other, CSSClassList):
+            other = '{0}'.format(other)
+        return '{0}'.format(self) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __iter__(self):
+        return iter(list(self._css_classes))
+
+    def __len__(self):
+        return len(self._css_classes)
+
+    def __repr__(self):
+        return '<{0}: {1!r}>'.format(type(self).__name__, list(self))
+
+    def __str__(self):
+        return ' '.join(self._css_classes)
+
+    def add(self, *css_classes):
+        """Add one or more CSS classes (if not already present)."""
+        for css_class in css_classes:
+            self._css_classes.setdefault(css_class)
+
+    def discard(self, css_class):
+        """Remove a CSS class (if present)."""
+        self._css_classes.pop(css_class, None)
+
+    def split(self, *args, **kwargs):
+        return '{0}'.format(self).split(*args, **kwargs)
+
+
+def css_class_list(widget):
+    """Return a :py:class:`CSSClassList` for a widget's ``class`` attribute.
+
+    The list is stored in the widget's ``attrs``, so that subsequent changes
+    to it (and calls to this function) do not re-parse the attribute. Use
+    :py:func:`serialise_css_classes` to convert it back to a string.
+
+    :param widget: The widget.
+    :type widget: :py:class:`~django.forms.Widget`
+    :rtype: :py:class:`CSSClassList`
+    """
+    css_classes = widget.attrs.get('class', '')
+    if not isinstance(css_classes, CSSClassList):
+        css_classes = CSSClassList(css_classes)
+        widget.attrs['class'] = css_classes
+    return css_classes
+
+
+def serialise_css_classes(widget):
+    """Convert a widget's :py:class:`CSSClassList` (if any) to a string.
+
+    :param widget: The widget.
+    :type widget: :py:class:`~django.forms.Widget`
+    :returns: The widget.
+    """
+    css_classes = widget.attrs.get('class')
+    if isinstance(css_classes, CSSClassList):
+        widget.attrs['class'] = '{0}'.format(css_classes)
+    return widget
+
+
+def add_css_classes(widget, *css_classes):
+    """Add one or more CSS classes to a widget's ``class`` attribute.
+
+    Existing classes keep their order, and classes which are already present
+    are not duplicated.
+
+    :param widget: The widget.
+    :type widget: :py:class:`~django.forms.Widget`
+    :returns: The widget.
+    """
+    existing = widget.attrs.get('class', '')
+    if isinstance(existing, CSSClassList):
+        existing.add(*css_classes)
+    else:
+        class_list = CSSClassList(existing)
+        class_list.add(*css_classes)
+        widget.attrs.update({'class': '{0}'.format(class_list)})
+    return widget
 
 
 def add_css_class(widget, css_class):
-    css_classes = widget.attrs.get('class', '').split()
-    if css_class not in css_classes:
-        css_classes.append(css_class)
-    widget.attrs.update({'class': ' '.join(css_classes)})
+    return add_css_classes(widget, css_class)
+
+
+def remove_css_class(widget, css_class):
+    """Remove a CSS class from a widget's ``class`` attribute (if present).
+
+    :param widget: The widget.
+    :type widget: :py:class:`~django.forms.Widget`
+    :returns: The widget.
+    """
+    existing = widget.attrs.get('class', '')
+    if isinstance(existing, CSSClassList):
+        existing.discard(css_class)
+    elif css_class in existing.split():
+        class_list = CSSClassList(existing)
+        class_list.discard(css_class)
+        widget.attrs.update({'class': '{0}'.format(class_list)})
     return widget
+
+
+def has_css_class(widget, css_class):
+    """Return ``True`` if a widget's ``class`` attribute contains a CSS class.
+
+    :param widget: The widget.
+    :type widget: :py:class:`~django.forms.Widget`
+    :rtype: :py:class:`bool`
+    """
+    existing = widget.attrs.get('class', '')
+    if isinstance(existing, CSSClassList):
+        return css_class in existing
+    return css_class in existing.split()
+
+
+class CopyOnWriteDict(MutableMapping):
+    """A mapping which shares its data with the mapping it was copied from,
+    until either of them is modified.
+
+    Copying a :py:class:`CopyOnWriteDict` (which Django does with each
+    widget's ``attrs`` whenever a form's fields are copied) is therefore
+    constant time, and the underlying ``dict`` is only copied if it is
+    actually modified.
+    """
+
+    def __init__(self, data=None):
+        self._data = {} if data is None else data
+        self._shared = data is not None
+
+    def _own(self):
+        if self._shared:
+            self._data = dict(self._data)
+            self._shared = False
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __copy__(self):
+        self._shared = True
+        return type(self)(self._data)
+
+    def __deepcopy__(self, memo):
+        return type(self)(copy.deepcopy(self._data, memo))
+
+    def __delitem__(self, key):
+        self._own()
+        del self._data[key]
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '<{0}: {1!r}>'.format(type(self).__name__, self._data)
+
+    def __setitem__(self, key, value):
+        self._own()
+        self._data[key] = value
+
+    copy = __copy__
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def items(self):
+        return self._data.items()
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError('Shared choices can not be modified in place, assign a '
+                    'new list of choices instead.')
+
+
+class SharedChoices(list):
+    """An immutable list of choices, which is shared (rather than copied)
+    when its field or widget is copied."""
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    __delitem__ = __iadd__ = __imul__ = __setitem__ = _immutable
+
+    append = clear = extend = insert = pop = remove = reverse = sort = \
+        _immutable
+
+
+def share_field_state(field):
+    """Make a field's widget ``attrs`` (and its list of choices, if any)
+    copy-on-write, so that copying the field does not copy them.
+
+    :param field: The field.
+    :type field: :py:class:`~django.forms.Field`
+    :returns: The field.
+    """
+    choices = getattr(field, '_choices', None)
+    if type(choices) is list:
+        field._choices = SharedChoices(choices)
+    widgets = [field.widget]
+    while widgets:
+        widget = widgets.pop()
+        if not isinstance(widget.attrs, CopyOnWriteDict):
+            widget.attrs = CopyOnWriteDict(dict(widget.attrs))
+        if getattr(widget, 'choices', None) is choices and \
+                type(choices) is list:
+            widget.choices = field._choices
+        elif type(getattr(widget, 'choices', None)) is list:
+            widget.choices = SharedChoices(widget.choices)
+        widgets.extend(getattr(widget, 'widgets', []))
+    return field
+
+
+class FrozenDict(Mapping):
+    """An immutable ``dict``."""
+
+    def __init__(self, *args, **kwargs):
+        self._data = dict(*args, **kwargs)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self._data)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+@python_2_unicode_compatible
+class LanguageCachedText(object):
+    """Wraps a lazy translation string, so that it is only translated once
+    per language (until the translations are reloaded, see
+    :py:func:`thecut.forms.i18n.clear_translation_cache`).
+
+    :param value: The lazy translation string.
+    """
+
+    def __init__(self, value):
+        self.value = value
+        self._translations = {}
+        self._version = i18n.version
+
+    def __str__(self):
+        if self._version != i18n.version:  # The translations were reloaded
+            self._translations = {}
+            self._version = i18n.version
+        language = get_language()
+        try:
+            return self._translations[language]
+        except KeyError:
+            text = self._translations[language] = '{0}'.format(self.value)
+            return text
+
+    def __format__(self, format_spec):
+        return format(text_type(self), format_spec)
+
+    def __eq__(self, other):
+        if isinstance(other, LanguageCachedText):
+            other = text_type(other)
+        return text_type(self) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(text_type(self))
+
+    def __repr__(self):
+        return '<{0}: {1!r}>'.format(type(self).__name__, self.value)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def get_placeholders(form):
+    """Return the placeholders for a form class's fields.
+
+    The ``placeholders`` of each ``Meta`` class in the form's MRO are merged
+    (with subclasses taking precedence) once per form class. Lazy translation
+    strings are wrapped with :py:class:`LanguageCachedText`.
+
+    :param form: The form class (or an instance of it).
+    :rtype: :py:class:`FrozenDict`
+    """
+    form_class = form if isinstance(form, type) else type(form)
+    placeholders = form_class.__dict__.get('_placeholders')
+    if placeholders is None:
+        merged = {}
+        for klass in reversed(form_class.__mro__):
+            meta = klass.__dict__.get('Meta')
+            merged.update(getattr(meta, 'placeholders', None) or {})
+        placeholders = FrozenDict(
+            (name, LanguageCachedText(value)
+             if isinstance(value, Promise) else value)
+            for name, value in merged.items())
+        form_class._placeholders = placeholders
+    return placeholders
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from collections import deque
+from django.utils.module_loading import import_string
+import multiprocessing
+
+
+def _text(value):
+    return '{0}'.format(value)
+
+
+class FormValidator(object):
+    """Validates many payloads against a single instance of a form class.
+
+    The form is only initialised once (so its fields are only copied from
+    ``base_fields`` once), and is re-bound to each payload in turn. Fields are
+    not decorated for rendering (e.g. with CSS classes, or timezone help
+    text), as the form is never rendered.
+
+    Forms which change their fields depending on the bound data (e.g. in
+    ``__init__``) can not be validated this way.
+
+    :param form_class: The form class.
+    :type form_class: :py:class:`type`
+    :param form_kwargs: Keyword arguments (other than ``data``) for the form,
+        e.g. ``prefix``.
+    :type form_kwargs: :py:class:`dict`
+    """
+
+    def __init__(self, form_class, form_kwargs=None):
+        form = form_class.__new__(form_class)
+        form._validation_only = True
+        form.__init__(data={}, **(form_kwargs or {}))
+        self.form = form
+
+    def validate(self, data):
+        """Validate a payload.
+
+        :param data: The payload (as would be passed as a form's ``data``).
+        :type data: :py:class:`dict`
+        :returns: The cleaned data (which is incomplete if the payload is
+            invalid), and a ``dict`` of each invalid field's error messages
+            (which is empty if the payload is valid).
+        :rtype: :py:class:`tuple`
+        """
+        form = self.form
+        form.data = data
+        form.is_bound = True
+        form._errors = None
+        form._bound_fields_cache = {}
+        form.__dict__.pop('changed_data', None)
+        errors = form.errors
+        return form.cleaned_data, dict(
+            (name, [_text(message) for message in messages])
+            for name, messages in errors.items())
+
+
+# The validators in a worker process, by form class path and form kwargs.
+_validators = {}
+
+
+def _get_validator(form_path, form_kwargs):
+    key = (form_path, repr(form_kwargs))
+    validator = _validators.get(key)
+    if validator is None:
+        from django.apps import apps
+        if not apps.ready:  # e.g. a process which was spawned, not forked
+            import django
+            django.setup()
+        validator = _validators[key] = FormValidator(
+            import_string(form_path), form_kwargs=form_kwargs)
+    return validator
+
+
+def _validate_chunk(form_path, form_kwargs, chunk):
+    # Runs in a worker process. Errors are returned as tuples (or None if the
+    # payload is valid) to keep the results small.
+    results = []
+    for data in chunk:
+        cleaned_data, errors = _get_validator(form_path,
+                                              form_kwargs).validate(data)
+        results.append((cleaned_data, dict(
+            (name, tuple(messages)) for name, messages in errors.items()) or
+            None))
+    return results
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ParallelValidator(object):
+    """Validates payloads against a form class in a pool of worker
+    processes.
+
+    Payloads are sent to the workers in chunks. Each worker imports the form
+    class (once) and validates each chunk with a :py:class:`FormValidator`.
+    At most ``max_pending`` chunks are submitted to the workers at a time, so
+    payloads are only read from the iterable as results are consumed.
+
+    :param form_class: The form class, or its dotted path. The form class
+        must be importable from its dotted path in the worker processes.
+    :param workers: The number of worker processes (defaults to the number of
+        CPUs).
+    :type workers: :py:class:`int`
+    :param chunk_size: The number of payloads sent to a worker at a time.
+    :type chunk_size: :py:class:`int`
+    :param max_pending: The maximum number of chunks being validated (or
+        waiting to be consumed) at a time (defaults to twice the number of
+        workers).
+    :type max_pending: :py:class:`int`
+    :param form_kwargs: Keyword arguments (other than ``data``) for the form.
+        Must be picklable.
+    :type form_kwargs: :py:class:`dict`
+    :param executor: A :py:class:`concurrent.futures.Executor` to use (which
+        is not shut down), instead of a new
+        :py:class:`~concurrent.futures.ProcessPoolExecutor`.
+    """
+
+    def __init__(self, form_class, workers=None, chunk_size=100,
+                 max_pending=None, form_kwargs=None, executor=None):
+        if isinstance(form_class, type):
+            form_path = '{0}.{1}'.format(
+                form_class.__module__,
+                getattr(form_class, '__qualname__', form_class.__name__))
+            try:
+                imported = import_string(form_path)
+            except ImportError:
+                imported = None
+            if imported is not form_class:
+                raise ValueError(
+                    '{0!r} can not be imported from {1}.'.format(form_class,
+                                                                 form_path))
+        else:
+            form_path = form_class
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1.')
+        self.form_path = form_path
+        self.workers = workers or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or self.workers * 2
+        self.form_kwargs = form_kwargs
+        self.executor = executor
+
+    def validate_many(self, iterable_of_data):
+        """Validate many payloads.
+
+        :param iterable_of_data: The payloads to validate.
+        :returns: A generator of ``(cleaned_data, errors)`` tuples (as per
+            :py:meth:`FormValidator.validate`), in the same order as the
+            payloads.
+        """
+        executor = self.executor
+        if executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+        pending = deque()
+        try:
+            for chunk in _chunks(iterable_of_data, self.chunk_size):
+                pending.append(executor.submit(
+                    _validate_chunk, self.form_path, self.form_kwargs, chunk))
+                if len(pending) >= self.max_pending:
+                    for result in self._expand(pending.popleft()):
+                        yield result
+            while pending:
+                for result in self._expand(pending.popleft()):
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            if self.executor is None:
+                executor.shutdown(wait=True)
+
+    def _expand(self, future):
+        for cleaned_data, errors in future.result():
+            yield cleaned_data, dict(
+                (name, list(messages))
+                for name, messages in (errors or {}).items())
+
+
+def validate_many(form_class, iterable_of_data, form_kwargs=None,
+                  processes=None, chunk_size=100):
+    """Validate many payloads against a form class, e.g. the rows of a CSV
+    file.
+
+    For example::
+
+        from thecut.forms.validation import validate_many
+
+        for cleaned_data, errors in validate_many(ContactForm, rows):
+            if errors:
+                ...
+
+    By default, payloads are validated in this process with a single
+    :py:class:`FormValidator`. If ``processes`` is given, payloads are
+    validated in chunks in a pool of worker processes instead (see
+    :py:class:`ParallelValidator`). Results are yielded in the same order as
+    the payloads either way.
+
+    :param form_class: The form class.
+    :type form_class: :py:class:`type`
+    :param iterable_of_data: The payloads to validate.
+    :param form_kwargs: Keyword arguments (other than ``data``) for the form.
+    :type form_kwargs: :py:class:`dict`
+    :param processes: The number of worker processes to use.
+    :type processes: :py:class:`int`
+    :param chunk_size: The number of payloads sent to a worker process at a
+        time.
+    :type chunk_size: :py:class:`int`
+    :returns: A generator of ``(cleaned_data, errors)`` tuples, as per
+        :py:meth:`FormValidator.validate`.
+    """
+    if processes is None:
+        validator = FormValidator(form_class, form_kwargs=form_kwargs)
+        for data in iterable_of_data:
+            yield validator.validate(data)
+        return
+    validator = ParallelValidator(form_class, workers=processes,
+                                  chunk_size=chunk_size,
+                                  form_kwargs=form_kwargs)
+    for result in validator.validate_many(iterable_of_data):
+        yield result
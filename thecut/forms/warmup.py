@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.utils.module_loading import import_string
+from thecut.forms.settings import settings
+
+
+# Warm-up of form classes and templates at start up, so that the first
+# request in each process doesn't pay for it. If this is done before a
+# preforking server (e.g. ``gunicorn --preload``) forks, the results are
+# shared between its workers.
+
+
+#: The templates loaded by :py:func:`preload_templates`.
+TEMPLATE_NAMES = ['forms/_form.html', 'forms/_form_fields.html',
+                  'forms/_form_field.html', 'forms/_formset.html',
+                  'forms/_honeypot.html']
+
+#: Form classes registered with :py:func:`register`.
+registry = []
+
+_warmed_up = False
+
+
+def register(form_class):
+    """Register a form class to be warmed up, e.g. as a class decorator::
+
+        from thecut.forms.warmup import register
+
+        @register
+        class ContactForm(FormMixin, forms.Form):
+            ...
+
+    Form classes registered after :py:func:`warm_up` has run (e.g. those
+    defined in modules imported after the app is loaded) are prepared
+    immediately.
+
+    :param form_class: The form class.
+    :type form_class: :py:class:`type`
+    :returns: The form class.
+    """
+    if form_class not in registry:
+        registry.append(form_class)
+        if _warmed_up:
+            prepare_form_class(form_class)
+    return form_class
+
+
+def get_form_classes():
+    """Return the registered form classes, and those listed in the
+    ``THECUT_FORMS_WARM_UP_FORMS`` setting.
+
+    :rtype: :py:class:`list`
+    """
+    form_classes = list(registry)
+    for path in settings.WARM_UP_FORMS:
+        form_class = import_string(path)
+        if form_class not in form_classes:
+            form_classes.append(form_class)
+    return form_classes
+
+
+def prepare_form_class(form_class):
+    """Precompute a form class's decorated fields (and other per-class state,
+    such as its placeholders), as would otherwise be done the first time it
+    is instantiated.
+
+    :param form_class: The form class.
+    :type form_class: :py:class:`type`
+    """
+    if hasattr(form_class, '_prepare_base_fields'):
+        form_class._prepare_base_fields()
+    if hasattr(form_class, '_get_class_timezone_field_names'):
+        form_class._get_class_timezone_field_names()
+
+
+def preload_templates(template_names=None):
+    """Load the thecut-forms templates with each configured template engine,
+    so that they are compiled (and cached, if the engine uses the cached
+    template loader).
+
+    Templates an engine can not load (e.g. ``forms/_honeypot.html`` if
+    django-honeypot is not installed) are skipped.
+
+    :param template_names: The templates to load (defaults to
+        :py:data:`TEMPLATE_NAMES`).
+    :type template_names: :py:class:`list`
+    """
+    for engine in engines.all():
+        for template_name in template_names or TEMPLATE_NAMES:
+            try:
+                engine.get_template(template_name)
+            except (TemplateDoesNotExist, TemplateSyntaxError):
+                pass
+
+
+def warm_up():
+    """Prepare each form class returned by :py:func:`get_form_classes`, and
+    preload the thecut-forms templates.
+
+    This is called when the app is loaded if ``THECUT_FORMS_WARM_UP`` is
+    ``True``, and may also be called directly (e.g. at the end of a
+    ``wsgi.py`` module, once URLconfs and forms have been imported).
+    """
+    global _warmed_up
+    for form_class in get_form_classes():
+        prepare_form_class(form_class)
+    preload_templates()
+    _warmed_up = True
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, unicode_literals
+from django import forms
+from django.forms.renderers import get_default_renderer
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+import django
+from thecut.forms import i18n
+from thecut.forms.settings import settings
+from thecut.forms.cache import LRUCache
+from thecut.forms.renderers import (ATTRS_TEMPLATE_NAME, OPTION_TEMPLATE_NAME,
+                                    are_django_templates, render_attrs,
+                                    render_option, render_value)
+
+
+#: Pre-rendered ``<option>`` elements, keyed on the widget's class, its
+#: choices and the active language.
+option_cache = LRUCache(max_size=lambda: settings.OPTION_CACHE_SIZE)
+
+SELECT_TEMPLATE_NAME = 'django/forms/widgets/select.html'
+
+# As per Select.get_context() (Django < 2.0 renders multiple="multiple").
+_MULTIPLE = True if django.VERSION >= (2, 0) else 'multiple'
+
+_TEMPLATE_NAMES = (SELECT_TEMPLATE_NAME, OPTION_TEMPLATE_NAME,
+                   ATTRS_TEMPLATE_NAME)
+
+
+def _freeze(choices):
+    # A hashable copy of a list of choices (or optgroups).
+    return tuple(
+        (value, tuple(label) if isinstance(label, (list, tuple)) else label)
+        for value, label in choices)
+
+
+class CachedOptionsMixin(object):
+    """A mixin for a :py:class:`~django.forms.Select` widget (or
+    :py:class:`~django.forms.SelectMultiple` widget) which renders its
+    ``<option>`` elements once, rather than on every render.
+
+    The rendered options are cached per widget class, choices and language,
+    and only the ``selected`` attribute of the selected options is changed
+    for each render. The output is identical to that of Django's templates.
+
+    Choices are cached by value, so must be hashable, unless they provide
+    their own ``cache_key`` (as
+    :py:class:`~thecut.forms.fields.CachedModelChoiceIterator` does).
+    Widgets with unhashable choices, or with customised (or overridden)
+    templates, are rendered as usual.
+    """
+
+    def render(self, name, value, attrs=None, renderer=None):
+        output = None
+        if are_django_templates(renderer or get_default_renderer(),
+                                _TEMPLATE_NAMES):
+            output = self._render_cached_options(name, value, attrs)
+        if output is None:
+            return super(CachedOptionsMixin, self).render(
+                name, value, attrs=attrs, renderer=renderer)
+        return mark_safe(output)
+
+    def _get_options_cache_key(self):
+        choices_key = getattr(self.choices, 'cache_key', None)
+        if choices_key is None:
+            choices_key = _freeze(self.choices)
+        key = (type(self), choices_key, get_language(), i18n.version)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _get_rendered_options(self, name):
+        # A list of markup (e.g. <optgroup> tags), and tuples of an option's
+        # value and its markup when not selected and when selected.
+        key = self._get_options_cache_key()
+        if key is None:
+            return None
+        options = option_cache.get(key)
+        if options is None:
+            options = []
+            for group_name, group_choices, group_index in self.optgroups(
+                    name, []):
+                if group_name:
+                    options.append('\n  <optgroup label="{0}">'.format(
+                        render_value(group_name)))
+                for option in group_choices:
+                    selected_option = dict(option, attrs=dict(
+                        option['attrs'], **self.checked_attribute))
+                    rendered = [render_option(option),
+                                render_option(selected_option)]
+                    if None in rendered:
+                        return None
+                    options.append(('{0}'.format(option['value']),) + tuple(
+                        '\n  {0}\n'.format(markup) for markup in rendered))
+                if group_name:
+                    options.append('\n  </optgroup>')
+            option_cache.set(key, options)
+        return options
+
+    def _render_cached_options(self, name, value, attrs):
+        # As per the django/forms/widgets/select.html template.
+        if self.template_name != SELECT_TEMPLATE_NAME or \
+                self.option_template_name != OPTION_TEMPLATE_NAME or \
+                self.option_inherits_attrs:
+            return None
+        # As per Select.get_context(), without building the optgroups.
+        context = forms.Widget.get_context(self, name, value, attrs)['widget']
+        if self.allow_multiple_selected:
+            context['attrs']['multiple'] = _MULTIPLE
+        rendered_attrs = render_attrs(context['attrs'])
+        if rendered_attrs is None:
+            return None
+        options = self._get_rendered_options(name)
+        if options is None:
+            return None
+        output = ['<select name="{0}"{1}>'.format(
+            render_value(context['name']), rendered_attrs)]
+        selected_values = context['value']
+        has_selected = False
+        for option in options:
+            if isinstance(option, tuple):
+                option_value, markup, selected_markup = option
+                if option_value in selected_values and (
+                        not has_selected or self.allow_multiple_selected):
+                    has_selected = True
+                    markup = selected_markup
+                option = markup
+            output.append(option)
+        output.append('\n</select>')
+        return ''.join(output)
+
+
+class CachedSelect(CachedOptionsMixin, forms.Select):
+    """A :py:class:`~django.forms.Select` widget which caches its rendered
+    options (see :py:class:`CachedOptionsMixin`)."""
+
+
+class CachedSelectMultiple(CachedOptionsMixin, forms.SelectMultiple):
+    """A :py:class:`~django.forms.SelectMultiple` widget which caches its
+    rendered options (see :py:class:`CachedOptionsMixin`)."""